@@ -1,19 +1,24 @@
-from .crew_manager import HiringEvaluationCrew
-from .resume_analyzer import ResumeAnalyzerAgent
-from .interview_evaluator import InterviewEvaluatorAgent
-from .scoring_agent import ScoringAgent
-from .cv_gap_analyzer import CVGapAnalyzerAgent
-from .learning_recommender import LearningRecommenderAgent
-from .interactive_interviewer import InteractiveInterviewerAgent
-from .performance_analyzer import PerformanceAnalyzerAgent
+import importlib
 
-__all__ = [
-    'HiringEvaluationCrew',
-    'ResumeAnalyzerAgent',
-    'InterviewEvaluatorAgent',
-    'ScoringAgent',
-    'CVGapAnalyzerAgent',
-    'LearningRecommenderAgent',
-    'InteractiveInterviewerAgent',
-    'PerformanceAnalyzerAgent'
-]
+# Agent modules are imported on first access so a process that uses one agent does not
+# import (and pay start-up for) all of them
+_EXPORTS = {
+    'HiringEvaluationCrew': '.crew_manager',
+    'ResumeAnalyzerAgent': '.resume_analyzer',
+    'InterviewEvaluatorAgent': '.interview_evaluator',
+    'ScoringAgent': '.scoring_agent',
+    'CVGapAnalyzerAgent': '.cv_gap_analyzer',
+    'LearningRecommenderAgent': '.learning_recommender',
+    'InteractiveInterviewerAgent': '.interactive_interviewer',
+    'PerformanceAnalyzerAgent': '.performance_analyzer'
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
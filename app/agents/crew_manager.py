@@ -1,5 +1,6 @@
-from crewai import Crew, Process
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Callable, Iterable, Iterator, Optional, Tuple
+import logging
+import os
 import uuid
 from datetime import datetime
 
@@ -7,6 +8,20 @@ from .resume_analyzer import ResumeAnalyzerAgent
 from .interview_evaluator import InterviewEvaluatorAgent
 from .scoring_agent import ScoringAgent
 from ..models.candidate import Candidate, Resume, InterviewTranscript, EvaluationResult, EvaluationCriteria
+from ..utils.batch_progress import BatchProgress
+from ..utils.stage_pipeline import Stage, StagePipeline
+from ..utils.lazy_components import LazyComponents
+
+logger = logging.getLogger(__name__)
+
+# Candidates in flight at once in evaluate_candidates
+HIRING_BATCH_CONCURRENCY = int(os.getenv("HIRING_BATCH_CONCURRENCY", "16"))
+# Worker threads per evaluation stage (size each to its share of the per-candidate latency)
+HIRING_RESUME_WORKERS = int(os.getenv("HIRING_RESUME_WORKERS", "4"))
+HIRING_INTERVIEW_WORKERS = int(os.getenv("HIRING_INTERVIEW_WORKERS", "4"))
+HIRING_SCORING_WORKERS = int(os.getenv("HIRING_SCORING_WORKERS", "4"))
+
+Application = Tuple[Candidate, Resume, InterviewTranscript]
 
 
 class HiringEvaluationCrew:
@@ -15,13 +30,42 @@ class HiringEvaluationCrew:
     def __init__(self, openai_api_key: str):
         self.openai_api_key = openai_api_key
         
-        # Initialize agents
-        self.resume_analyzer = ResumeAnalyzerAgent(openai_api_key)
-        self.interview_evaluator = InterviewEvaluatorAgent(openai_api_key)
-        self.scoring_agent = ScoringAgent(openai_api_key)
+        # Agents are built on first use and shared by crews with the same API key
+        self._components = LazyComponents({
+            "resume_analyzer": lambda: self._build_agent(ResumeAnalyzerAgent),
+            "interview_evaluator": lambda: self._build_agent(InterviewEvaluatorAgent),
+            "scoring_agent": lambda: self._build_agent(ScoringAgent),
+            "hiring_crew": self._build_crew
+        }, config=(openai_api_key,))
+        self._pipeline: Optional[StagePipeline] = None
+    
+    @property
+    def resume_analyzer(self) -> ResumeAnalyzerAgent:
+        return self._components["resume_analyzer"]
+    
+    @property
+    def interview_evaluator(self) -> InterviewEvaluatorAgent:
+        return self._components["interview_evaluator"]
+    
+    @property
+    def scoring_agent(self) -> ScoringAgent:
+        return self._components["scoring_agent"]
+    
+    @property
+    def crew(self) -> Any:
+        """The crewai Crew of all three agents (evaluation calls the agents directly and never needs it)"""
+        return self._components["hiring_crew"]
+    
+    def _build_agent(self, agent_class: type) -> Any:
+        agent = agent_class(self.openai_api_key)
+        # Build the crewai Agent now, inside the registry's single build, not on the first stage call
+        agent.agent
+        return agent
+    
+    def _build_crew(self) -> Any:
+        from crewai import Crew, Process
         
-        # Create the crew
-        self.crew = Crew(
+        return Crew(
             agents=[
                 self.resume_analyzer.agent,
                 self.interview_evaluator.agent,
@@ -47,40 +91,108 @@ class HiringEvaluationCrew:
         Returns:
             EvaluationResult: Complete evaluation result
         """
+
+        state = {"candidate": candidate, "resume": resume, "interview": interview}
+        return self._scoring_stage(self._interview_stage(self._resume_stage(state)))
+    
+    def evaluate_candidates(self,
+                            applications: Iterable[Application],
+                            max_concurrency: Optional[int] = None,
+                            progress: Optional[BatchProgress] = None,
+                            on_progress: Optional[Callable[[Dict[str, Any]], None]] = None
+                            ) -> Iterator[EvaluationResult]:
+        """
+        Evaluate many candidates concurrently, yielding each result as it finishes
+        
+        Candidates flow through a staged pipeline (resume analysis, interview evaluation,
+        scoring), each stage with its own worker pool (HIRING_<STAGE>_WORKERS), so one
+        candidate's resume analysis overlaps another's interview evaluation and scoring.
+        At most ``max_concurrency`` candidates are in flight; applications are read from
+        the iterable only as capacity frees up, so it may be a lazy stream. A candidate
+        whose evaluation fails is logged and recorded in ``progress`` instead of stopping
+        the batch.
+        
+        Args:
+            applications: (candidate, resume, interview) tuples
+            max_concurrency: Candidates in flight at once (default HIRING_BATCH_CONCURRENCY)
+            progress: Tracker to update; pass one in to read counts, throughput and errors
+            on_progress: Called with a progress snapshot after each candidate finishes
+            
+        Yields:
+            EvaluationResult: In completion order
+        """
+        if progress is None:
+            progress = BatchProgress(total=len(applications) if hasattr(applications, "__len__") else None)
+        
+        def admitted():
+            for candidate, resume, interview in applications:
+                progress.record_submitted()
+                yield {"candidate": candidate, "resume": resume, "interview": interview}
         
-        # Step 1: Analyze resume
-        print("🔍 Analyzing resume...")
-        resume_analysis = self.resume_analyzer.analyze_resume(
-            resume.content, 
+        self._pipeline = StagePipeline([
+            Stage("resume_analysis", self._resume_stage, HIRING_RESUME_WORKERS),
+            Stage("interview_evaluation", self._interview_stage, HIRING_INTERVIEW_WORKERS),
+            Stage("scoring", self._scoring_stage, HIRING_SCORING_WORKERS)
+        ], max_in_flight=max(1, max_concurrency or HIRING_BATCH_CONCURRENCY))
+        
+        for state, result, error in self._pipeline.run(admitted()):
+            candidate = state["candidate"]
+            if error is not None:
+                logger.warning("Evaluation of candidate %s failed: %s", candidate.id, error)
+                progress.record_failed(candidate.id, error)
+            else:
+                progress.record_completed()
+            
+            snapshot = progress.snapshot()
+            logger.info("Hiring batch: %d/%s done, %.1f candidates/min",
+                        snapshot["completed"] + snapshot["failed"], snapshot["total"] or "?",
+                        snapshot["throughput_per_minute"])
+            if on_progress:
+                on_progress(snapshot)
+            if error is None:
+                yield result
+    
+    def get_pipeline_stats(self) -> Optional[Dict[str, Any]]:
+        """Per-stage latency, queue wait and utilization of the most recent batch"""
+        return self._pipeline.get_stats() if self._pipeline else None
+    
+    def _resume_stage(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """Step 1: Analyze resume"""
+        candidate = state["candidate"]
+        logger.info("Analyzing resume for candidate %s", candidate.id)
+        state["resume_analysis"] = self.resume_analyzer.analyze_resume(
+            state["resume"].content,
             candidate.position_applied
         )
-        
-        # Step 2: Evaluate interview
-        print("🎤 Evaluating interview...")
-        resume_summary = resume_analysis.get('structured_data', {}).get('overall_assessment', '')
-        interview_evaluation = self.interview_evaluator.evaluate_interview(
-            interview.content,
+        return state
+    
+    def _interview_stage(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """Step 2: Evaluate interview"""
+        candidate = state["candidate"]
+        logger.info("Evaluating interview for candidate %s", candidate.id)
+        resume_summary = state["resume_analysis"].get('structured_data', {}).get('overall_assessment', '')
+        state["interview_evaluation"] = self.interview_evaluator.evaluate_interview(
+            state["interview"].content,
             candidate.position_applied,
             resume_summary
         )
-        
-        # Step 3: Generate final score and recommendation
-        print("📊 Generating final score and recommendation...")
+        return state
+    
+    def _scoring_stage(self, state: Dict[str, Any]) -> EvaluationResult:
+        """Step 3: Generate final score and recommendation, then build the evaluation result"""
+        candidate = state["candidate"]
+        logger.info("Scoring candidate %s", candidate.id)
         final_scoring = self.scoring_agent.generate_final_score(
-            resume_analysis,
-            interview_evaluation,
+            state["resume_analysis"],
+            state["interview_evaluation"],
             candidate.position_applied
         )
-        
-        # Step 4: Create evaluation result
-        evaluation_result = self._create_evaluation_result(
+        return self._create_evaluation_result(
             candidate,
-            resume_analysis,
-            interview_evaluation,
+            state["resume_analysis"],
+            state["interview_evaluation"],
             final_scoring
         )
-        
-        return evaluation_result
     
     def _create_evaluation_result(self, 
                                  candidate: Candidate,
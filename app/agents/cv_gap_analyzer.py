@@ -1,14 +1,29 @@
-from crewai import Agent, Task, LLM
-from typing import Dict, Any, List
-import json
-import re
+from crewai import Agent
+import os
+from typing import Dict, Any, List, Iterator
+
+from ..utils.agent_executor import get_agent_executor
+from ..utils.llm_clients import AgentTask, get_llm_client_registry
+from ..models.llm_responses import CVGapAnalysisResponse
+from ..utils.circuit_breaker import CircuitOpenError
+from ..utils.llm_runtime import degraded_response, execute_agent_task, parse_structured_output
+from ..utils.prompt_budget import compact_json, token_budget, truncate_to_budget
+from ..utils.llm_scheduler import Priority, estimate_tokens
+from ..utils.skill_extractor import get_skill_extractor, relevant_excerpts
+from ..utils.llm_streaming import stream_agent_events
 
 
 class CVGapAnalyzerAgent:
     """Agent responsible for analyzing CVs and identifying gaps, weaknesses, and areas for improvement"""
     
+    # Gap analysis runs at temperature 0.1, so repeated CVs can be served from cache
+    cache_ttl_seconds = 7 * 24 * 3600
+    
+    # CVs with fewer locally detected skills than this are sent in full
+    MIN_DETECTED_SKILLS = 3
+    
     def __init__(self, google_api_key: str):
-        self.llm = LLM(
+        self.llm = get_llm_client_registry().llm(
             model="gemini-1.5-flash",
             provider="google",
             temperature=0.1,
@@ -28,16 +43,47 @@ class CVGapAnalyzerAgent:
             llm=self.llm
         )
     
-    def create_gap_analysis_task(self, cv_content: str, profession: str) -> Task:
+    def cv_prompt_section(self, cv_content: str) -> str:
+        """
+        The CV part of the gap-analysis prompt
+        
+        Long CVs are pre-tagged locally against the skill taxonomy, so the prompt carries the
+        detected skills, certifications and years plus only the relevant CV lines. Short CVs,
+        and CVs the taxonomy finds little in, are sent as (budgeted) raw text.
+        """
+        excerpt_budget = token_budget("cv_excerpts")
+        if (os.getenv("CV_LOCAL_EXTRACTION_ENABLED", "true").lower() != "false"
+                and estimate_tokens(cv_content) > excerpt_budget):
+            profile = get_skill_extractor().extract(cv_content)
+            if len(profile["skills"]) >= self.MIN_DETECTED_SKILLS:
+                detected = {
+                    "skills": [
+                        {key: value for key, value in skill.items() if value is not None}
+                        for skill in profile["skills"]
+                    ],
+                    "certifications": [cert["name"] for cert in profile["certifications"]],
+                    "total_years_experience": profile["total_years"]
+                }
+                return f"""
+            DETECTED PROFILE (extracted locally from the CV; treat as reliable):
+            {compact_json(detected)}
+            
+            RELEVANT CV EXCERPTS:
+            {relevant_excerpts(cv_content, profile["lines"], excerpt_budget)}
+            """
+        
+        return f"""
+            CV CONTENT:
+            {truncate_to_budget(cv_content, token_budget("cv_text"))}
+            """
+    
+    def create_gap_analysis_task(self, cv_content: str, profession: str) -> AgentTask:
         """Create a task for CV gap analysis"""
-        return Task(
+        return AgentTask(
             description=f"""
             Analyze the following CV for a {profession} professional and identify gaps, weaknesses, 
             and areas for improvement:
-            
-            CV CONTENT:
-            {cv_content}
-            
+            {self.cv_prompt_section(cv_content)}
             Please provide a comprehensive gap analysis including:
             1. Current skill level assessment
             2. Missing technical skills for the profession
@@ -83,53 +129,56 @@ class CVGapAnalyzerAgent:
     
     def extract_structured_data(self, analysis_result: str) -> Dict[str, Any]:
         """Extract structured data from the analysis result"""
-        try:
-            # Try to find JSON in the response
-            json_match = re.search(r'\{.*\}', analysis_result, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
-            else:
-                # Fallback: create basic structure
-                return {
-                    "current_level": "unknown",
-                    "overall_readiness_score": 50,
-                    "technical_skills_gaps": [],
-                    "missing_certifications": [],
-                    "experience_gaps": [],
-                    "soft_skills_gaps": [],
-                    "educational_gaps": [],
-                    "strengths": [],
-                    "priority_improvements": [],
-                    "career_stage_analysis": analysis_result,
-                    "recommendations_summary": "Unable to parse detailed recommendations"
-                }
-        except json.JSONDecodeError:
-            return {
-                "current_level": "unknown",
-                "overall_readiness_score": 50,
-                "technical_skills_gaps": [],
-                "missing_certifications": [],
-                "experience_gaps": [],
-                "soft_skills_gaps": [],
-                "educational_gaps": [],
-                "strengths": [],
-                "priority_improvements": [],
-                "career_stage_analysis": analysis_result,
-                "recommendations_summary": "Unable to parse detailed recommendations"
-            }
+        parsed = parse_structured_output(analysis_result, CVGapAnalysisResponse)
+        if parsed is not None:
+            return parsed.model_dump()
+        
+        # Fallback: create basic structure
+        return {
+            "current_level": "unknown",
+            "overall_readiness_score": 50,
+            "technical_skills_gaps": [],
+            "missing_certifications": [],
+            "experience_gaps": [],
+            "soft_skills_gaps": [],
+            "educational_gaps": [],
+            "strengths": [],
+            "priority_improvements": [],
+            "career_stage_analysis": analysis_result,
+            "recommendations_summary": "Unable to parse detailed recommendations"
+        }
     
     def analyze_cv_gaps(self, cv_content: str, profession: str) -> Dict[str, Any]:
         """Main method to analyze CV gaps"""
         task = self.create_gap_analysis_task(cv_content, profession)
         
-        # Execute the task
-        result = self.agent.execute_task(task)
-        
-        # Extract structured data
-        structured_data = self.extract_structured_data(result)
+        # Execute the task, falling back to an earlier analysis of the same CV while the LLM is down
+        try:
+            result = execute_agent_task(self, task, response_model=CVGapAnalysisResponse, route="analyze_cv_gaps")
+        except CircuitOpenError as e:
+            return degraded_response(e, self._result)
         
+        return self._result(result)
+
+    def _result(self, result: str) -> Dict[str, Any]:
         return {
             "raw_analysis": result,
-            "structured_data": structured_data
+            "structured_data": self.extract_structured_data(result)
         }
 
+    def stream_cv_gaps(self, cv_content: str, profession: str,
+                       priority: Priority = Priority.NORMAL) -> Iterator[Dict[str, Any]]:
+        """Stream the gap analysis as progress events, ending with a ``result`` event"""
+        task = self.create_gap_analysis_task(cv_content, profession)
+        return stream_agent_events(
+            self,
+            task,
+            self._result,
+            CVGapAnalysisResponse,
+            route="analyze_cv_gaps",
+            priority=priority
+        )
+
+    async def aanalyze_cv_gaps(self, cv_content: str, profession: str) -> Dict[str, Any]:
+        """Async variant of analyze_cv_gaps that runs on the shared agent executor"""
+        return await get_agent_executor().run(self.analyze_cv_gaps, cv_content, profession)
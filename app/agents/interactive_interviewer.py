@@ -1,14 +1,37 @@
-from crewai import Agent, Task, LLM
-from typing import Dict, Any, List
-import json
-import re
+from crewai import Agent
+from functools import partial
+from typing import Dict, Any, List, Optional, Type
+
+from ..utils.agent_executor import get_agent_executor
+from ..utils.llm_clients import AgentTask, get_llm_client_registry
+from ..models.llm_responses import (
+    AdaptiveQuestionResponse, AnswerEvaluationResponse, BatchAnswerEvaluationResponse,
+    InterviewQuestionSetResponse, LLMResponse
+)
+from ..utils.circuit_breaker import CircuitOpenError
+from ..utils.degraded_fallbacks import heuristic_answer_evaluation
+from ..utils.llm_runtime import degraded_response, execute_agent_task, mark_degraded, parse_structured_output
+from ..utils.json_extraction import extract_json_object
+from ..utils.prompt_budget import compact_interview_data, compact_json, token_budget, truncate_to_budget
+from ..utils.llm_scheduler import Priority
+from ..utils.llm_hedging import HedgePolicy
 
 
 class InteractiveInterviewerAgent:
     """Agent responsible for conducting interactive interviews based on profession"""
     
+    # Interviewer runs hot (0.7), so keep cached output short-lived
+    cache_ttl_seconds = 15 * 60
+    
+    # Latency SLOs for the calls a candidate waits on; slow calls are hedged past the p95
+    hedge_policies = {
+        "evaluate_answer": HedgePolicy("evaluate_answer", deadline_seconds=30, initial_hedge_delay=8),
+        "generate_interview_questions": HedgePolicy("generate_interview_questions", deadline_seconds=60,
+                                                    initial_hedge_delay=20)
+    }
+    
     def __init__(self, google_api_key: str):
-        self.llm = LLM(
+        self.llm = get_llm_client_registry().llm(
             model="gemini-1.5-flash",
             provider="google",
             temperature=0.7,
@@ -30,18 +53,31 @@ class InteractiveInterviewerAgent:
     
     def generate_interview_questions(self, profession: str, experience_level: str, 
                                     focus_areas: List[str] = None, 
-                                    difficulty: str = "mixed") -> Dict[str, Any]:
-        """Generate interview questions based on profession and experience level"""
+                                    difficulty: str = "mixed",
+                                    exclude_questions: List[str] = None,
+                                    background: bool = False) -> Dict[str, Any]:
+        """
+        Generate interview questions based on profession and experience level
+        
+        ``background`` generations (question bank top-ups) queue behind interactive LLM
+        calls and are never hedged.
+        """
         
         focus_areas_str = ", ".join(focus_areas) if focus_areas else "general professional competencies"
+        exclude_str = ""
+        if exclude_questions:
+            exclude_str = "DO NOT REPEAT THESE PREVIOUSLY ASKED QUESTIONS:\n" + "\n".join(
+                f"- {question}" for question in exclude_questions
+            )
         
-        task = Task(
+        task = AgentTask(
             description=f"""
             Generate a comprehensive set of interview questions for a {experience_level} level 
             {profession} professional.
             
             FOCUS AREAS: {focus_areas_str}
             DIFFICULTY LEVEL: {difficulty}
+            {exclude_str}
             
             Generate 15-20 questions covering:
             1. Technical knowledge questions (40%)
@@ -77,8 +113,17 @@ class InteractiveInterviewerAgent:
             agent=self.agent
         )
         
-        result = self.agent.execute_task(task)
-        return self._extract_json(result)
+        parse = partial(self._extract_json, response_model=InterviewQuestionSetResponse)
+        try:
+            result = execute_agent_task(
+                self, task, Priority.BACKGROUND if background else Priority.NORMAL,
+                InterviewQuestionSetResponse,
+                hedge=None if background else self.hedge_policies.get("generate_interview_questions"),
+                route="generate_interview_questions"
+            )
+        except CircuitOpenError as e:
+            return degraded_response(e, parse)
+        return parse(result)
     
     def evaluate_answer(self, question: Dict[str, Any], answer: str, 
                        profession: str) -> Dict[str, Any]:
@@ -87,7 +132,7 @@ class InteractiveInterviewerAgent:
         question_text = question.get('question', '')
         evaluation_criteria = question.get('evaluation_criteria', [])
         
-        task = Task(
+        task = AgentTask(
             description=f"""
             Evaluate the following answer to an interview question for a {profession} position:
             
@@ -96,7 +141,7 @@ class InteractiveInterviewerAgent:
             EVALUATION CRITERIA: {', '.join(evaluation_criteria)}
             
             CANDIDATE'S ANSWER:
-            {answer}
+            {truncate_to_budget(answer, token_budget("answer"))}
             
             Provide a detailed evaluation in JSON format:
             {{
@@ -118,16 +163,97 @@ class InteractiveInterviewerAgent:
             agent=self.agent
         )
         
-        result = self.agent.execute_task(task)
-        return self._extract_json(result)
+        parse = partial(self._extract_json, response_model=AnswerEvaluationResponse)
+        try:
+            result = execute_agent_task(self, task, Priority.INTERACTIVE, AnswerEvaluationResponse,
+                                        hedge=self.hedge_policies.get("evaluate_answer"), route="evaluate_answer")
+        except CircuitOpenError as e:
+            return degraded_response(e, parse, lambda: heuristic_answer_evaluation(question, answer))
+        return parse(result)
+    
+    def evaluate_answers_batch(self, items: List[Dict[str, Any]], 
+                               profession: str,
+                               priority: Priority = Priority.NORMAL) -> Dict[str, Dict[str, Any]]:
+        """
+        Evaluate several answers in one packed prompt
+        
+        Args:
+            items: Dicts with ``question_id``, ``question`` (question dict) and ``answer``
+            profession: Profession being interviewed for
+            priority: LLM scheduler priority (background flushes should not compete with
+                interactive requests)
+            
+        Returns:
+            Dict mapping question_id to an evaluation with the same shape as evaluate_answer
+        """
+        
+        answers_block = "\n".join(
+            f"""
+            ANSWER ID: {item['question_id']}
+            QUESTION: {item['question'].get('question', '')}
+            EVALUATION CRITERIA: {', '.join(item['question'].get('evaluation_criteria', []))}
+            CANDIDATE'S ANSWER:
+            {truncate_to_budget(item['answer'], token_budget("answer"))}
+            """
+            for item in items
+        )
+        
+        task = AgentTask(
+            description=f"""
+            Evaluate each of the following answers to interview questions for a {profession} position.
+            Evaluate every answer independently.
+            {answers_block}
+            
+            Provide one evaluation per answer in JSON format:
+            {{
+                "evaluations": [
+                    {{
+                        "question_id": "<answer_id>",
+                        "score": <0-10>,
+                        "strengths": ["<strength1>", "<strength2>"],
+                        "weaknesses": ["<weakness1>", "<weakness2>"],
+                        "missing_points": ["<point1>", "<point2>"],
+                        "technical_accuracy": <0-10>,
+                        "clarity_of_explanation": <0-10>,
+                        "depth_of_knowledge": <0-10>,
+                        "practical_application": <0-10>,
+                        "detailed_feedback": "<comprehensive_feedback>",
+                        "improvement_suggestions": ["<suggestion1>", "<suggestion2>"],
+                        "follow_up_needed": <true/false>,
+                        "recommended_follow_up": "<follow_up_question_if_needed>"
+                    }}
+                ]
+            }}
+            """,
+            expected_output="A JSON object with one evaluation per answer",
+            agent=self.agent
+        )
+        
+        try:
+            result = execute_agent_task(self, task, priority, BatchAnswerEvaluationResponse,
+                                        route="evaluate_answers_batch")
+        except CircuitOpenError:
+            return {
+                str(item['question_id']): mark_degraded(heuristic_answer_evaluation(item['question'], item['answer']),
+                                                        "heuristic")
+                for item in items
+            }
+        data = self._extract_json(result, BatchAnswerEvaluationResponse)
+        
+        evaluations = {}
+        for evaluation in data.get('evaluations', []) or []:
+            if isinstance(evaluation, dict) and 'question_id' in evaluation:
+                question_id = str(evaluation.pop('question_id'))
+                evaluations[question_id] = evaluation
+        return evaluations
     
     def generate_adaptive_question(self, previous_answers: List[Dict[str, Any]], 
                                   profession: str, focus_area: str) -> Dict[str, Any]:
         """Generate an adaptive follow-up question based on previous answers"""
         
-        answers_summary = json.dumps(previous_answers[-3:], indent=2) if previous_answers else "No previous answers"
+        answers_summary = compact_json(compact_interview_data({"answers": previous_answers[-3:]}, token_budget("context"))) if previous_answers else "No previous answers"
         
-        task = Task(
+        task = AgentTask(
             description=f"""
             Based on the candidate's previous answers, generate a targeted follow-up question 
             for a {profession} position, focusing on {focus_area}.
@@ -154,17 +280,45 @@ class InteractiveInterviewerAgent:
             agent=self.agent
         )
         
-        result = self.agent.execute_task(task)
-        return self._extract_json(result)
-    
-    def _extract_json(self, text: str) -> Dict[str, Any]:
-        """Extract JSON from text response"""
+        parse = partial(self._extract_json, response_model=AdaptiveQuestionResponse)
         try:
-            json_match = re.search(r'\{.*\}', text, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
-            else:
-                return {"raw_text": text, "error": "No JSON found"}
-        except json.JSONDecodeError:
-            return {"raw_text": text, "error": "Invalid JSON"}
+            result = execute_agent_task(self, task, response_model=AdaptiveQuestionResponse,
+                                        route="generate_adaptive_question")
+        except CircuitOpenError as e:
+            return degraded_response(e, parse)
+        return parse(result)
+    
+    async def agenerate_interview_questions(self, profession: str, experience_level: str,
+                                           focus_areas: List[str] = None,
+                                           difficulty: str = "mixed",
+                                           exclude_questions: List[str] = None) -> Dict[str, Any]:
+        """Async variant of generate_interview_questions that runs on the shared agent executor"""
+        return await get_agent_executor().run(self.generate_interview_questions, profession, experience_level, focus_areas, difficulty, exclude_questions)
+
+    async def aevaluate_answer(self, question: Dict[str, Any], answer: str,
+                              profession: str) -> Dict[str, Any]:
+        """Async variant of evaluate_answer that runs on the shared agent executor"""
+        return await get_agent_executor().run(self.evaluate_answer, question, answer, profession)
+
+    async def aevaluate_answers_batch(self, items: List[Dict[str, Any]], profession: str,
+                                      priority: Priority = Priority.NORMAL) -> Dict[str, Dict[str, Any]]:
+        """Async variant of evaluate_answers_batch that runs on the shared agent executor"""
+        return await get_agent_executor().run(self.evaluate_answers_batch, items, profession, priority)
+
+    async def agenerate_adaptive_question(self, previous_answers: List[Dict[str, Any]],
+                                         profession: str, focus_area: str) -> Dict[str, Any]:
+        """Async variant of generate_adaptive_question that runs on the shared agent executor"""
+        return await get_agent_executor().run(self.generate_adaptive_question, previous_answers, profession, focus_area)
+
+    def _extract_json(self, text: str,
+                      response_model: Optional[Type[LLMResponse]] = None) -> Dict[str, Any]:
+        """Extract JSON from text response, validated against ``response_model`` when given"""
+        if response_model is not None:
+            parsed = parse_structured_output(text, response_model)
+            data = parsed.model_dump() if parsed is not None else None
+        else:
+            data = extract_json_object(text)
+        if data is not None:
+            return data
+        return {"raw_text": text, "error": "Invalid JSON" if "{" in text else "No JSON found"}
 
@@ -1,21 +1,32 @@
-from crewai import Agent, Task
-from langchain_openai import ChatOpenAI
+from functools import cached_property
 from typing import Dict, Any, List
-import json
-import re
+
+from ..utils.json_extraction import extract_json_object
+from ..utils.model_router import get_model_router
 
 
 class InterviewEvaluatorAgent:
     """Agent responsible for evaluating interview transcripts"""
     
     def __init__(self, openai_api_key: str):
-        self.llm = ChatOpenAI(
-            model="gpt-4",
+        # The LLM client and crewai Agent are built on first use
+        self.openai_api_key = openai_api_key
+    
+    @cached_property
+    def llm(self) -> Any:
+        from langchain_openai import ChatOpenAI
+        
+        return ChatOpenAI(
+            model=get_model_router().default_model("interview_evaluation", "openai"),
             temperature=0.1,
-            api_key=openai_api_key
+            api_key=self.openai_api_key
         )
+    
+    @cached_property
+    def agent(self) -> Any:
+        from crewai import Agent
         
-        self.agent = Agent(
+        return Agent(
             role="Senior Interview Evaluator",
             goal="Evaluate interview performance and assess candidate communication, problem-solving, and cultural fit",
             backstory="""You are an expert interview evaluator with extensive experience in 
@@ -27,8 +38,10 @@ class InterviewEvaluatorAgent:
             llm=self.llm
         )
     
-    def create_evaluation_task(self, transcript_content: str, position: str, resume_summary: str = "") -> Task:
+    def create_evaluation_task(self, transcript_content: str, position: str, resume_summary: str = "") -> Any:
         """Create a task for interview evaluation"""
+        from crewai import Task
+        
         return Task(
             description=f"""
             Evaluate the following interview transcript for a {position} position:
@@ -71,43 +84,26 @@ class InterviewEvaluatorAgent:
     
     def extract_structured_data(self, evaluation_result: str) -> Dict[str, Any]:
         """Extract structured data from the evaluation result"""
-        try:
-            # Try to find JSON in the response
-            json_match = re.search(r'\{.*\}', evaluation_result, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
-            else:
-                # Fallback: create basic structure
-                return {
-                    "communication_score": 5,
-                    "problem_solving_score": 5,
-                    "technical_knowledge_score": 5,
-                    "cultural_fit_score": 5,
-                    "leadership_score": 5,
-                    "questions_answered_well": [],
-                    "questions_struggled_with": [],
-                    "key_insights": [],
-                    "red_flags": [],
-                    "strengths_demonstrated": [],
-                    "areas_for_improvement": [],
-                    "overall_assessment": evaluation_result,
-                    "recommendation_notes": ""
-                }
-        except json.JSONDecodeError:
-            return {
-                "communication_score": 5,
-                "problem_solving_score": 5,
-                "technical_knowledge_score": 5,
-                "cultural_fit_score": 5,
-                "leadership_score": 5,
-                "questions_answered_well": [],
-                "questions_struggled_with": [],
-                "red_flags": [],
-                "strengths_demonstrated": [],
-                "areas_for_improvement": [],
-                "overall_assessment": evaluation_result,
-                "recommendation_notes": ""
-            }
+        data = extract_json_object(evaluation_result)
+        if data is not None:
+            return data
+        
+        # Fallback: create basic structure
+        return {
+            "communication_score": 5,
+            "problem_solving_score": 5,
+            "technical_knowledge_score": 5,
+            "cultural_fit_score": 5,
+            "leadership_score": 5,
+            "questions_answered_well": [],
+            "questions_struggled_with": [],
+            "key_insights": [],
+            "red_flags": [],
+            "strengths_demonstrated": [],
+            "areas_for_improvement": [],
+            "overall_assessment": evaluation_result,
+            "recommendation_notes": ""
+        }
     
     def evaluate_interview(self, transcript_content: str, position: str, resume_summary: str = "") -> Dict[str, Any]:
         """Main method to evaluate an interview transcript"""
@@ -1,14 +1,25 @@
-from crewai import Agent, Task, LLM
-from typing import Dict, Any, List, Optional
-import json
-import re
+from crewai import Agent
+import os
+from functools import partial
+from typing import Dict, Any, List, Optional, Type
+
+from ..utils.agent_executor import get_agent_executor
+from ..utils.llm_clients import AgentTask, get_llm_client_registry
+from ..models.llm_responses import JobFitAnalysisResponse, JobRequirementsResponse, LLMResponse
+from ..utils.circuit_breaker import CircuitOpenError
+from ..utils.llm_runtime import degraded_response, execute_agent_task, parse_structured_output
+from ..utils.jd_index import JobRequirementIndex
+from ..utils.json_extraction import extract_json_object
+from ..utils.prompt_budget import compact_json, token_budget, truncate_to_budget
 
 
 class JobMatchAnalyzerAgent:
     """Agent responsible for analyzing job descriptions and matching against user profiles"""
     
+    cache_ttl_seconds = 24 * 3600
+    
     def __init__(self, google_api_key: str):
-        self.llm = LLM(
+        self.llm = get_llm_client_registry().llm(
             model="gemini-1.5-flash",
             provider="google",
             temperature=0.2,
@@ -27,17 +38,28 @@ class JobMatchAnalyzerAgent:
             allow_delegation=False,
             llm=self.llm
         )
+        
+        # Requirements extracted once per posting and shared by every fit analysis against it
+        self.requirement_index = JobRequirementIndex(
+            self.extract_job_requirements,
+            max_entries=int(os.getenv("JD_INDEX_MAX_ENTRIES", "256"))
+        )
     
     def analyze_job_fit(self, job_description: str, cv_data: Optional[Dict[str, Any]] = None,
                        user_profile: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Analyze how well a candidate fits a job description
+
+        Runs in two phases: the posting's requirements come from the requirement index
+        (extracted once per job description), and the fit analysis prompt carries those
+        compact requirements instead of the raw posting text.
         
         Args:
             job_description: The job posting text
             cv_data: Optional CV analysis data from previous analysis
             user_profile: Optional user profile information
         """
+        jd_hash, requirements = self.requirement_index.get(job_description)
         
         # Prepare candidate profile summary
         if cv_data:
@@ -47,9 +69,9 @@ class JobMatchAnalyzerAgent:
             - Current Level: {cv_data.get('current_level', 'Unknown')}
             - Overall Readiness Score: {cv_data.get('overall_readiness_score', 0)}/100
             - Strengths: {', '.join(cv_data.get('strengths', []))}
-            - Technical Skills Gaps: {json.dumps(cv_data.get('technical_skills_gaps', []), indent=2)}
-            - Experience Gaps: {json.dumps(cv_data.get('experience_gaps', []), indent=2)}
-            - Missing Certifications: {json.dumps(cv_data.get('missing_certifications', []), indent=2)}
+            - Technical Skills Gaps: {compact_json(cv_data.get('technical_skills_gaps', []))}
+            - Experience Gaps: {compact_json(cv_data.get('experience_gaps', []))}
+            - Missing Certifications: {compact_json(cv_data.get('missing_certifications', []))}
             """
         elif user_profile:
             candidate_summary = f"""
@@ -61,57 +83,37 @@ class JobMatchAnalyzerAgent:
         else:
             candidate_summary = "CANDIDATE PROFILE: No CV or profile data provided. Analysis will be based solely on job requirements."
         
-        task = Task(
-            description=f"""
-            Analyze the following job description and assess the candidate's fit for this role:
-            
+        structured = "error" not in requirements and not requirements.get("degraded")
+        if structured:
+            job_section = f"""
+            JOB REQUIREMENTS (already extracted from the posting):
+            {compact_json({key: value for key, value in requirements.items() if value})}
+            """
+        else:
+            job_section = f"""
             JOB DESCRIPTION:
-            {job_description}
-            
+            {truncate_to_budget(job_description, token_budget("job_description"))}
+            """
+        
+        task = AgentTask(
+            description=f"""
+            Assess the candidate's fit for the following role:
+            {job_section}
             {candidate_summary}
             
-            Provide a comprehensive job fit analysis including:
-            1. Job role and seniority level identification
-            2. Key required skills and qualifications extracted from job description
-            3. Nice-to-have skills and qualifications
-            4. Candidate eligibility score (0-100)
-            5. Matching skills (what candidate has that job requires)
-            6. Missing critical skills (must-have skills candidate lacks)
-            7. Missing preferred skills (nice-to-have skills candidate lacks)
-            8. Experience level match assessment
-            9. Specific recommendations to improve candidacy
-            10. Estimated preparation time needed
-            11. Overall hiring probability (low/medium/high)
-            12. Detailed rationale for the assessment
+            Provide a job fit analysis including:
+            1. Candidate eligibility score (0-100)
+            2. Matching skills (what candidate has that job requires)
+            3. Missing critical skills (must-have skills candidate lacks)
+            4. Missing preferred skills (nice-to-have skills candidate lacks)
+            5. Experience level match assessment
+            6. Specific recommendations to improve candidacy
+            7. Estimated preparation time needed
+            8. Overall hiring probability (low/medium/high)
+            9. Detailed rationale for the assessment
             
             Format your response as a JSON object:
             {{
-                "job_analysis": {{
-                    "job_title": "<extracted_job_title>",
-                    "company": "<company_name_if_mentioned>",
-                    "seniority_level": "<junior/mid-level/senior/lead/executive>",
-                    "employment_type": "<full-time/part-time/contract>",
-                    "location": "<location_if_mentioned>",
-                    "salary_range": "<salary_if_mentioned>"
-                }},
-                "required_skills": [
-                    {{
-                        "skill": "<skill_name>",
-                        "category": "<technical/soft/domain/tool>",
-                        "importance": "<critical/high/medium>",
-                        "years_required": "<years_if_mentioned>"
-                    }}
-                ],
-                "preferred_skills": [
-                    {{
-                        "skill": "<skill_name>",
-                        "category": "<technical/soft/domain/tool>",
-                        "importance": "<medium/low>"
-                    }}
-                ],
-                "required_qualifications": [
-                    {{"qualification": "<qualification>", "type": "<education/certification/experience>"}}
-                ],
                 "eligibility_assessment": {{
                     "overall_fit_score": <0-100>,
                     "skills_match_percentage": <0-100>,
@@ -174,18 +176,57 @@ class JobMatchAnalyzerAgent:
             agent=self.agent
         )
         
-        result = self.agent.execute_task(task)
-        return self._extract_json(result)
+        def parse(text: str) -> Dict[str, Any]:
+            data = self._extract_json(text, JobFitAnalysisResponse)
+            if structured and "error" not in data:
+                data.update(self._requirement_fields(requirements))
+            data["jd_hash"] = jd_hash
+            return data
+        
+        try:
+            result = execute_agent_task(self, task, response_model=JobFitAnalysisResponse, route="analyze_job_fit")
+        except CircuitOpenError as e:
+            return degraded_response(e, parse)
+        return parse(result)
+    
+    @staticmethod
+    def _requirement_fields(requirements: Dict[str, Any]) -> Dict[str, Any]:
+        """Job-side fields of the fit analysis, filled from the indexed requirements"""
+        experience = requirements.get('experience_required') or {}
+        return {
+            "job_analysis": {
+                "job_title": requirements.get('job_title', ''),
+                "seniority_level": requirements.get('seniority_level', '')
+            },
+            "required_skills": (
+                [{"skill": skill, "category": "technical"} for skill in requirements.get('technical_skills', [])]
+                + [{"skill": tool, "category": "tool"} for tool in requirements.get('tools_and_technologies', [])]
+                + [{"skill": skill, "category": "soft"} for skill in requirements.get('soft_skills', [])]
+            ),
+            "preferred_skills": [{"skill": skill} for skill in requirements.get('preferred_skills', [])],
+            "required_qualifications": (
+                [{"qualification": item, "type": "education"} for item in requirements.get('education_required', [])]
+                + [{"qualification": item, "type": "certification"} for item in requirements.get('certifications', [])]
+                + ([{"qualification": f"{experience['years']} years of experience", "type": "experience"}]
+                   if experience.get('years') else [])
+            )
+        }
+    
+    def job_requirements(self, job_description: str) -> Dict[str, Any]:
+        """Requirements for a posting from the requirement index, with its ``jd_hash``"""
+        jd_hash, requirements = self.requirement_index.get(job_description)
+        requirements["jd_hash"] = jd_hash
+        return requirements
     
     def extract_job_requirements(self, job_description: str) -> Dict[str, Any]:
         """Extract and structure job requirements from a job description"""
         
-        task = Task(
+        task = AgentTask(
             description=f"""
             Extract and structure all requirements from the following job description:
             
             JOB DESCRIPTION:
-            {job_description}
+            {truncate_to_budget(job_description, token_budget("job_description"))}
             
             Extract and organize:
             1. Job title and level
@@ -196,6 +237,7 @@ class JobMatchAnalyzerAgent:
             6. Certifications mentioned
             7. Tools and technologies
             8. Responsibilities and duties
+            9. Nice-to-have (preferred) skills
             
             Format as JSON:
             {{
@@ -210,38 +252,55 @@ class JobMatchAnalyzerAgent:
                 }},
                 "certifications": ["<cert1>", "<cert2>"],
                 "tools_and_technologies": ["<tool1>", "<tool2>"],
-                "key_responsibilities": ["<resp1>", "<resp2>"]
+                "key_responsibilities": ["<resp1>", "<resp2>"],
+                "preferred_skills": ["<nice_to_have1>", "<nice_to_have2>"]
             }}
             """,
             expected_output="Structured JSON of job requirements",
             agent=self.agent
         )
         
-        result = self.agent.execute_task(task)
-        return self._extract_json(result)
-    
-    def _extract_json(self, text: str) -> Dict[str, Any]:
-        """Extract JSON from text response"""
+        parse = partial(self._extract_json, response_model=JobRequirementsResponse)
         try:
-            json_match = re.search(r'\{.*\}', text, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
-            else:
-                return {
-                    "raw_text": text,
-                    "error": "No JSON found in response",
-                    "eligibility_assessment": {
-                        "overall_fit_score": 50,
-                        "hiring_probability": "medium"
-                    }
-                }
-        except json.JSONDecodeError as e:
-            return {
-                "raw_text": text,
-                "error": f"Invalid JSON: {str(e)}",
-                "eligibility_assessment": {
-                    "overall_fit_score": 50,
-                    "hiring_probability": "medium"
-                }
+            result = execute_agent_task(self, task, response_model=JobRequirementsResponse,
+                                        route="extract_job_requirements")
+        except CircuitOpenError as e:
+            return degraded_response(e, parse)
+        return parse(result)
+    
+    async def aanalyze_job_fit(self, job_description: str, cv_data: Optional[Dict[str, Any]] = None,
+                              user_profile: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Async variant of analyze_job_fit that runs on the shared agent executor"""
+        return await get_agent_executor().run(self.analyze_job_fit, job_description, cv_data, user_profile)
+
+    async def aextract_job_requirements(self, job_description: str) -> Dict[str, Any]:
+        """Async variant of extract_job_requirements that runs on the shared agent executor"""
+        return await get_agent_executor().run(self.extract_job_requirements, job_description)
+
+    async def ajob_requirements(self, job_description: str) -> Dict[str, Any]:
+        """Async variant of job_requirements; index hits are answered without the executor"""
+        requirements = self.requirement_index.lookup(JobRequirementIndex.make_key(job_description))
+        if requirements is not None:
+            requirements["jd_hash"] = JobRequirementIndex.make_key(job_description)
+            return requirements
+        return await get_agent_executor().run(self.job_requirements, job_description)
+
+    def _extract_json(self, text: str,
+                      response_model: Optional[Type[LLMResponse]] = None) -> Dict[str, Any]:
+        """Extract JSON from text response, validated against ``response_model`` when given"""
+        if response_model is not None:
+            parsed = parse_structured_output(text, response_model)
+            data = parsed.model_dump() if parsed is not None else None
+        else:
+            data = extract_json_object(text)
+        if data is not None:
+            return data
+        return {
+            "raw_text": text,
+            "error": "Invalid JSON in response" if "{" in text else "No JSON found in response",
+            "eligibility_assessment": {
+                "overall_fit_score": 50,
+                "hiring_probability": "medium"
             }
+        }
 
@@ -1,14 +1,22 @@
-from crewai import Agent, Task, LLM
+from crewai import Agent
 from typing import Dict, Any, List
-import json
-import re
+
+from ..utils.agent_executor import get_agent_executor
+from ..utils.llm_clients import AgentTask, get_llm_client_registry
+from ..models.llm_responses import LearningRecommendationsResponse
+from ..utils.circuit_breaker import CircuitOpenError
+from ..utils.llm_runtime import degraded_response, execute_agent_task, parse_structured_output
+from ..utils.prompt_budget import compact_json
+from ..utils.llm_scheduler import Priority
 
 
 class LearningRecommenderAgent:
     """Agent responsible for recommending specific learning resources, projects, certifications, and courses"""
     
+    cache_ttl_seconds = 24 * 3600
+    
     def __init__(self, google_api_key: str):
-        self.llm = LLM(
+        self.llm = get_llm_client_registry().llm(
             model="gemini-1.5-flash",
             provider="google",
             temperature=0.3,
@@ -29,12 +37,12 @@ class LearningRecommenderAgent:
         )
     
     def create_recommendation_task(self, gap_analysis: Dict[str, Any], profession: str, 
-                                  available_time: str = "flexible") -> Task:
+                                  available_time: str = "flexible") -> AgentTask:
         """Create a task for generating learning recommendations"""
         
-        gaps_summary = json.dumps(gap_analysis, indent=2)
+        gaps_summary = compact_json(gap_analysis)
         
-        return Task(
+        return AgentTask(
             description=f"""
             Based on the following gap analysis for a {profession} professional, recommend specific 
             learning resources, certifications, courses, and projects to address the identified gaps:
@@ -153,50 +161,44 @@ class LearningRecommenderAgent:
     
     def extract_structured_data(self, recommendation_result: str) -> Dict[str, Any]:
         """Extract structured data from the recommendation result"""
-        try:
-            # Try to find JSON in the response
-            json_match = re.search(r'\{.*\}', recommendation_result, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
-            else:
-                # Fallback: create basic structure
-                return {
-                    "certifications": [],
-                    "courses": [],
-                    "projects": [],
-                    "books": [],
-                    "communities": [],
-                    "learning_paths": {},
-                    "budget_breakdown": {},
-                    "quick_wins": [],
-                    "summary": recommendation_result
-                }
-        except json.JSONDecodeError:
-            return {
-                "certifications": [],
-                "courses": [],
-                "projects": [],
-                "books": [],
-                "communities": [],
-                "learning_paths": {},
-                "budget_breakdown": {},
-                "quick_wins": [],
-                "summary": recommendation_result
-            }
+        parsed = parse_structured_output(recommendation_result, LearningRecommendationsResponse)
+        if parsed is not None:
+            return parsed.model_dump()
+        
+        # Fallback: create basic structure
+        return {
+            "certifications": [],
+            "courses": [],
+            "projects": [],
+            "books": [],
+            "communities": [],
+            "learning_paths": {},
+            "budget_breakdown": {},
+            "quick_wins": [],
+            "summary": recommendation_result
+        }
     
     def generate_recommendations(self, gap_analysis: Dict[str, Any], profession: str,
                                 available_time: str = "flexible") -> Dict[str, Any]:
         """Main method to generate learning recommendations"""
         task = self.create_recommendation_task(gap_analysis, profession, available_time)
         
-        # Execute the task
-        result = self.agent.execute_task(task)
-        
-        # Extract structured data
-        structured_data = self.extract_structured_data(result)
+        # Execute the task, falling back to earlier recommendations for the same gaps while the LLM is down
+        try:
+            result = execute_agent_task(self, task, Priority.BACKGROUND, LearningRecommendationsResponse,
+                                        route="generate_recommendations")
+        except CircuitOpenError as e:
+            return degraded_response(e, self._result)
         
+        return self._result(result)
+
+    def _result(self, result: str) -> Dict[str, Any]:
         return {
             "raw_recommendations": result,
-            "structured_data": structured_data
+            "structured_data": self.extract_structured_data(result)
         }
 
+    async def agenerate_recommendations(self, gap_analysis: Dict[str, Any], profession: str,
+                                       available_time: str = "flexible") -> Dict[str, Any]:
+        """Async variant of generate_recommendations that runs on the shared agent executor"""
+        return await get_agent_executor().run(self.generate_recommendations, gap_analysis, profession, available_time)
@@ -1,14 +1,28 @@
-from crewai import Agent, Task, LLM
-from typing import Dict, Any, List
-import json
-import re
+from crewai import Agent
+from functools import partial
+from typing import Dict, Any, List, Iterator, Optional, Type
+
+from ..utils.agent_executor import get_agent_executor
+from ..utils.llm_clients import AgentTask, get_llm_client_registry
+from ..models.llm_responses import (
+    LLMResponse, PracticePlanResponse, RoundFeedbackResponse
+)
+from ..utils.circuit_breaker import CircuitOpenError
+from ..utils.degraded_fallbacks import basic_practice_plan, template_round_feedback
+from ..utils.llm_runtime import degraded_response, execute_agent_task, parse_structured_output
+from ..utils.json_extraction import extract_json_object
+from ..utils.prompt_budget import compact_json
+from ..utils.llm_scheduler import Priority
+from ..utils.llm_streaming import stream_agent_events
 
 
 class PerformanceAnalyzerAgent:
     """Agent responsible for analyzing interview performance and identifying weak areas"""
     
+    cache_ttl_seconds = 24 * 3600
+    
     def __init__(self, google_api_key: str):
-        self.llm = LLM(
+        self.llm = get_llm_client_registry().llm(
             model="gemini-1.5-flash",
             provider="google",
             temperature=0.1,
@@ -28,128 +42,73 @@ class PerformanceAnalyzerAgent:
             llm=self.llm
         )
     
-    def analyze_interview_performance(self, interview_data: Dict[str, Any], 
-                                     profession: str) -> Dict[str, Any]:
-        """Analyze complete interview performance"""
-        
-        interview_summary = json.dumps(interview_data, indent=2)
-        
-        task = Task(
+    def create_round_feedback_task(self, interview_data: Dict[str, Any],
+                                   scores: Dict[str, Any], profession: str) -> AgentTask:
+        """Create a task for the narrative feedback on an already-scored round"""
+
+        answers_summary = compact_json([
+            {
+                "question": (answer.get('question') or {}).get('question', ''),
+                "score": (answer.get('evaluation') or {}).get('score'),
+                "strengths": (answer.get('evaluation') or {}).get('strengths', []),
+                "weaknesses": (answer.get('evaluation') or {}).get('weaknesses', [])
+            }
+            for answer in interview_data.get('answers', [])
+        ])
+        scores_summary = compact_json({
+            key: scores.get(key)
+            for key in ("overall_score", "performance_level", "category_scores", "weak_topics")
+        })
+
+        return AgentTask(
             description=f"""
-            Analyze the complete interview performance for a {profession} position based on the 
-            following interview data:
-            
-            INTERVIEW DATA:
-            {interview_summary}
-            
-            Provide a comprehensive performance analysis including:
-            1. Overall performance score (0-100)
-            2. Category-wise scoring (technical, problem-solving, communication, etc.)
-            3. Detailed strengths and weaknesses
-            4. Specific topics/areas where candidate struggled
-            5. Topics for focused practice before next interview
-            6. Question types that need improvement
-            7. Behavioral patterns observed
-            8. Readiness for next interview level
-            
-            Format your response as a detailed JSON object:
+            Write feedback for round {interview_data.get('round_number')} of a {profession}
+            interview. The round has already been scored; do not re-score it.
+
+            SCORES:
+            {scores_summary}
+
+            ANSWER EVALUATIONS:
+            {answers_summary}
+
+            Format your response as JSON:
             {{
-                "overall_score": <0-100>,
-                "performance_level": "<poor/below_average/average/good/excellent>",
-                "category_scores": {{
-                    "technical_knowledge": <0-100>,
-                    "problem_solving": <0-100>,
-                    "communication": <0-100>,
-                    "analytical_thinking": <0-100>,
-                    "practical_application": <0-100>,
-                    "depth_of_understanding": <0-100>
-                }},
-                "strengths": [
-                    {{
-                        "area": "<area>",
-                        "description": "<description>",
-                        "evidence": "<evidence_from_interview>"
-                    }}
-                ],
-                "weaknesses": [
-                    {{
-                        "area": "<area>",
-                        "severity": "<critical/high/medium/low>",
-                        "description": "<description>",
-                        "evidence": "<evidence_from_interview>",
-                        "impact": "<how_this_affects_overall_performance>"
-                    }}
-                ],
-                "weak_topics": [
-                    {{
-                        "topic": "<topic_name>",
-                        "current_level": "<none/beginner/intermediate/advanced>",
-                        "required_level": "<beginner/intermediate/advanced/expert>",
-                        "priority": "<critical/high/medium/low>",
-                        "practice_recommendations": ["<recommendation1>", "<recommendation2>"]
-                    }}
-                ],
-                "question_type_analysis": {{
-                    "technical": {{"score": <0-100>, "notes": "<notes>"}},
-                    "problem_solving": {{"score": <0-100>, "notes": "<notes>"}},
-                    "behavioral": {{"score": <0-100>, "notes": "<notes>"}},
-                    "situational": {{"score": <0-100>, "notes": "<notes>"}}
-                }},
-                "behavioral_patterns": [
-                    {{
-                        "pattern": "<pattern_description>",
-                        "frequency": "<always/often/sometimes/rarely>",
-                        "impact": "<positive/neutral/negative>",
-                        "suggestions": "<improvement_suggestions>"
-                    }}
-                ],
-                "preparation_plan": {{
-                    "immediate_focus": ["<topic1>", "<topic2>"],
-                    "short_term_goals": ["<goal1>", "<goal2>"],
-                    "practice_exercises": [
-                        {{
-                            "topic": "<topic>",
-                            "exercise": "<exercise_description>",
-                            "estimated_time": "<time>",
-                            "priority": "<critical/high/medium/low>"
-                        }}
-                    ],
-                    "study_resources": [
-                        {{
-                            "topic": "<topic>",
-                            "resource": "<resource_name>",
-                            "type": "<video/article/course/book>",
-                            "link": "<URL_if_available>"
-                        }}
-                    ],
-                    "estimated_preparation_time": "<time_needed>"
-                }},
-                "next_interview_readiness": {{
-                    "ready": <true/false>,
-                    "confidence_level": "<low/medium/high>",
-                    "recommended_wait_time": "<time>",
-                    "areas_to_practice": ["<area1>", "<area2>"],
-                    "expected_improvement": "<percentage>"
-                }},
                 "detailed_feedback": "<comprehensive_feedback>",
                 "motivational_message": "<encouraging_message>"
             }}
             """,
-            expected_output="A comprehensive JSON analysis of interview performance",
+            expected_output="A JSON object with narrative interview feedback",
             agent=self.agent
         )
-        
-        result = self.agent.execute_task(task)
-        return self._parse_analysis(result)
-    
-    def generate_practice_plan(self, weak_areas: List[Dict[str, Any]], 
+
+    def generate_round_feedback(self, interview_data: Dict[str, Any],
+                                scores: Dict[str, Any], profession: str) -> Dict[str, Any]:
+        """Generate narrative feedback for a round scored by RoundScoreAggregator"""
+        task = self.create_round_feedback_task(interview_data, scores, profession)
+        parse = partial(self._extract_json, response_model=RoundFeedbackResponse)
+        try:
+            result = execute_agent_task(self, task, response_model=RoundFeedbackResponse,
+                                        route="generate_round_feedback")
+        except CircuitOpenError as e:
+            return degraded_response(e, parse, lambda: template_round_feedback(scores))
+        return parse(result)
+
+    def stream_round_feedback(self, interview_data: Dict[str, Any],
+                              scores: Dict[str, Any], profession: str,
+                              priority: Priority = Priority.NORMAL) -> Iterator[Dict[str, Any]]:
+        """Stream the narrative round feedback as progress events, ending with a ``result`` event"""
+        task = self.create_round_feedback_task(interview_data, scores, profession)
+        return stream_agent_events(self, task, partial(self._extract_json, response_model=RoundFeedbackResponse),
+                                   RoundFeedbackResponse, route="generate_round_feedback", priority=priority)
+
+    def generate_practice_plan(self, weak_areas: List[Dict[str, Any]],
                               profession: str, 
                               available_time: str = "1 week") -> Dict[str, Any]:
         """Generate a focused practice plan for weak areas"""
         
-        weak_areas_summary = json.dumps(weak_areas, indent=2)
+        weak_areas_summary = compact_json(weak_areas)
         
-        task = Task(
+        task = AgentTask(
             description=f"""
             Create a focused practice plan to address the following weak areas for a {profession} 
             professional. The candidate has {available_time} to prepare.
@@ -215,38 +174,34 @@ class PerformanceAnalyzerAgent:
             agent=self.agent
         )
         
-        result = self.agent.execute_task(task)
-        return self._extract_json(result)
-    
-    def _parse_analysis(self, text: str) -> Dict[str, Any]:
-        """Parse analysis result"""
+        parse = partial(self._extract_json, response_model=PracticePlanResponse)
         try:
-            json_match = re.search(r'\{.*\}', text, re.DOTALL)
-            if json_match:
-                data = json.loads(json_match.group())
-                data['raw_analysis'] = text
-                return data
-            else:
-                return {
-                    "overall_score": 50,
-                    "raw_analysis": text,
-                    "error": "No JSON structure found"
-                }
-        except json.JSONDecodeError:
-            return {
-                "overall_score": 50,
-                "raw_analysis": text,
-                "error": "Invalid JSON"
-            }
+            result = execute_agent_task(self, task, Priority.BACKGROUND, PracticePlanResponse,
+                                        route="generate_practice_plan")
+        except CircuitOpenError as e:
+            return degraded_response(e, parse, lambda: basic_practice_plan(weak_areas, available_time))
+        return parse(result)
     
-    def _extract_json(self, text: str) -> Dict[str, Any]:
-        """Extract JSON from text"""
-        try:
-            json_match = re.search(r'\{.*\}', text, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
-            else:
-                return {"raw_text": text, "error": "No JSON found"}
-        except json.JSONDecodeError:
-            return {"raw_text": text, "error": "Invalid JSON"}
+    async def agenerate_round_feedback(self, interview_data: Dict[str, Any],
+                                      scores: Dict[str, Any], profession: str) -> Dict[str, Any]:
+        """Async variant of generate_round_feedback that runs on the shared agent executor"""
+        return await get_agent_executor().run(self.generate_round_feedback, interview_data, scores, profession)
+
+    async def agenerate_practice_plan(self, weak_areas: List[Dict[str, Any]],
+                                     profession: str,
+                                     available_time: str = "1 week") -> Dict[str, Any]:
+        """Async variant of generate_practice_plan that runs on the shared agent executor"""
+        return await get_agent_executor().run(self.generate_practice_plan, weak_areas, profession, available_time)
+
+    def _extract_json(self, text: str,
+                      response_model: Optional[Type[LLMResponse]] = None) -> Dict[str, Any]:
+        """Extract JSON from text, validated against ``response_model`` when given"""
+        if response_model is not None:
+            parsed = parse_structured_output(text, response_model)
+            data = parsed.model_dump() if parsed is not None else None
+        else:
+            data = extract_json_object(text)
+        if data is not None:
+            return data
+        return {"raw_text": text, "error": "Invalid JSON" if "{" in text else "No JSON found"}
 
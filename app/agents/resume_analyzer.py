@@ -1,21 +1,32 @@
-from crewai import Agent, Task
-from langchain_openai import ChatOpenAI
+from functools import cached_property
 from typing import Dict, Any, List
-import json
-import re
+
+from ..utils.json_extraction import extract_json_object
+from ..utils.model_router import get_model_router
 
 
 class ResumeAnalyzerAgent:
     """Agent responsible for analyzing resumes and extracting key information"""
     
     def __init__(self, openai_api_key: str):
-        self.llm = ChatOpenAI(
-            model="gpt-4",
+        # The LLM client and crewai Agent are built on first use
+        self.openai_api_key = openai_api_key
+    
+    @cached_property
+    def llm(self) -> Any:
+        from langchain_openai import ChatOpenAI
+        
+        return ChatOpenAI(
+            model=get_model_router().default_model("resume_analysis", "openai"),
             temperature=0.1,
-            api_key=openai_api_key
+            api_key=self.openai_api_key
         )
+    
+    @cached_property
+    def agent(self) -> Any:
+        from crewai import Agent
         
-        self.agent = Agent(
+        return Agent(
             role="Senior HR Resume Analyst",
             goal="Analyze resumes thoroughly and extract structured information about candidates",
             backstory="""You are an expert HR professional with 15+ years of experience in 
@@ -27,8 +38,10 @@ class ResumeAnalyzerAgent:
             llm=self.llm
         )
     
-    def create_analysis_task(self, resume_content: str, position: str) -> Task:
+    def create_analysis_task(self, resume_content: str, position: str) -> Any:
         """Create a task for resume analysis"""
+        from crewai import Task
+        
         return Task(
             description=f"""
             Analyze the following resume for a {position} position:
@@ -71,38 +84,23 @@ class ResumeAnalyzerAgent:
     
     def extract_structured_data(self, analysis_result: str) -> Dict[str, Any]:
         """Extract structured data from the analysis result"""
-        try:
-            # Try to find JSON in the response
-            json_match = re.search(r'\{.*\}', analysis_result, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
-            else:
-                # Fallback: create basic structure
-                return {
-                    "experience_years": 0,
-                    "skills": [],
-                    "education": [],
-                    "work_experience": [],
-                    "certifications": [],
-                    "achievements": [],
-                    "red_flags": [],
-                    "overall_assessment": analysis_result,
-                    "strengths": [],
-                    "weaknesses": []
-                }
-        except json.JSONDecodeError:
-            return {
-                "experience_years": 0,
-                "skills": [],
-                "education": [],
-                "work_experience": [],
-                "certifications": [],
-                "achievements": [],
-                "red_flags": [],
-                "overall_assessment": analysis_result,
-                "strengths": [],
-                "weaknesses": []
-            }
+        data = extract_json_object(analysis_result)
+        if data is not None:
+            return data
+        
+        # Fallback: create basic structure
+        return {
+            "experience_years": 0,
+            "skills": [],
+            "education": [],
+            "work_experience": [],
+            "certifications": [],
+            "achievements": [],
+            "red_flags": [],
+            "overall_assessment": analysis_result,
+            "strengths": [],
+            "weaknesses": []
+        }
     
     def analyze_resume(self, resume_content: str, position: str) -> Dict[str, Any]:
         """Main method to analyze a resume"""
@@ -1,21 +1,33 @@
-from crewai import Agent, Task
-from langchain_openai import ChatOpenAI
+from functools import cached_property
 from typing import Dict, Any, List
 import json
-import re
+
+from ..utils.json_extraction import extract_json_object
+from ..utils.model_router import get_model_router
 
 
 class ScoringAgent:
     """Agent responsible for final scoring and recommendation"""
     
     def __init__(self, openai_api_key: str):
-        self.llm = ChatOpenAI(
-            model="gpt-4",
+        # The LLM client and crewai Agent are built on first use
+        self.openai_api_key = openai_api_key
+    
+    @cached_property
+    def llm(self) -> Any:
+        from langchain_openai import ChatOpenAI
+        
+        return ChatOpenAI(
+            model=get_model_router().default_model("final_scoring", "openai"),
             temperature=0.1,
-            api_key=openai_api_key
+            api_key=self.openai_api_key
         )
+    
+    @cached_property
+    def agent(self) -> Any:
+        from crewai import Agent
         
-        self.agent = Agent(
+        return Agent(
             role="Senior Hiring Manager",
             goal="Provide final scoring and hiring recommendation based on comprehensive candidate evaluation",
             backstory="""You are a senior hiring manager with 20+ years of experience in 
@@ -28,8 +40,10 @@ class ScoringAgent:
             llm=self.llm
         )
     
-    def create_scoring_task(self, resume_analysis: Dict[str, Any], interview_evaluation: Dict[str, Any], position: str) -> Task:
+    def create_scoring_task(self, resume_analysis: Dict[str, Any], interview_evaluation: Dict[str, Any], position: str) -> Any:
         """Create a task for final scoring and recommendation"""
+        from crewai import Task
+        
         return Task(
             description=f"""
             Based on the comprehensive evaluation data below, provide a final scoring and hiring recommendation for a {position} position:
@@ -76,50 +90,29 @@ class ScoringAgent:
     
     def extract_structured_data(self, scoring_result: str) -> Dict[str, Any]:
         """Extract structured data from the scoring result"""
-        try:
-            # Try to find JSON in the response
-            json_match = re.search(r'\{.*\}', scoring_result, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
-            else:
-                # Fallback: create basic structure
-                return {
-                    "overall_score": 5,
-                    "detailed_scores": {
-                        "technical_skills": 5,
-                        "communication": 5,
-                        "problem_solving": 5,
-                        "cultural_fit": 5,
-                        "experience_relevance": 5
-                    },
-                    "recommendation": "maybe",
-                    "confidence": 0.5,
-                    "key_strengths": [],
-                    "main_concerns": [],
-                    "detailed_reasoning": scoring_result,
-                    "next_steps": [],
-                    "risk_factors": [],
-                    "opportunity_factors": []
-                }
-        except json.JSONDecodeError:
-            return {
-                "overall_score": 5,
-                "detailed_scores": {
-                    "technical_skills": 5,
-                    "communication": 5,
-                    "problem_solving": 5,
-                    "cultural_fit": 5,
-                    "experience_relevance": 5
-                },
-                "recommendation": "maybe",
-                "confidence": 0.5,
-                "key_strengths": [],
-                "main_concerns": [],
-                "detailed_reasoning": scoring_result,
-                "next_steps": [],
-                "risk_factors": [],
-                "opportunity_factors": []
-            }
+        data = extract_json_object(scoring_result)
+        if data is not None:
+            return data
+        
+        # Fallback: create basic structure
+        return {
+            "overall_score": 5,
+            "detailed_scores": {
+                "technical_skills": 5,
+                "communication": 5,
+                "problem_solving": 5,
+                "cultural_fit": 5,
+                "experience_relevance": 5
+            },
+            "recommendation": "maybe",
+            "confidence": 0.5,
+            "key_strengths": [],
+            "main_concerns": [],
+            "detailed_reasoning": scoring_result,
+            "next_steps": [],
+            "risk_factors": [],
+            "opportunity_factors": []
+        }
     
     def generate_final_score(self, resume_analysis: Dict[str, Any], interview_evaluation: Dict[str, Any], position: str) -> Dict[str, Any]:
         """Main method to generate final score and recommendation"""
@@ -1,12 +1,15 @@
 from fastapi import FastAPI, HTTPException, UploadFile, File, Form
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
 from typing import List, Optional, Dict, Any
+import logging
 import os
 import uuid
 from datetime import datetime, timedelta
 import json
+import math
+from concurrent.futures import ThreadPoolExecutor
 
 from ..agents.cv_gap_analyzer import CVGapAnalyzerAgent
 from ..agents.learning_recommender import LearningRecommenderAgent
@@ -17,7 +20,29 @@ from ..models.session import (
     User, CVAnalysis, InterviewSession, InterviewRound, 
     QuestionAnswer, SessionStatus
 )
+from ..models.job import Job
 from ..utils.file_processor import FileProcessor
+from ..utils.agent_executor import AgentExecutorSaturated, get_agent_executor, get_background_executor
+from ..utils.llm_cache import get_llm_cache
+from ..utils.llm_runtime import get_structured_output_stats
+from ..utils.question_bank import QuestionBank
+from ..utils.round_prefetcher import RoundPrefetcher
+from ..utils.round_scorer import RoundScoreAggregator
+from ..utils.batch_evaluator import DeferredAnswerEvaluator
+from ..utils.llm_streaming import format_sse, stream_on_executor
+from ..utils.job_queue import get_job_queue
+from ..utils.llm_scheduler import Priority, get_llm_scheduler
+from ..utils.llm_hedging import LLMDeadlineExceeded, get_llm_hedger
+from ..utils.model_router import get_model_router
+from ..utils.llm_clients import get_llm_client_registry
+from ..utils.circuit_breaker import CircuitOpenError, get_circuit_breaker
+from ..utils.single_flight import get_single_flight
+from ..utils.job_ranker import candidate_profile, fit_score, rank_jobs_locally
+from ..utils.prompt_budget import get_prompt_meter
+from ..utils.vector_index import get_candidate_index
+from ..utils.lazy_components import LazyComponents, get_component_registry
+
+logger = logging.getLogger(__name__)
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -42,21 +67,38 @@ file_processor = FileProcessor()
 users_db = {}
 cv_analyses_db = {}
 interview_sessions_db = {}
+# Incremental score aggregators of rounds in progress (dropped when a round is completed or
+# superseded; scores are rebuilt from the round's answers if it is scored again)
+round_scores_db = {}
+
+# AI agents (each built on first use)
+agents = None
+question_bank = None
+round_prefetcher = None
+deferred_evaluator = None
+
+EVALUATION_MODES = ("immediate", "deferred")
+
+# "async": round completion returns deterministic scores at once and queues the narrative
+# feedback as a job; "sync": the completion job waits for the feedback
+ROUND_FEEDBACK_MODE = os.getenv("ROUND_FEEDBACK_MODE", "async").lower()
 
-# Initialize agents
-cv_gap_analyzer = None
-learning_recommender = None
-interactive_interviewer = None
-performance_analyzer = None
-job_match_analyzer = None
+# Full LLM fit analyses run at once per ranking job
+JOB_RANK_FIT_CONCURRENCY = int(os.getenv("JOB_RANK_FIT_CONCURRENCY", "4"))
+
+# Keep proxies from buffering Server-Sent Events
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
 
 
 def get_agents():
-    """Get or initialize the AI agents"""
-    global cv_gap_analyzer, learning_recommender, interactive_interviewer, performance_analyzer, job_match_analyzer
+    """Get the AI agents; each agent is constructed the first time it is looked up"""
+    global agents
     
-    if cv_gap_analyzer is None:
+    if agents is None:
         google_api_key = os.getenv("GOOGLE_API_KEY")
+        if not google_api_key and os.getenv("LLM_PROVIDER", "litellm").lower() == "fake":
+            # The offline provider never calls Gemini
+            google_api_key = "fake-key"
         if not google_api_key:
             raise HTTPException(
                 status_code=500, 
@@ -66,21 +108,231 @@ def get_agents():
         # Set environment variable for litellm to use
         os.environ["GEMINI_API_KEY"] = google_api_key
         
-        cv_gap_analyzer = CVGapAnalyzerAgent(google_api_key)
-        learning_recommender = LearningRecommenderAgent(google_api_key)
-        interactive_interviewer = InteractiveInterviewerAgent(google_api_key)
-        performance_analyzer = PerformanceAnalyzerAgent(google_api_key)
-        job_match_analyzer = JobMatchAnalyzerAgent(google_api_key)
+        agents = LazyComponents({
+            'cv_gap_analyzer': lambda: CVGapAnalyzerAgent(google_api_key),
+            'learning_recommender': lambda: LearningRecommenderAgent(google_api_key),
+            'interactive_interviewer': lambda: InteractiveInterviewerAgent(google_api_key),
+            'performance_analyzer': lambda: PerformanceAnalyzerAgent(google_api_key),
+            'job_match_analyzer': lambda: JobMatchAnalyzerAgent(google_api_key)
+        }, config=(google_api_key,))
+    
+    return agents
+
+
+def get_question_bank() -> QuestionBank:
+    """Get or initialize the interview question bank"""
+    global question_bank
     
+    if question_bank is None:
+        agents = get_agents()
+        round_size = int(os.getenv("QUESTION_BANK_ROUND_SIZE", "15"))
+        question_bank = QuestionBank(
+            agents['interactive_interviewer'].generate_interview_questions,
+            round_size=round_size,
+            low_water_mark=int(os.getenv("QUESTION_BANK_LOW_WATER_MARK", str(round_size)))
+        )
+    
+    return question_bank
+
+
+def get_round_prefetcher() -> RoundPrefetcher:
+    """Get or initialize the next-round prefetcher"""
+    global round_prefetcher
+    
+    if round_prefetcher is None:
+        round_prefetcher = RoundPrefetcher(
+            get_question_bank().assemble_round,
+            max_entries=int(os.getenv("ROUND_PREFETCH_MAX_SESSIONS", "256")),
+            restock=get_question_bank().restock
+        )
+    
+    return round_prefetcher
+
+
+def get_deferred_evaluator() -> DeferredAnswerEvaluator:
+    """Get or initialize the deferred answer evaluator"""
+    global deferred_evaluator
+    
+    if deferred_evaluator is None:
+        interviewer = get_agents()['interactive_interviewer']
+        deferred_evaluator = DeferredAnswerEvaluator(
+            interviewer.evaluate_answers_batch,
+            batch_size=int(os.getenv("DEFERRED_EVAL_BATCH_SIZE", "5")),
+            pack_size=int(os.getenv("DEFERRED_EVAL_PACK_SIZE", "10"))
+        )
+    
+    return deferred_evaluator
+
+
+def _final_flush(session: InterviewSession, current_round: InterviewRound):
+    """Evaluate answers still pending from deferred mode and release the round's flush lock"""
+    if deferred_evaluator is not None or DeferredAnswerEvaluator.pending(current_round):
+        get_deferred_evaluator().flush(current_round, session.profession, final=True,
+                                       priority=Priority.INTERACTIVE)
+
+
+PERFECT_ROUND_MESSAGE = "Perfect score! You're ready for the next level interview."
+PRACTICE_ROUND_MESSAGE = "Interview completed. Please review weak areas and practice before the next round."
+
+
+def _build_interview_data(session: InterviewSession, current_round: InterviewRound) -> Dict[str, Any]:
+    """Prepare interview data for performance analysis"""
+    return {
+        "round_number": current_round.round_number,
+        "questions": current_round.questions,
+        "answers": current_round.answers,
+        "profession": session.profession
+    }
+
+
+def _record_round_performance(session: InterviewSession, current_round: InterviewRound,
+                              performance: Dict[str, Any]) -> bool:
+    """
+    Apply a performance analysis to the round, session and user; returns True on a perfect score
+
+    Idempotent per round: recording a completed round again does not recount it in the user's stats.
+    """
+    already_recorded = current_round.status == SessionStatus.COMPLETED
+    round_scores_db.pop(current_round.round_id, None)
+    
+    # Update round
+    current_round.score = performance.get('overall_score', 0)
+    current_round.status = SessionStatus.COMPLETED
+    current_round.completed_at = datetime.now()
+    current_round.feedback = performance.get('detailed_feedback', '')
+    
+    # Update session
+    session.overall_score = performance.get('overall_score', 0)
+    session.best_score = max(session.best_score, current_round.score)
+    session.weak_topics = performance.get('weak_topics', [])
+    session.updated_at = datetime.now()
+    
+    # Update user stats
+    user = users_db[session.user_id]
+    if not already_recorded:
+        user.total_interviews += 1
+        if user.average_score == 0:
+            user.average_score = current_round.score
+        else:
+            user.average_score = (user.average_score + current_round.score) / 2
+        user.updated_at = datetime.now()
+    
+    # Check if score is 100%
+    if current_round.score >= 100:
+        session.is_ready_for_next_round = True
+        session.status = SessionStatus.COMPLETED
+        return True
+    
+    session.is_ready_for_next_round = False
+    return False
+
+
+def _next_round_focus(session: InterviewSession) -> List[str]:
+    """Focus areas for the next round when the user does not pick any"""
+    return [topic.get('topic', '') for topic in session.weak_topics[:3]]
+
+
+def _prefetch_next_round(session: InterviewSession):
+    """Speculatively assemble the next round from the session's weak topics"""
+    if os.getenv("ROUND_PREFETCH_ENABLED", "true").lower() == "false":
+        return
+    get_round_prefetcher().schedule(
+        session.session_id,
+        session.profession,
+        users_db[session.user_id].experience_level,
+        _next_round_focus(session)
+    )
+
+
+def _round_scorer(current_round: InterviewRound) -> RoundScoreAggregator:
+    """Get or create the incremental score aggregator for a round"""
+    scorer = round_scores_db.get(current_round.round_id)
+    if scorer is None:
+        scorer = round_scores_db.setdefault(
+            current_round.round_id, RoundScoreAggregator(len(current_round.questions))
+        )
+    return scorer
+
+
+def _score_round(current_round: InterviewRound) -> Dict[str, Any]:
+    """Deterministic round scores aggregated from the per-answer evaluations"""
+    scorer = _round_scorer(current_round)
+    scorer.add_round(current_round)
+    return scorer.summary()
+
+
+def _apply_round_feedback(current_round: InterviewRound, performance: Dict[str, Any],
+                          feedback: Dict[str, Any]):
+    """Merge narrative feedback into a scored round"""
+    for key in ("detailed_feedback", "motivational_message"):
+        if key in feedback:
+            performance[key] = feedback[key]
+    current_round.feedback = performance.get('detailed_feedback', '')
+
+
+def _round_completion_response(session: InterviewSession, current_round: InterviewRound,
+                               performance: Dict[str, Any], message: str) -> Dict[str, Any]:
+    """Response body for a completed round"""
     return {
-        'cv_gap_analyzer': cv_gap_analyzer,
-        'learning_recommender': learning_recommender,
-        'interactive_interviewer': interactive_interviewer,
-        'performance_analyzer': performance_analyzer,
-        'job_match_analyzer': job_match_analyzer
+        "message": message,
+        "round_score": current_round.score,
+        "overall_score": session.overall_score,
+        "ready_for_next_round": session.is_ready_for_next_round,
+        "performance_analysis": performance,
+        "practice_plan": session.practice_plan if not session.is_ready_for_next_round else None
     }
 
 
+def _store_cv_analysis(user: User, cv_content: str, profession: str,
+                       structured_data: Dict[str, Any]) -> CVAnalysis:
+    """Create and store a CV analysis record from gap analysis output"""
+    analysis_id = str(uuid.uuid4())
+    cv_analysis = CVAnalysis(
+        user_id=user.user_id,
+        analysis_id=analysis_id,
+        cv_content=cv_content,
+        profession=profession,
+        current_level=structured_data.get('current_level', 'unknown'),
+        overall_readiness_score=structured_data.get('overall_readiness_score', 50),
+        technical_skills_gaps=structured_data.get('technical_skills_gaps', []),
+        missing_certifications=structured_data.get('missing_certifications', []),
+        experience_gaps=structured_data.get('experience_gaps', []),
+        soft_skills_gaps=structured_data.get('soft_skills_gaps', []),
+        educational_gaps=structured_data.get('educational_gaps', []),
+        strengths=structured_data.get('strengths', []),
+        priority_improvements=structured_data.get('priority_improvements', [])
+    )
+    
+    # Store analysis
+    cv_analyses_db[analysis_id] = cv_analysis
+    user.cv_analysis_id = analysis_id
+    user.updated_at = datetime.now()
+    
+    # Profile summary first: the ONNX embedder only reads the start of long texts
+    try:
+        get_candidate_index().add(user.user_id, " ".join(
+            [profession, cv_analysis.current_level, *map(str, cv_analysis.strengths), cv_content]
+        ), {"analysis_id": analysis_id})
+    except Exception as e:
+        # Candidate search is best effort; the analysis is already stored
+        logger.warning("Indexing CV analysis %s for candidate search failed: %s", analysis_id, e)
+    return cv_analysis
+
+
+def _job_ref(job: Job) -> Dict[str, Any]:
+    """Job id, status and polling URL"""
+    return {
+        "job_id": job.job_id,
+        "status": job.status.value,
+        "status_url": f"/api/jobs/{job.job_id}"
+    }
+
+
+def _accepted(job: Job) -> JSONResponse:
+    """202 Accepted response pointing at a queued job"""
+    return JSONResponse(status_code=202, content=_job_ref(job))
+
+
 @app.get("/")
 async def root():
     """Root endpoint - serve the frontend"""
@@ -126,13 +378,13 @@ async def get_user(user_id: str):
 
 # ============== CV ANALYSIS & GAP IDENTIFICATION ==============
 
-@app.post("/api/users/{user_id}/cv/upload", response_model=dict)
+@app.post("/api/users/{user_id}/cv/upload", status_code=202)
 async def upload_and_analyze_cv(
     user_id: str,
     file: UploadFile = File(...),
     profession: Optional[str] = Form(None)
 ):
-    """Upload CV and perform gap analysis"""
+    """Upload CV and queue gap analysis; poll /api/jobs/{job_id} for the result"""
     if user_id not in users_db:
         raise HTTPException(status_code=404, detail="User not found")
     
@@ -141,48 +393,71 @@ async def upload_and_analyze_cv(
     # Use provided profession or user's default
     target_profession = profession or user.profession
     
-    try:
-        # Process the uploaded CV
-        cv_content = await file_processor.process_file(file)
-        
-        # Get agents
-        agents = get_agents()
-        
-        # Perform gap analysis
-        gap_analysis = agents['cv_gap_analyzer'].analyze_cv_gaps(cv_content, target_profession)
-        structured_data = gap_analysis.get('structured_data', {})
+    # Process the uploaded CV
+    cv_content = await file_processor.process_file(file)
+    agents = get_agents()
+    
+    def run_cv_analysis() -> Dict[str, Any]:
+        try:
+            gap_analysis = agents['cv_gap_analyzer'].analyze_cv_gaps(cv_content, target_profession)
+        except CircuitOpenError:
+            raise
+        except Exception as e:
+            raise RuntimeError(f"CV analysis failed: {str(e)}") from e
         
-        # Create CV analysis record
-        analysis_id = str(uuid.uuid4())
-        cv_analysis = CVAnalysis(
-            user_id=user_id,
-            analysis_id=analysis_id,
-            cv_content=cv_content,
-            profession=target_profession,
-            current_level=structured_data.get('current_level', 'unknown'),
-            overall_readiness_score=structured_data.get('overall_readiness_score', 50),
-            technical_skills_gaps=structured_data.get('technical_skills_gaps', []),
-            missing_certifications=structured_data.get('missing_certifications', []),
-            experience_gaps=structured_data.get('experience_gaps', []),
-            soft_skills_gaps=structured_data.get('soft_skills_gaps', []),
-            educational_gaps=structured_data.get('educational_gaps', []),
-            strengths=structured_data.get('strengths', []),
-            priority_improvements=structured_data.get('priority_improvements', [])
+        # Create and store CV analysis record
+        cv_analysis = _store_cv_analysis(
+            user, cv_content, target_profession, gap_analysis.get('structured_data', {})
         )
-        
-        # Store analysis
-        cv_analyses_db[analysis_id] = cv_analysis
-        user.cv_analysis_id = analysis_id
-        user.updated_at = datetime.now()
-        
         return {
-            "analysis_id": analysis_id,
+            "analysis_id": cv_analysis.analysis_id,
             "message": "CV analyzed successfully",
             "analysis": cv_analysis.dict()
         }
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"CV analysis failed: {str(e)}")
+    
+    return _accepted(get_job_queue().submit("cv_analysis", run_cv_analysis))
+
+
+@app.post("/api/users/{user_id}/cv/upload/stream")
+async def upload_and_analyze_cv_stream(
+    user_id: str,
+    file: UploadFile = File(...),
+    profession: Optional[str] = Form(None)
+):
+    """Upload CV and stream gap analysis progress as Server-Sent Events"""
+    if user_id not in users_db:
+        raise HTTPException(status_code=404, detail="User not found")
+    
+    user = users_db[user_id]
+    target_profession = profession or user.profession
+    
+    cv_content = await file_processor.process_file(file)
+    agents = get_agents()
+    
+    def events():
+        yield format_sse("extraction_done", {"characters": len(cv_content)})
+        try:
+            for event in agents['cv_gap_analyzer'].stream_cv_gaps(cv_content, target_profession):
+                if event["event"] != "result":
+                    yield format_sse(event["event"], event["data"])
+                    continue
+                
+                cv_analysis = _store_cv_analysis(
+                    user, cv_content, target_profession, event["data"].get('structured_data', {})
+                )
+                yield format_sse("complete", {
+                    "analysis_id": cv_analysis.analysis_id,
+                    "message": "CV analyzed successfully",
+                    "analysis": cv_analysis.dict()
+                })
+        except Exception as e:
+            yield format_sse("error", {"detail": f"CV analysis failed: {str(e)}"})
+    
+    try:
+        body = stream_on_executor(events())
+    except AgentExecutorSaturated as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    return StreamingResponse(body, media_type="text/event-stream", headers=SSE_HEADERS)
 
 
 @app.get("/api/cv-analysis/{analysis_id}", response_model=dict)
@@ -195,20 +470,19 @@ async def get_cv_analysis(analysis_id: str):
 
 # ============== LEARNING RECOMMENDATIONS ==============
 
-@app.post("/api/cv-analysis/{analysis_id}/recommendations", response_model=dict)
+@app.post("/api/cv-analysis/{analysis_id}/recommendations", status_code=202)
 async def generate_learning_recommendations(
     analysis_id: str,
     available_time: str = Form(default="flexible")
 ):
-    """Generate personalized learning recommendations based on CV analysis"""
+    """Queue personalized learning recommendations based on CV analysis; poll /api/jobs/{job_id} for the result"""
     if analysis_id not in cv_analyses_db:
         raise HTTPException(status_code=404, detail="CV analysis not found")
     
     cv_analysis = cv_analyses_db[analysis_id]
+    agents = get_agents()
     
-    try:
-        agents = get_agents()
-        
+    def run_recommendations() -> Dict[str, Any]:
         # Prepare gap analysis data
         gap_data = {
             "technical_skills_gaps": cv_analysis.technical_skills_gaps,
@@ -219,12 +493,16 @@ async def generate_learning_recommendations(
             "priority_improvements": cv_analysis.priority_improvements
         }
         
-        # Generate recommendations
-        recommendations = agents['learning_recommender'].generate_recommendations(
-            gap_data, 
-            cv_analysis.profession,
-            available_time
-        )
+        try:
+            recommendations = agents['learning_recommender'].generate_recommendations(
+                gap_data, 
+                cv_analysis.profession,
+                available_time
+            )
+        except CircuitOpenError:
+            raise
+        except Exception as e:
+            raise RuntimeError(f"Recommendation generation failed: {str(e)}") from e
         
         # Store recommendations with the CV analysis
         cv_analysis.recommendations = recommendations.get('structured_data', {})
@@ -235,68 +513,188 @@ async def generate_learning_recommendations(
             "message": "Learning recommendations generated successfully",
             "recommendations": recommendations.get('structured_data', {})
         }
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Recommendation generation failed: {str(e)}")
+    
+    return _accepted(get_job_queue().submit("recommendations", run_recommendations, retry=True))
 
 
 # ============== JOB FIT ANALYSIS ==============
 
-@app.post("/api/users/{user_id}/job-fit/analyze", response_model=dict)
+@app.post("/api/users/{user_id}/job-fit/analyze", status_code=202)
 async def analyze_job_fit(
     user_id: str,
     job_description: str = Form(...)
 ):
-    """Analyze how well a user fits a specific job description"""
+    """Queue analysis of how well a user fits a job description; poll /api/jobs/{job_id} for the result"""
     if user_id not in users_db:
         raise HTTPException(status_code=404, detail="User not found")
     
     user = users_db[user_id]
+    agents = get_agents()
     
-    try:
-        agents = get_agents()
-        
-        # Get CV analysis data if available
-        cv_data = None
-        if user.cv_analysis_id and user.cv_analysis_id in cv_analyses_db:
-            cv_analysis = cv_analyses_db[user.cv_analysis_id]
-            cv_data = {
-                'profession': cv_analysis.profession,
-                'current_level': cv_analysis.current_level,
-                'overall_readiness_score': cv_analysis.overall_readiness_score,
-                'strengths': cv_analysis.strengths,
-                'technical_skills_gaps': cv_analysis.technical_skills_gaps,
-                'experience_gaps': cv_analysis.experience_gaps,
-                'missing_certifications': cv_analysis.missing_certifications
-            }
-        
-        # Prepare user profile
-        user_profile = {
-            'name': user.name,
-            'profession': user.profession,
-            'experience_level': user.experience_level
+    # Get CV analysis data if available
+    cv_data = None
+    if user.cv_analysis_id and user.cv_analysis_id in cv_analyses_db:
+        cv_analysis = cv_analyses_db[user.cv_analysis_id]
+        cv_data = {
+            'profession': cv_analysis.profession,
+            'current_level': cv_analysis.current_level,
+            'overall_readiness_score': cv_analysis.overall_readiness_score,
+            'strengths': cv_analysis.strengths,
+            'technical_skills_gaps': cv_analysis.technical_skills_gaps,
+            'experience_gaps': cv_analysis.experience_gaps,
+            'missing_certifications': cv_analysis.missing_certifications
         }
-        
-        # Perform job fit analysis
-        job_fit_result = agents['job_match_analyzer'].analyze_job_fit(
-            job_description=job_description,
-            cv_data=cv_data,
-            user_profile=user_profile
-        )
-        
-        # Store the analysis result
-        analysis_id = str(uuid.uuid4())
+    
+    # Prepare user profile
+    user_profile = {
+        'name': user.name,
+        'profession': user.profession,
+        'experience_level': user.experience_level
+    }
+    
+    def run_job_fit() -> Dict[str, Any]:
+        try:
+            job_fit_result = agents['job_match_analyzer'].analyze_job_fit(
+                job_description=job_description,
+                cv_data=cv_data,
+                user_profile=user_profile
+            )
+        except CircuitOpenError:
+            raise
+        except Exception as e:
+            raise RuntimeError(f"Job fit analysis failed: {str(e)}") from e
         
         return {
-            "analysis_id": analysis_id,
+            "analysis_id": str(uuid.uuid4()),
             "user_id": user_id,
             "message": "Job fit analysis completed successfully",
             "analysis": job_fit_result,
             "timestamp": datetime.now().isoformat()
         }
+    
+    return _accepted(get_job_queue().submit("job_fit", run_job_fit, retry=True))
+
+
+@app.post("/api/users/{user_id}/job-fit/rank", status_code=202)
+async def rank_job_fits(
+    user_id: str,
+    job_descriptions: List[str] = Form(...),
+    top_k: int = Form(5)
+):
+    """
+    Queue ranking of many job descriptions for a user; poll /api/jobs/{job_id} for the result
+
+    Every posting is scored locally (BM25 similarity and skill coverage against the user's
+    CV analysis); only the top ``top_k`` get a full LLM fit analysis, run concurrently.
+    """
+    if user_id not in users_db:
+        raise HTTPException(status_code=404, detail="User not found")
+    job_descriptions = [jd for jd in job_descriptions if jd.strip()]
+    if not job_descriptions:
+        raise HTTPException(status_code=400, detail="No job descriptions provided")
+    if top_k < 0:
+        raise HTTPException(status_code=400, detail="top_k must not be negative")
+    
+    user = users_db[user_id]
+    agents = get_agents()
+    cv_analysis = cv_analyses_db.get(user.cv_analysis_id) if user.cv_analysis_id else None
+    cv_data = None
+    if cv_analysis:
+        cv_data = {
+            'profession': cv_analysis.profession,
+            'current_level': cv_analysis.current_level,
+            'overall_readiness_score': cv_analysis.overall_readiness_score,
+            'strengths': cv_analysis.strengths,
+            'technical_skills_gaps': cv_analysis.technical_skills_gaps,
+            'experience_gaps': cv_analysis.experience_gaps,
+            'missing_certifications': cv_analysis.missing_certifications
+        }
+    user_profile = {
+        'name': user.name,
+        'profession': user.profession,
+        'experience_level': user.experience_level
+    }
+    
+    def run_ranking() -> Dict[str, Any]:
+        ranked = rank_jobs_locally(candidate_profile(cv_analysis, user), job_descriptions)
+        shortlisted = ranked[:top_k]
         
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Job fit analysis failed: {str(e)}")
+        # The LLM governor caps actual provider concurrency; this only bounds the fan-out
+        workers = max(1, min(len(shortlisted), JOB_RANK_FIT_CONCURRENCY))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="job-rank") as pool:
+            futures = [
+                pool.submit(agents['job_match_analyzer'].analyze_job_fit,
+                            job_descriptions[entry["index"]], cv_data, user_profile)
+                for entry in shortlisted
+            ]
+            for entry, future in zip(shortlisted, futures):
+                try:
+                    entry["analysis"] = future.result()
+                except CircuitOpenError:
+                    raise
+                except Exception as e:
+                    entry["analysis_error"] = str(e)
+                entry["fit_score"] = fit_score(entry.get("analysis"))
+        
+        # Analyzed postings rank by LLM fit score, the rest keep their local order below them
+        shortlisted.sort(key=lambda entry: (entry["fit_score"] is not None, entry["fit_score"] or 0,
+                                            entry["local_score"]), reverse=True)
+        results = [
+            {**entry, "rank": rank, "job_description": job_descriptions[entry["index"]][:200]}
+            for rank, entry in enumerate(shortlisted + ranked[top_k:], start=1)
+        ]
+        return {
+            "user_id": user_id,
+            "message": "Job ranking completed successfully",
+            "total_jobs": len(job_descriptions),
+            "analyzed_jobs": len(shortlisted),
+            "ranking": results,
+            "timestamp": datetime.now().isoformat()
+        }
+    
+    return _accepted(get_job_queue().submit("job_rank", run_ranking, retry=True))
+
+
+@app.post("/api/candidates/search", response_model=dict)
+async def search_candidates(
+    job_description: str = Form(...),
+    top_n: int = Form(10)
+):
+    """
+    Users whose latest CV best matches a job description
+    
+    Answered from the local embedding index of analyzed CVs, without any LLM call.
+    """
+    if not job_description.strip():
+        raise HTTPException(status_code=400, detail="No job description provided")
+    if top_n < 1:
+        raise HTTPException(status_code=400, detail="top_n must be positive")
+    
+    # Embedding the query is CPU-bound (and may load the model), so it runs on the executor
+    try:
+        matches = await get_agent_executor().run(get_candidate_index().search, job_description, top_n)
+    except AgentExecutorSaturated as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    
+    candidates = []
+    for match in matches:
+        user = users_db.get(match["user_id"])
+        cv_analysis = cv_analyses_db.get(match["analysis_id"])
+        if user is None or cv_analysis is None:
+            continue
+        candidates.append({
+            **match,
+            "name": user.name,
+            "profession": cv_analysis.profession,
+            "current_level": cv_analysis.current_level,
+            "overall_readiness_score": cv_analysis.overall_readiness_score
+        })
+    
+    return {
+        "total_candidates": len(get_candidate_index().index),
+        "candidates": candidates,
+        "timestamp": datetime.now().isoformat()
+    }
 
 
 @app.post("/api/job-fit/extract-requirements", response_model=dict)
@@ -307,8 +705,8 @@ async def extract_job_requirements(
     try:
         agents = get_agents()
         
-        # Extract job requirements
-        requirements = agents['job_match_analyzer'].extract_job_requirements(job_description)
+        # Requirements are extracted once per posting and served from the requirement index after that
+        requirements = await agents['job_match_analyzer'].ajob_requirements(job_description)
         
         return {
             "message": "Job requirements extracted successfully",
@@ -316,6 +714,10 @@ async def extract_job_requirements(
             "timestamp": datetime.now().isoformat()
         }
         
+    except AgentExecutorSaturated as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except CircuitOpenError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(math.ceil(e.retry_after))})
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Requirements extraction failed: {str(e)}")
 
@@ -326,12 +728,19 @@ async def extract_job_requirements(
 async def start_interview_session(
     user_id: str,
     profession: Optional[str] = Form(None),
-    focus_areas: Optional[str] = Form(None)
+    focus_areas: Optional[str] = Form(None),
+    evaluation_mode: str = Form(default="immediate")
 ):
     """Start a new interview session"""
     if user_id not in users_db:
         raise HTTPException(status_code=404, detail="User not found")
     
+    if evaluation_mode not in EVALUATION_MODES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid evaluation_mode: {evaluation_mode}. Supported modes: {list(EVALUATION_MODES)}"
+        )
+    
     user = users_db[user_id]
     target_profession = profession or user.profession
     
@@ -344,6 +753,7 @@ async def start_interview_session(
         session_id=session_id,
         user_id=user_id,
         profession=target_profession,
+        evaluation_mode=evaluation_mode,
         status=SessionStatus.IN_PROGRESS
     )
     
@@ -352,6 +762,12 @@ async def start_interview_session(
     user.current_session_id = session_id
     user.updated_at = datetime.now()
     
+    # Stock the question bank for the first round while the user gets ready
+    try:
+        get_question_bank().warm(target_profession, user.experience_level, focus_list or None)
+    except HTTPException:
+        pass
+    
     return {
         "session_id": session_id,
         "message": "Interview session started",
@@ -375,18 +791,20 @@ async def start_interview_round(
     if focus_areas:
         focus_list = [area.strip() for area in focus_areas.split(',')]
     else:
-        focus_list = [topic.get('topic', '') for topic in session.weak_topics[:3]]
+        focus_list = _next_round_focus(session)
     
     try:
-        agents = get_agents()
+        # Use the round prepared after the previous completion if the settings still match
+        questions_data = await get_round_prefetcher().atake(session_id, focus_list, difficulty)
         
-        # Generate interview questions
-        questions_data = agents['interactive_interviewer'].generate_interview_questions(
-            session.profession,
-            users_db[session.user_id].experience_level,
-            focus_list if focus_list else None,
-            difficulty
-        )
+        # Otherwise assemble questions from the bank (live generation only on a cold miss)
+        if questions_data is None:
+            questions_data = await get_question_bank().aassemble_round(
+                session.profession,
+                users_db[session.user_id].experience_level,
+                focus_list if focus_list else None,
+                difficulty
+            )
         
         # Create new round
         round_id = str(uuid.uuid4())
@@ -400,7 +818,9 @@ async def start_interview_round(
             started_at=datetime.now()
         )
         
-        # Update session
+        # Update session (earlier rounds are over, so their score aggregators go)
+        for previous_round in session.rounds:
+            round_scores_db.pop(previous_round.round_id, None)
         session.rounds.append(interview_round)
         session.current_round = round_number
         session.total_rounds = len(session.rounds)
@@ -411,9 +831,17 @@ async def start_interview_round(
             "round_number": round_number,
             "message": "Interview round started",
             "questions": questions_data.get('questions', []),
-            "interview_structure": questions_data.get('interview_structure', {})
+            "interview_structure": questions_data.get('interview_structure', {}),
+            "question_source": questions_data.get('source', 'live'),
+            "degraded": questions_data.get('degraded', False)
         }
         
+    except AgentExecutorSaturated as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except CircuitOpenError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(math.ceil(e.retry_after))})
+    except LLMDeadlineExceeded as e:
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to start interview round: {str(e)}")
 
@@ -452,10 +880,30 @@ async def submit_answer(
         raise HTTPException(status_code=404, detail="Question not found")
     
     try:
+        if session.evaluation_mode == "deferred":
+            # Store now; evaluated in packed batches at the threshold or on round completion
+            current_round.answers.append({
+                "question_id": question_id,
+                "question": question,
+                "answer": answer,
+                "evaluation": None,
+                "timestamp": datetime.now().isoformat()
+            })
+            session.updated_at = datetime.now()
+            get_deferred_evaluator().maybe_schedule_flush(current_round, session.profession)
+            
+            return {
+                "message": "Answer submitted; evaluation deferred",
+                "evaluation": None,
+                "evaluation_pending": True,
+                "answered_count": len(current_round.answers),
+                "total_questions": len(current_round.questions)
+            }
+        
         agents = get_agents()
         
         # Evaluate the answer
-        evaluation = agents['interactive_interviewer'].evaluate_answer(
+        evaluation = await agents['interactive_interviewer'].aevaluate_answer(
             question, 
             answer, 
             session.profession
@@ -471,6 +919,7 @@ async def submit_answer(
         }
         
         current_round.answers.append(answer_data)
+        _round_scorer(current_round).add(question_id, question, evaluation)
         session.updated_at = datetime.now()
         
         return {
@@ -480,13 +929,26 @@ async def submit_answer(
             "total_questions": len(current_round.questions)
         }
         
+    except AgentExecutorSaturated as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except CircuitOpenError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(math.ceil(e.retry_after))})
+    except LLMDeadlineExceeded as e:
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to evaluate answer: {str(e)}")
 
 
-@app.post("/api/interview-session/{session_id}/round/{round_id}/complete", response_model=dict)
+@app.post("/api/interview-session/{session_id}/round/{round_id}/complete", status_code=202)
 async def complete_interview_round(session_id: str, round_id: str):
-    """Complete an interview round and analyze performance"""
+    """
+    Complete an interview round
+    
+    Scores are aggregated from the per-answer evaluations, so when every answer is already
+    evaluated the final scores are returned at once (200) and the narrative feedback and
+    practice plan are queued as ``feedback_job``. Otherwise (pending deferred answers, or
+    ROUND_FEEDBACK_MODE=sync) the completion is queued; poll /api/jobs/{job_id} for the result.
+    """
     if session_id not in interview_sessions_db:
         raise HTTPException(status_code=404, detail="Interview session not found")
     
@@ -502,71 +964,146 @@ async def complete_interview_round(session_id: str, round_id: str):
     if not current_round:
         raise HTTPException(status_code=404, detail="Interview round not found")
     
-    try:
-        agents = get_agents()
-        
-        # Prepare interview data for analysis
-        interview_data = {
-            "round_number": current_round.round_number,
-            "questions": current_round.questions,
-            "answers": current_round.answers,
-            "profession": session.profession
-        }
-        
-        # Analyze performance
-        performance = agents['performance_analyzer'].analyze_interview_performance(
-            interview_data,
-            session.profession
-        )
-        
-        # Update round
-        current_round.score = performance.get('overall_score', 0)
-        current_round.status = SessionStatus.COMPLETED
-        current_round.completed_at = datetime.now()
-        current_round.feedback = performance.get('detailed_feedback', '')
-        
-        # Update session
-        session.overall_score = performance.get('overall_score', 0)
-        session.best_score = max(session.best_score, current_round.score)
-        session.weak_topics = performance.get('weak_topics', [])
-        session.updated_at = datetime.now()
-        
-        # Check if score is 100%
-        if current_round.score >= 100:
-            session.is_ready_for_next_round = True
-            session.status = SessionStatus.COMPLETED
-            message = "Perfect score! You're ready for the next level interview."
+    agents = get_agents()
+    
+    def record_scores(performance: Dict[str, Any]) -> str:
+        if _record_round_performance(session, current_round, performance):
+            message = PERFECT_ROUND_MESSAGE
         else:
-            session.is_ready_for_next_round = False
-            # Generate practice plan
-            practice_plan = agents['performance_analyzer'].generate_practice_plan(
-                performance.get('weak_topics', []),
-                session.profession,
-                "1 week"
+            message = PRACTICE_ROUND_MESSAGE
+        _prefetch_next_round(session)
+        return message
+    
+    def run_round_feedback(performance: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            feedback = agents['performance_analyzer'].generate_round_feedback(
+                _build_interview_data(session, current_round),
+                performance,
+                session.profession
             )
-            session.practice_plan = practice_plan
-            message = "Interview completed. Please review weak areas and practice before the next round."
-        
-        # Update user stats
-        user = users_db[session.user_id]
-        user.total_interviews += 1
-        if user.average_score == 0:
-            user.average_score = current_round.score
-        else:
-            user.average_score = (user.average_score + current_round.score) / 2
-        user.updated_at = datetime.now()
+            _apply_round_feedback(current_round, performance, feedback)
+            
+            if not session.is_ready_for_next_round:
+                # Generate practice plan
+                session.practice_plan = agents['performance_analyzer'].generate_practice_plan(
+                    performance.get('weak_topics', []),
+                    session.profession,
+                    "1 week"
+                )
+        except CircuitOpenError:
+            raise
+        except Exception as e:
+            raise RuntimeError(f"Failed to generate round feedback: {str(e)}") from e
         
         return {
-            "message": message,
-            "round_score": current_round.score,
-            "overall_score": session.overall_score,
-            "ready_for_next_round": session.is_ready_for_next_round,
             "performance_analysis": performance,
             "practice_plan": session.practice_plan if not session.is_ready_for_next_round else None
         }
+    
+    if ROUND_FEEDBACK_MODE == "async" and not DeferredAnswerEvaluator.pending(current_round):
+        _final_flush(session, current_round)
+        performance = _score_round(current_round)
+        session.practice_plan = None
+        message = record_scores(performance)
+        feedback_job = get_job_queue().submit("round_feedback", run_round_feedback, performance, retry=True)
         
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to complete round: {str(e)}")
+        response = _round_completion_response(session, current_round, performance, message)
+        response["feedback_job"] = _job_ref(feedback_job)
+        # Final scores: 200, with the feedback and practice plan following as ``feedback_job``
+        return JSONResponse(status_code=200, content=response)
+    
+    def run_round_completion() -> Dict[str, Any]:
+        try:
+            _final_flush(session, current_round)
+            
+            performance = _score_round(current_round)
+            feedback = agents['performance_analyzer'].generate_round_feedback(
+                _build_interview_data(session, current_round),
+                performance,
+                session.profession
+            )
+            _apply_round_feedback(current_round, performance, feedback)
+            message = record_scores(performance)
+            
+            if not session.is_ready_for_next_round:
+                # Generate practice plan
+                session.practice_plan = agents['performance_analyzer'].generate_practice_plan(
+                    performance.get('weak_topics', []),
+                    session.profession,
+                    "1 week"
+                )
+        except CircuitOpenError:
+            raise
+        except Exception as e:
+            raise RuntimeError(f"Failed to complete round: {str(e)}") from e
+        
+        return _round_completion_response(session, current_round, performance, message)
+    
+    return _accepted(get_job_queue().submit("round_completion", run_round_completion))
+
+
+@app.post("/api/interview-session/{session_id}/round/{round_id}/complete/stream")
+async def complete_interview_round_stream(session_id: str, round_id: str):
+    """Complete an interview round and stream the performance report as Server-Sent Events"""
+    if session_id not in interview_sessions_db:
+        raise HTTPException(status_code=404, detail="Interview session not found")
+    
+    session = interview_sessions_db[session_id]
+    
+    # Find the round
+    current_round = None
+    for round_obj in session.rounds:
+        if round_obj.round_id == round_id:
+            current_round = round_obj
+            break
+    
+    if not current_round:
+        raise HTTPException(status_code=404, detail="Interview round not found")
+    
+    agents = get_agents()
+    
+    def events():
+        try:
+            # Evaluate any answers still pending from deferred mode
+            if DeferredAnswerEvaluator.pending(current_round):
+                yield format_sse("evaluation_started", {"pending_answers": len(DeferredAnswerEvaluator.pending(current_round))})
+            _final_flush(session, current_round)
+            
+            performance = _score_round(current_round)
+            yield format_sse("scores", performance)
+            
+            stream = agents['performance_analyzer'].stream_round_feedback(
+                _build_interview_data(session, current_round),
+                performance,
+                session.profession
+            )
+            for event in stream:
+                if event["event"] != "result":
+                    yield format_sse(event["event"], event["data"])
+                    continue
+                
+                _apply_round_feedback(current_round, performance, event["data"])
+                if _record_round_performance(session, current_round, performance):
+                    message = PERFECT_ROUND_MESSAGE
+                else:
+                    yield format_sse("practice_plan_started", {"weak_topics": len(performance.get('weak_topics', []))})
+                    session.practice_plan = agents['performance_analyzer'].generate_practice_plan(
+                        performance.get('weak_topics', []),
+                        session.profession,
+                        "1 week"
+                    )
+                    message = PRACTICE_ROUND_MESSAGE
+                
+                _prefetch_next_round(session)
+                yield format_sse("complete", _round_completion_response(session, current_round, performance, message))
+        except Exception as e:
+            yield format_sse("error", {"detail": f"Failed to complete round: {str(e)}"})
+    
+    try:
+        body = stream_on_executor(events())
+    except AgentExecutorSaturated as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    return StreamingResponse(body, media_type="text/event-stream", headers=SSE_HEADERS)
 
 
 @app.get("/api/interview-session/{session_id}", response_model=dict)
@@ -592,6 +1129,29 @@ async def get_user_sessions(user_id: str):
     return user_sessions
 
 
+# ============== BACKGROUND JOBS ==============
+
+@app.get("/api/jobs/{job_id}", response_model=dict)
+async def get_job(job_id: str):
+    """Get the status and, once done, the result of a background job"""
+    job = get_job_queue().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return json.loads(job.json())
+
+
+@app.post("/api/jobs/{job_id}/retry", status_code=202)
+async def retry_job(job_id: str):
+    """Re-queue a failed background job"""
+    try:
+        job = get_job_queue().retry(job_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Job not found")
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return _accepted(job)
+
+
 # ============== DASHBOARD & STATISTICS ==============
 
 @app.get("/api/users/{user_id}/dashboard", response_model=dict)
@@ -642,6 +1202,38 @@ async def health_check():
     }
 
 
+def _built_agent(name: str, stats: Any) -> Any:
+    """Stats of an agent that has already been built, without building it"""
+    agent = agents.built(name) if agents is not None else None
+    return stats(agent) if agent is not None else None
+
+
+@app.get("/api/metrics")
+async def get_metrics():
+    """Runtime metrics for the agent execution layer"""
+    return {
+        "agent_executor": get_agent_executor().get_metrics(),
+        "background_executor": get_background_executor().get_metrics(),
+        "llm_cache": get_llm_cache().get_stats(),
+        "llm_scheduler": get_llm_scheduler().get_metrics(),
+        "llm_hedging": get_llm_hedger().get_stats(),
+        "model_routes": get_model_router().get_stats(),
+        "llm_clients": get_llm_client_registry().get_stats(),
+        "circuit_breaker": get_circuit_breaker().get_stats(),
+        "single_flight": get_single_flight().get_stats(),
+        "components": get_component_registry().get_stats(),
+        "jd_index": _built_agent('job_match_analyzer', lambda agent: agent.requirement_index.get_stats()),
+        "candidate_index": get_candidate_index().get_stats(),
+        "prompt_sizes": get_prompt_meter().get_stats(),
+        "structured_output": get_structured_output_stats(),
+        "question_bank": question_bank.get_stats() if question_bank else None,
+        "round_prefetch": round_prefetcher.get_stats() if round_prefetcher else None,
+        "deferred_evaluation": deferred_evaluator.get_stats() if deferred_evaluator else None,
+        "jobs": get_job_queue().get_stats(),
+        "timestamp": datetime.now().isoformat()
+    }
+
+
 # Mount static files
 try:
     app.mount("/static", StaticFiles(directory="app/frontend"), name="static")
@@ -19,6 +19,23 @@ from .session import (
     QuestionAnswer,
     SessionStatus
 )
+from .job import (
+    Job,
+    JobStatus
+)
+from .llm_responses import (
+    LLMResponse,
+    CVGapAnalysisResponse,
+    LearningRecommendationsResponse,
+    InterviewQuestionSetResponse,
+    AnswerEvaluationResponse,
+    BatchAnswerEvaluationResponse,
+    AdaptiveQuestionResponse,
+    RoundFeedbackResponse,
+    PracticePlanResponse,
+    JobFitAnalysisResponse,
+    JobRequirementsResponse
+)
 
 __all__ = [
     'Candidate',
@@ -35,5 +52,18 @@ __all__ = [
     'InterviewSession',
     'InterviewRound',
     'QuestionAnswer',
-    'SessionStatus'
+    'SessionStatus',
+    'Job',
+    'JobStatus',
+    'LLMResponse',
+    'CVGapAnalysisResponse',
+    'LearningRecommendationsResponse',
+    'InterviewQuestionSetResponse',
+    'AnswerEvaluationResponse',
+    'BatchAnswerEvaluationResponse',
+    'AdaptiveQuestionResponse',
+    'RoundFeedbackResponse',
+    'PracticePlanResponse',
+    'JobFitAnalysisResponse',
+    'JobRequirementsResponse'
 ]
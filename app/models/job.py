@@ -0,0 +1,32 @@
+from pydantic import BaseModel, Field
+from typing import Optional, Dict, Any
+from datetime import datetime
+from enum import Enum
+
+
+class JobStatus(str, Enum):
+    """Background job status"""
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class Job(BaseModel):
+    """A long-running analysis executed by the background job queue"""
+    job_id: str = Field(..., description="Unique job identifier")
+    kind: str = Field(..., description="Job type (cv_analysis, recommendations, job_fit, round_completion)")
+    status: JobStatus = Field(default=JobStatus.QUEUED, description="Job status")
+    attempts: int = Field(default=0, description="Number of attempts made")
+    max_attempts: int = Field(default=1, description="Attempts allowed before the job is marked failed")
+    result: Optional[Dict[str, Any]] = Field(None, description="Job result once done")
+    error: Optional[str] = Field(None, description="Last error if the job failed")
+    
+    created_at: datetime = Field(default_factory=datetime.now)
+    started_at: Optional[datetime] = Field(None, description="When the latest attempt started")
+    finished_at: Optional[datetime] = Field(None, description="When the job finished")
+    
+    class Config:
+        json_encoders = {
+            datetime: lambda v: v.isoformat()
+        }
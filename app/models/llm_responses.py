@@ -0,0 +1,191 @@
+from pydantic import BaseModel, Field, ValidationError
+from typing import List, Dict, Any, Optional, Union
+
+
+class LLMResponse(BaseModel):
+    """
+    Base for structured agent responses; fields the schema does not declare are kept
+
+    Each schema marks the fields that make a response usable as required (``...``), so
+    empty or wrongly shaped output fails validation instead of validating into defaults.
+    """
+
+    class Config:
+        extra = "allow"
+
+    @classmethod
+    def tolerant_validate(cls, data: Dict[str, Any]) -> "LLMResponse":
+        """
+        Validate, dropping whatever fails validation so defaults apply
+
+        Invalid list items are removed individually; other invalid top-level fields are
+        removed entirely. Used for output that did not come from native structured output
+        mode, where one malformed field should not discard the whole response.
+        """
+        data = dict(data)
+        while True:
+            try:
+                return cls.model_validate(data)
+            except ValidationError as e:
+                # Highest list index first so earlier removals do not shift later ones
+                locations = sorted(
+                    {tuple(error["loc"][:2]) for error in e.errors() if error["loc"]},
+                    key=lambda loc: (str(loc[0]), loc[1] if len(loc) > 1 and isinstance(loc[1], int) else -1),
+                    reverse=True
+                )
+                changed = False
+                for loc in locations:
+                    key = loc[0]
+                    if key not in data:
+                        continue
+                    if len(loc) > 1 and isinstance(loc[1], int) and isinstance(data[key], list):
+                        if loc[1] < len(data[key]):
+                            data[key] = data[key][:loc[1]] + data[key][loc[1] + 1:]
+                            changed = True
+                    else:
+                        del data[key]
+                        changed = True
+                if not changed:
+                    raise
+
+
+class CVGapAnalysisResponse(LLMResponse):
+    """CVGapAnalyzerAgent gap analysis"""
+    current_level: str = Field(default="unknown", description="Current experience level")
+    overall_readiness_score: float = Field(..., ge=0, le=100, description="Readiness score (0-100)")
+    technical_skills_gaps: List[Dict[str, Any]] = Field(default_factory=list)
+    missing_certifications: List[Dict[str, Any]] = Field(default_factory=list)
+    experience_gaps: List[Dict[str, Any]] = Field(default_factory=list)
+    soft_skills_gaps: List[Dict[str, Any]] = Field(default_factory=list)
+    educational_gaps: List[Dict[str, Any]] = Field(default_factory=list)
+    strengths: List[str] = Field(default_factory=list)
+    priority_improvements: List[Dict[str, Any]] = Field(default_factory=list)
+    career_stage_analysis: str = Field(default="", description="Where the candidate is vs where they should be")
+    recommendations_summary: str = Field(default="", description="Summary of key recommendations")
+
+
+class LearningRecommendationsResponse(LLMResponse):
+    """LearningRecommenderAgent recommendations"""
+    certifications: List[Dict[str, Any]] = Field(default_factory=list)
+    courses: List[Dict[str, Any]] = Field(..., description="Recommended courses")
+    projects: List[Dict[str, Any]] = Field(default_factory=list)
+    books: List[Dict[str, Any]] = Field(default_factory=list)
+    communities: List[Dict[str, Any]] = Field(default_factory=list)
+    learning_paths: Dict[str, Any] = Field(default_factory=dict)
+    budget_breakdown: Dict[str, Any] = Field(default_factory=dict)
+    quick_wins: List[Any] = Field(default_factory=list)
+    summary: str = Field(default="", description="Overall recommendation summary")
+
+
+class InterviewQuestion(LLMResponse):
+    """A generated interview question"""
+    id: Union[int, str] = Field(..., description="Question number")
+    question: str = Field(..., description="Question text")
+    type: str = Field(default="technical", description="technical/problem_solving/behavioral/situational")
+    difficulty: str = Field(default="medium", description="easy/medium/hard")
+    focus_area: str = Field(default="", description="Focus area the question covers")
+    time_limit_minutes: float = Field(default=5, ge=0, description="Suggested time limit")
+    evaluation_criteria: List[str] = Field(default_factory=list)
+    follow_up_questions: List[str] = Field(default_factory=list)
+
+
+class InterviewQuestionSetResponse(LLMResponse):
+    """InteractiveInterviewerAgent question set"""
+    questions: List[InterviewQuestion] = Field(..., min_length=1, description="Generated questions")
+    interview_structure: Dict[str, Any] = Field(default_factory=dict)
+    introduction: str = Field(default="")
+    closing: str = Field(default="")
+
+
+class AnswerEvaluationResponse(LLMResponse):
+    """InteractiveInterviewerAgent evaluation of one answer (scores 0-10)"""
+    score: float = Field(..., ge=0, le=10, description="Answer score (0-10)")
+    strengths: List[str] = Field(default_factory=list)
+    weaknesses: List[str] = Field(default_factory=list)
+    missing_points: List[str] = Field(default_factory=list)
+    technical_accuracy: float = Field(default=0, ge=0, le=10)
+    clarity_of_explanation: float = Field(default=0, ge=0, le=10)
+    depth_of_knowledge: float = Field(default=0, ge=0, le=10)
+    practical_application: float = Field(default=0, ge=0, le=10)
+    detailed_feedback: str = Field(default="")
+    improvement_suggestions: List[str] = Field(default_factory=list)
+    follow_up_needed: bool = Field(default=False)
+    recommended_follow_up: str = Field(default="")
+
+
+class BatchAnswerEvaluation(AnswerEvaluationResponse):
+    """One evaluation within a packed batch"""
+    question_id: str = Field(..., description="Id of the evaluated answer")
+
+
+class BatchAnswerEvaluationResponse(LLMResponse):
+    """InteractiveInterviewerAgent packed batch evaluation"""
+    evaluations: List[BatchAnswerEvaluation] = Field(..., min_length=1, description="One evaluation per answer")
+
+
+class AdaptiveQuestionResponse(LLMResponse):
+    """InteractiveInterviewerAgent adaptive follow-up question"""
+    question: str = Field(..., description="Question text")
+    rationale: str = Field(default="")
+    type: str = Field(default="technical")
+    difficulty: str = Field(default="medium")
+    evaluation_criteria: List[str] = Field(default_factory=list)
+    time_limit_minutes: float = Field(default=5, ge=0)
+
+
+class RoundFeedbackResponse(LLMResponse):
+    """PerformanceAnalyzerAgent narrative feedback for a scored round"""
+    detailed_feedback: str = Field(..., min_length=1, description="Narrative feedback")
+    motivational_message: str = Field(default="")
+
+
+class PracticePlanResponse(LLMResponse):
+    """PerformanceAnalyzerAgent practice plan"""
+    total_duration: str = Field(default="")
+    daily_schedule: List[Dict[str, Any]] = Field(..., min_length=1, description="Day-by-day practice")
+    mock_interview_questions: List[Dict[str, Any]] = Field(default_factory=list)
+    progress_checkpoints: List[Dict[str, Any]] = Field(default_factory=list)
+    final_preparation: Dict[str, Any] = Field(default_factory=dict)
+    success_tips: List[str] = Field(default_factory=list)
+    estimated_improvement: str = Field(default="")
+
+
+class EligibilityAssessment(LLMResponse):
+    """Job fit scores"""
+    overall_fit_score: float = Field(..., ge=0, le=100, description="Fit score (0-100)")
+    skills_match_percentage: Optional[float] = Field(None, ge=0, le=100)
+    experience_match_percentage: Optional[float] = Field(None, ge=0, le=100)
+    education_match_percentage: Optional[float] = Field(None, ge=0, le=100)
+    hiring_probability: str = Field(default="medium")
+    confidence_level: str = Field(default="medium")
+
+
+class JobFitAnalysisResponse(LLMResponse):
+    """JobMatchAnalyzerAgent job fit analysis"""
+    job_analysis: Dict[str, Any] = Field(default_factory=dict)
+    required_skills: List[Dict[str, Any]] = Field(default_factory=list)
+    preferred_skills: List[Dict[str, Any]] = Field(default_factory=list)
+    required_qualifications: List[Dict[str, Any]] = Field(default_factory=list)
+    eligibility_assessment: EligibilityAssessment = Field(..., description="Fit scores")
+    matching_qualifications: List[Dict[str, Any]] = Field(default_factory=list)
+    missing_critical_skills: List[Dict[str, Any]] = Field(default_factory=list)
+    missing_preferred_skills: List[Dict[str, Any]] = Field(default_factory=list)
+    improvement_recommendations: List[Dict[str, Any]] = Field(default_factory=list)
+    preparation_timeline: Dict[str, Any] = Field(default_factory=dict)
+    application_advice: Dict[str, Any] = Field(default_factory=dict)
+    detailed_analysis: str = Field(default="")
+    next_steps: List[str] = Field(default_factory=list)
+
+
+class JobRequirementsResponse(LLMResponse):
+    """JobMatchAnalyzerAgent structured job requirements"""
+    job_title: str = Field(default="")
+    seniority_level: str = Field(default="")
+    technical_skills: List[str] = Field(..., description="Required technical skills")
+    soft_skills: List[str] = Field(default_factory=list)
+    education_required: List[str] = Field(default_factory=list)
+    experience_required: Dict[str, Any] = Field(default_factory=dict)
+    certifications: List[str] = Field(default_factory=list)
+    tools_and_technologies: List[str] = Field(default_factory=list)
+    key_responsibilities: List[str] = Field(default_factory=list)
+    preferred_skills: List[str] = Field(default_factory=list, description="Nice-to-have skills")
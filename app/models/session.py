@@ -60,6 +60,7 @@ class InterviewSession(BaseModel):
     session_id: str = Field(..., description="Unique session identifier")
     user_id: str = Field(..., description="User identifier")
     profession: str = Field(..., description="Profession being interviewed for")
+    evaluation_mode: str = Field(default="immediate", description="Answer evaluation mode (immediate/deferred)")
     
     # Session metadata
     total_rounds: int = Field(default=0, description="Total interview rounds")
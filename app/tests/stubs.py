@@ -0,0 +1,33 @@
+from app.utils.llm_provider import LLMProvider
+
+
+class StubLLMProvider(LLMProvider):
+    """Provider returning canned responses (per model if a dict) and recording requested schemas"""
+
+    name = "fake"
+
+    def __init__(self, response='{"ok": true}'):
+        self.response = response
+        self.calls = []
+        self.models = []
+
+    def complete(self, owner, task, response_model=None, timeout=None):
+        self.calls.append(response_model)
+        self.models.append(owner.llm.model)
+        if isinstance(self.response, dict):
+            return self.response[owner.llm.model]
+        return self.response
+
+
+def stub_question_generator(profession, experience_level, focus_areas=None, difficulty="mixed",
+                            exclude_questions=None, background=False):
+    """Question generator returning four questions per call, numbered past the excluded ones"""
+    area = focus_areas[0] if focus_areas else "general"
+    offset = len(exclude_questions or [])
+    return {
+        "questions": [
+            {"id": i, "question": f"{area} question {offset + i}", "difficulty": "medium",
+             "time_limit_minutes": 5, "focus_area": area}
+            for i in range(1, 5)
+        ]
+    }
@@ -0,0 +1,60 @@
+import pytest
+import asyncio
+import threading
+from app.utils.agent_executor import AgentExecutor, AgentExecutorSaturated
+
+
+class TestAgentExecutor:
+    """Test cases for AgentExecutor"""
+
+    @pytest.fixture
+    def executor(self):
+        """Create a small AgentExecutor for testing"""
+        executor = AgentExecutor(max_workers=1, max_queue_size=1)
+        yield executor
+        executor.shutdown()
+
+    def test_run_returns_result(self, executor):
+        """Test that blocking calls are awaited off the event loop"""
+        result = asyncio.run(executor.run(lambda x, y: x + y, 2, 3))
+
+        assert result == 5
+        metrics = executor.get_metrics()
+        assert metrics["completed"] == 1
+        assert metrics["queue_depth"] == 0
+        assert metrics["running"] == 0
+
+    def test_run_propagates_errors(self, executor):
+        """Test that agent errors are re-raised and counted"""
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            asyncio.run(executor.run(fail))
+
+        assert executor.get_metrics()["failed"] == 1
+
+    def test_submit_rejects_when_queue_full(self, executor):
+        """Test that the executor is bounded"""
+        release = threading.Event()
+        started = threading.Event()
+
+        def block():
+            started.set()
+            release.wait(5)
+
+        running = executor.submit(block)
+        started.wait(5)
+        queued = executor.submit(lambda: None)
+
+        with pytest.raises(AgentExecutorSaturated):
+            executor.submit(lambda: None)
+
+        metrics = executor.get_metrics()
+        assert metrics["queue_depth"] == 1
+        assert metrics["rejected"] == 1
+
+        release.set()
+        running.result(5)
+        queued.result(5)
+        assert executor.get_metrics()["max_wait_seconds"] > 0
@@ -0,0 +1,93 @@
+from unittest.mock import Mock
+from app.utils.batch_evaluator import DeferredAnswerEvaluator
+from app.models.session import InterviewRound
+from app.utils.llm_scheduler import Priority
+
+
+class TestDeferredAnswerEvaluator:
+    """Test cases for DeferredAnswerEvaluator"""
+
+    @staticmethod
+    def _round(answer_count):
+        return InterviewRound(
+            round_id="round-1",
+            round_number=1,
+            answers=[
+                {
+                    "question_id": str(i),
+                    "question": {"id": i, "question": f"Question {i}"},
+                    "answer": f"Answer {i}",
+                    "evaluation": None,
+                    "timestamp": "2024-01-01T00:00:00"
+                }
+                for i in range(1, answer_count + 1)
+            ]
+        )
+
+    def test_flush_packs_answers(self):
+        """Test pending answers are evaluated in packed calls"""
+        batch = Mock(side_effect=lambda items, profession, priority: {
+            item["question_id"]: {"score": 7} for item in items
+        })
+        evaluator = DeferredAnswerEvaluator(batch, batch_size=5, pack_size=2)
+        interview_round = self._round(5)
+
+        assert evaluator.flush(interview_round, "Software Engineer") == 5
+
+        assert batch.call_count == 3
+        assert all(a["evaluation"] == {"score": 7} for a in interview_round.answers)
+        assert set(interview_round.answers[0]) == {"question_id", "question", "answer", "evaluation", "timestamp"}
+        assert DeferredAnswerEvaluator.pending(interview_round) == []
+
+    def test_failed_pack_is_split_then_scored_heuristically(self):
+        """Test a failed pack is retried as two halves and what is still missing is scored locally"""
+        calls = []
+
+        def batch(items, profession, priority):
+            calls.append([item["question_id"] for item in items])
+            if len(items) == 4:
+                raise RuntimeError("truncated response")
+            return {items[0]["question_id"]: {"score": 9}}
+
+        evaluator = DeferredAnswerEvaluator(batch)
+        interview_round = self._round(4)
+
+        evaluator.flush(interview_round, "Software Engineer")
+
+        assert calls == [["1", "2", "3", "4"], ["1", "2"], ["3", "4"]]
+        evaluations = [a["evaluation"] for a in interview_round.answers]
+        assert evaluations[0] == {"score": 9} and evaluations[2] == {"score": 9}
+        assert evaluations[1]["degraded"] is True and "score" in evaluations[1]
+        stats = evaluator.get_stats()
+        assert stats["split_retries"] == 1
+        assert stats["heuristic_fallbacks"] == 2
+        assert stats["answers_evaluated"] == 4
+
+    def test_flush_priority_reaches_batch_evaluate(self):
+        """Test flushes default to background priority and a waiting caller can raise it"""
+        batch = Mock(return_value={})
+        evaluator = DeferredAnswerEvaluator(batch, pack_size=1)
+
+        evaluator.flush(self._round(1), "Software Engineer")
+        evaluator.flush(self._round(1), "Software Engineer", final=True, priority=Priority.INTERACTIVE)
+
+        priorities = [call.kwargs["priority"] for call in batch.call_args_list]
+        assert priorities[0] == Priority.BACKGROUND
+        assert priorities[-1] == Priority.INTERACTIVE
+
+    def test_final_flush_drops_round_lock(self):
+        """Test the completion flush forgets the round's lock"""
+        evaluator = DeferredAnswerEvaluator(Mock(return_value={}), batch_size=1)
+        interview_round = self._round(0)
+
+        evaluator.flush(interview_round, "Software Engineer")
+        assert "round-1" in evaluator._round_locks
+
+        evaluator.flush(interview_round, "Software Engineer", final=True)
+        assert "round-1" not in evaluator._round_locks
+
+    def test_schedule_waits_for_threshold(self):
+        """Test background flushes only start at the batch threshold"""
+        evaluator = DeferredAnswerEvaluator(Mock(), batch_size=3)
+
+        assert evaluator.maybe_schedule_flush(self._round(2), "Software Engineer") is False
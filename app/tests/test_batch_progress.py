@@ -0,0 +1,20 @@
+from app.utils.batch_progress import BatchProgress
+
+
+class TestBatchProgress:
+    """Test cases for batch progress tracking"""
+
+    def test_snapshot_counts_and_errors(self):
+        """Test the snapshot reports finished items, in-flight items and failures"""
+        progress = BatchProgress(total=4)
+        for _ in range(3):
+            progress.record_submitted()
+        progress.record_completed()
+        progress.record_failed("c2", ValueError("bad transcript"))
+
+        snapshot = progress.snapshot()
+
+        assert snapshot["in_flight"] == 1
+        assert snapshot["fraction_done"] == 0.5
+        assert snapshot["errors"] == {"c2": "bad transcript"}
+        assert snapshot["throughput_per_minute"] > 0
@@ -0,0 +1,123 @@
+import pytest
+import time
+from collections import deque
+from unittest.mock import Mock
+from app.utils import llm_runtime
+from app.utils.llm_cache import LLMResponseCache
+from app.utils.question_bank import QuestionBank
+from app.utils.json_extraction import extract_json_object
+from app.utils.llm_provider import set_llm_provider
+from app.utils.llm_clients import AgentTask
+from app.utils.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+from app.utils.degraded_fallbacks import heuristic_answer_evaluation
+from app.models.llm_responses import AnswerEvaluationResponse
+from app.tests.stubs import StubLLMProvider
+
+
+class TestCircuitBreaker:
+    """Test cases for the LLM circuit breaker and degraded fallbacks"""
+
+    def test_opens_after_consecutive_failures_and_recovers(self):
+        """Test the breaker opens, lets a probe through after the timeout and closes on success"""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+        assert not breaker.allow()
+        assert breaker.retry_after() > 0
+
+        time.sleep(0.06)
+        assert breaker.allow()
+        assert not breaker.allow()
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.get_stats()["rejected"] == 2
+
+    def test_failed_probe_reopens(self):
+        """Test a failing half-open probe opens the circuit again"""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+        breaker.record_failure()
+        time.sleep(0.06)
+
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.get_stats()["opened"] == 2
+
+    def test_open_circuit_fails_fast_with_stale_result(self, monkeypatch):
+        """Test calls are not made while open and carry the expired cached response"""
+        cache = LLMResponseCache(db_path=None)
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+        monkeypatch.setattr(llm_runtime, "get_llm_cache", lambda: cache)
+        monkeypatch.setattr(llm_runtime, "get_circuit_breaker", lambda: breaker)
+        provider = StubLLMProvider()
+        set_llm_provider(provider)
+        try:
+            owner = Mock()
+            owner.cache_ttl_seconds = 60
+            owner.llm.model = "gemini-1.5-flash"
+            owner.llm.temperature = 0.1
+            owner.agent.role = "Senior Career Development Advisor"
+            task = AgentTask(description="Analyze", expected_output="JSON", agent=owner.agent)
+            cache.set(llm_runtime.cache_key_for(owner, task), '{"old": true}', -1, owner.__class__.__name__)
+
+            breaker.record_failure()
+            with pytest.raises(CircuitOpenError) as excinfo:
+                llm_runtime.execute_agent_task(owner, task)
+        finally:
+            set_llm_provider(None)
+
+        assert provider.calls == []
+        assert excinfo.value.stale_result == '{"old": true}'
+
+    def test_degraded_response_prefers_stale_then_fallback(self):
+        """Test stale output is used before the heuristic, and the error is re-raised without either"""
+        parse = lambda text: extract_json_object(text) or {"error": "Invalid JSON"}
+
+        stale = llm_runtime.degraded_response(CircuitOpenError(5, '{"score": 7}'), parse, lambda: {"score": 1})
+        assert stale == {"score": 7, "degraded": True, "degraded_source": "stale_cache"}
+
+        heuristic = llm_runtime.degraded_response(CircuitOpenError(5, "not json"), parse, lambda: {"score": 1})
+        assert heuristic["degraded_source"] == "heuristic"
+
+        with pytest.raises(CircuitOpenError):
+            llm_runtime.degraded_response(CircuitOpenError(5), parse)
+
+    def test_heuristic_evaluation_matches_schema(self):
+        """Test the rule-based evaluation validates and rewards relevant, detailed answers"""
+        question = {"question": "How would you index a slow SQL query?",
+                    "evaluation_criteria": ["query plans", "composite indexes"]}
+
+        weak = heuristic_answer_evaluation(question, "Add an index.")
+        strong = heuristic_answer_evaluation(question, (
+            "First I would read the query plans to see whether the query scans the table. "
+            "For example, when a filter and a sort use different columns I add composite indexes "
+            "covering both, then check the plan again and measure the query latency before and after. "
+            "I also watch the write overhead each extra index adds to inserts."
+        ))
+
+        AnswerEvaluationResponse.model_validate(strong)
+        assert strong["score"] > weak["score"]
+        assert weak["missing_points"]
+
+    def test_question_bank_serves_degraded_round(self):
+        """Test a cold miss with an open circuit is served from other stock for the profession"""
+        generator = Mock(side_effect=CircuitOpenError(30))
+        bank = QuestionBank(generator, round_size=3, low_water_mark=0)
+        other = QuestionBank.make_key("Software Engineer", "senior", "hard", None)
+        bank._stock[other] = deque({"question": f"stocked {i}", "difficulty": "hard"} for i in range(5))
+
+        round_data = bank.assemble_round("Software Engineer", "junior", ["SQL"], "mixed")
+
+        assert round_data["source"] == "degraded"
+        assert round_data["degraded"]
+        assert [q["id"] for q in round_data["questions"]] == [1, 2, 3]
+        assert bank.get_stats()["degraded_rounds"] == 1
+
+        with pytest.raises(CircuitOpenError):
+            bank.assemble_round("Data Scientist", "junior", None, "mixed")
@@ -0,0 +1,68 @@
+import pytest
+import time
+from unittest.mock import Mock
+from app.utils.llm_scheduler import is_rate_limit_error
+from app.utils.llm_provider import LLMProvider
+from app.utils.fake_llm_provider import RESPONSE_BUILDERS, FakeLLMError, FakeLLMProvider
+from app.models import llm_responses
+from app.models.llm_responses import AnswerEvaluationResponse
+
+
+class TestFakeLLMProvider:
+    """Test cases for the offline LLM provider"""
+
+    def test_every_schema_gets_valid_json(self):
+        """Test each agent response schema validates natively"""
+        prompt = "FOCUS AREAS: APIs, SQL\nANSWER ID: q1\nANSWER ID: q2"
+        for name in RESPONSE_BUILDERS:
+            response_model = getattr(llm_responses, name)
+            response_model.model_validate_json(FakeLLMProvider.respond(prompt, response_model))
+
+    def test_deterministic_per_prompt(self):
+        """Test the same prompt always yields the same response"""
+        first = FakeLLMProvider.respond("Evaluate answer A", AnswerEvaluationResponse)
+
+        assert FakeLLMProvider.respond("Evaluate answer A", AnswerEvaluationResponse) == first
+        assert FakeLLMProvider.respond("Evaluate answer B", AnswerEvaluationResponse) != first
+
+    def test_batch_echoes_answer_ids(self):
+        """Test packed evaluations come back keyed by the prompt's answer ids"""
+        text = FakeLLMProvider.respond("ANSWER ID: 3\n...\nANSWER ID: 7", llm_responses.BatchAnswerEvaluationResponse)
+
+        parsed = llm_responses.BatchAnswerEvaluationResponse.model_validate_json(text)
+        assert [evaluation.question_id for evaluation in parsed.evaluations] == ["3", "7"]
+
+    def test_injected_failures(self):
+        """Test error and rate-limit injection"""
+        task = Mock(description="Evaluate")
+
+        with pytest.raises(FakeLLMError) as error:
+            FakeLLMProvider(latency_median=0, rate_limit_rate=1.0).complete(Mock(), task)
+        assert is_rate_limit_error(error.value)
+
+        with pytest.raises(FakeLLMError) as error:
+            FakeLLMProvider(latency_median=0, error_rate=1.0).complete(Mock(), task)
+        assert not is_rate_limit_error(error.value)
+
+    def test_latency_and_timeout(self):
+        """Test sampled latency is applied and bounded by the request timeout"""
+        provider = FakeLLMProvider(latency_median=0.2, latency_sigma=0.01)
+
+        started = time.monotonic()
+        with pytest.raises(TimeoutError):
+            provider.complete(Mock(), Mock(description="Evaluate"), AnswerEvaluationResponse, timeout=0.02)
+        assert time.monotonic() - started < 0.15
+
+        chunks = list(FakeLLMProvider(latency_median=0.01, chunk_size=16).stream(
+            Mock(), Mock(description="Evaluate"), AnswerEvaluationResponse
+        ))
+        assert len(chunks) > 1
+        AnswerEvaluationResponse.model_validate_json("".join(chunks))
+
+    def test_provider_must_implement_complete(self):
+        """Test a provider without complete cannot be instantiated"""
+        class Incomplete(LLMProvider):
+            name = "incomplete"
+
+        with pytest.raises(TypeError):
+            Incomplete()
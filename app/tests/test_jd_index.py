@@ -0,0 +1,39 @@
+from unittest.mock import Mock
+from app.utils.jd_index import JobRequirementIndex
+
+
+class TestJobRequirementIndex:
+    """Test cases for the job description requirement index"""
+
+    def test_requirements_extracted_once_per_posting(self):
+        """Test re-pasted postings (whitespace and case differences) reuse one extraction"""
+        extractor = Mock(return_value={"job_title": "Backend Engineer", "technical_skills": ["Python"]})
+        index = JobRequirementIndex(extractor)
+
+        first_hash, first = index.get("Backend Engineer\n\nRequirements: Python")
+        second_hash, second = index.get("  backend engineer requirements:   PYTHON ")
+
+        assert first_hash == second_hash
+        assert first == second
+        assert extractor.call_count == 1
+        assert index.get_stats()["hits"] == 1
+
+    def test_failed_extractions_are_not_stored(self):
+        """Test unparseable or degraded requirements are extracted again next time"""
+        extractor = Mock(side_effect=[{"raw_text": "oops", "error": "Invalid JSON"},
+                                      {"job_title": "Backend Engineer"}])
+        index = JobRequirementIndex(extractor)
+
+        index.get("Backend Engineer")
+        _, requirements = index.get("Backend Engineer")
+
+        assert requirements == {"job_title": "Backend Engineer"}
+        assert index.get_stats()["unstored"] == 1
+
+    def test_least_recently_used_posting_evicted(self):
+        """Test the index is bounded"""
+        index = JobRequirementIndex(lambda jd: {"job_title": jd}, max_entries=2)
+        keys = [index.get(jd)[0] for jd in ("a", "b", "c")]
+
+        assert index.lookup(keys[0]) is None
+        assert index.lookup(keys[2]) == {"job_title": "c"}
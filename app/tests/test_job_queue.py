@@ -0,0 +1,106 @@
+import pytest
+import time
+from unittest.mock import Mock
+from app.utils.job_queue import JobQueue
+from app.models.job import JobStatus
+from app.utils.circuit_breaker import CircuitOpenError
+
+
+class TestJobQueue:
+    """Test cases for JobQueue"""
+
+    @staticmethod
+    def _wait(queue, job_id):
+        for _ in range(500):
+            job = queue.get(job_id)
+            if job.status in (JobStatus.DONE, JobStatus.FAILED):
+                return job
+            time.sleep(0.01)
+        raise AssertionError("job did not finish")
+
+    def test_job_runs_to_done(self):
+        """Test a job returns immediately and later reports its result"""
+        queue = JobQueue(max_workers=1)
+        job = queue.submit("cv_analysis", lambda: {"analysis_id": "a1"})
+
+        assert job.job_id
+        finished = self._wait(queue, job.job_id)
+        assert finished.status == JobStatus.DONE
+        assert finished.result == {"analysis_id": "a1"}
+        assert finished.attempts == 1
+
+    def test_failed_attempts_are_retried(self):
+        """Test transient failures are retried automatically"""
+        fn = Mock(side_effect=[RuntimeError("429"), {"ok": True}])
+        queue = JobQueue(max_workers=1, max_attempts=2, retry_backoff_seconds=0.05)
+
+        started = time.monotonic()
+        finished = self._wait(queue, queue.submit("job_fit", fn, retry=True).job_id)
+
+        assert finished.status == JobStatus.DONE
+        assert finished.attempts == 2
+        assert time.monotonic() - started >= 0.05
+        assert queue.retry_delay(3) == 0.2
+
+    def test_finished_jobs_are_evicted(self):
+        """Test finished jobs beyond the size bound or past the TTL are dropped, oldest first"""
+        queue = JobQueue(max_workers=1, max_finished_jobs=2)
+        jobs = [self._wait(queue, queue.submit("cv_analysis", lambda: {}).job_id) for _ in range(3)]
+        queue.submit("cv_analysis", lambda: {})
+
+        assert queue.get(jobs[0].job_id) is None
+        assert queue.get(jobs[2].job_id) is not None
+        assert queue.get_stats()["evicted"] == 1
+
+        queue.finished_ttl_seconds = 0
+        assert queue.get_stats()["jobs"]["done"] == 0
+
+    def test_open_circuit_is_not_retried(self):
+        """Test a job failing on an open circuit, even wrapped by the job function, is not retried"""
+        def wrapped():
+            try:
+                raise CircuitOpenError(retry_after=30)
+            except CircuitOpenError as e:
+                raise RuntimeError(f"CV analysis failed: {e}") from e
+
+        fn = Mock(side_effect=wrapped)
+        queue = JobQueue(max_workers=1, max_attempts=3)
+
+        finished = self._wait(queue, queue.submit("job_fit", fn, retry=True).job_id)
+
+        assert finished.status == JobStatus.FAILED
+        assert finished.attempts == 1
+        assert fn.call_count == 1
+
+    def test_jobs_are_not_retried_unless_opted_in(self):
+        """Test a job that writes records runs once even though it failed"""
+        fn = Mock(side_effect=[RuntimeError("after the write"), {"ok": True}])
+        queue = JobQueue(max_workers=1, max_attempts=3, retry_backoff_seconds=0.01)
+
+        finished = self._wait(queue, queue.submit("round_completion", fn).job_id)
+
+        assert finished.status == JobStatus.FAILED
+        assert finished.max_attempts == 1
+        assert fn.call_count == 1
+
+    def test_failed_job_can_be_retried(self):
+        """Test a failed job can be re-queued without resubmission"""
+        fn = Mock(side_effect=[RuntimeError("down"), {"ok": True}])
+        queue = JobQueue(max_workers=1, max_attempts=1)
+
+        failed = self._wait(queue, queue.submit("recommendations", fn).job_id)
+        assert failed.status == JobStatus.FAILED
+        assert failed.error == "down"
+
+        queue.retry(failed.job_id)
+        finished = self._wait(queue, failed.job_id)
+        assert finished.status == JobStatus.DONE
+        assert finished.result == {"ok": True}
+
+    def test_retry_rejects_unfailed_jobs(self):
+        """Test only failed jobs can be retried"""
+        queue = JobQueue(max_workers=1)
+        job = self._wait(queue, queue.submit("cv_analysis", lambda: {}).job_id)
+
+        with pytest.raises(ValueError):
+            queue.retry(job.job_id)
@@ -0,0 +1,31 @@
+from app.utils.job_ranker import bm25_scores, rank_jobs_locally, tokenize
+
+
+class TestJobRanker:
+    """Test cases for local job ranking"""
+
+    def test_bm25_prefers_matching_documents(self):
+        """Test documents sharing rare query terms score higher"""
+        documents = [tokenize("Python FastAPI PostgreSQL backend services"),
+                     tokenize("Java Spring enterprise services"),
+                     tokenize("Marketing campaigns and brand strategy")]
+
+        scores = bm25_scores(tokenize("Python developer building FastAPI services"), documents)
+
+        assert scores.argmax() == 0
+        assert scores[2] == 0
+
+    def test_rank_jobs_locally_orders_postings(self):
+        """Test postings are ranked by similarity and penalized for known gaps"""
+        profile = {"text": "Python developer with FastAPI, SQL and Docker", "gaps": ["Kubernetes"]}
+        jobs = [
+            "Sales manager for retail accounts",
+            "Backend engineer: Python, FastAPI, SQL, Docker",
+            "Backend engineer: Python, Kubernetes, SQL"
+        ]
+
+        ranked = rank_jobs_locally(profile, jobs)
+
+        assert [entry["index"] for entry in ranked] == [1, 2, 0]
+        assert ranked[0]["local_score"] > ranked[1]["local_score"] > ranked[2]["local_score"] == 0
+        assert ranked[1]["gap_hits"] == 1
@@ -0,0 +1,77 @@
+from app.utils.json_extraction import extract_json_object, scan_objects
+
+
+class TestJSONExtraction:
+    """Test cases for the shared JSON extractor"""
+
+    def test_plain_object(self):
+        """Test a bare JSON object is parsed"""
+        assert extract_json_object('{"score": 8, "notes": "ok"}') == {"score": 8, "notes": "ok"}
+
+    def test_trailing_prose_with_braces(self):
+        """Test braces in surrounding prose do not break extraction"""
+        text = ('Here is the evaluation:\n```json\n{"score": 7, "feedback": "Use {} carefully"}\n```\n'
+                'Note: I used the {score} placeholder as requested.')
+
+        assert extract_json_object(text) == {"score": 7, "feedback": "Use {} carefully"}
+
+    def test_largest_of_several_objects(self):
+        """Test the main object wins over small examples"""
+        text = 'Example: {"a": 1}. Result: {"overall_score": 80, "weak_topics": [{"topic": "SQL"}]}'
+
+        assert extract_json_object(text)["overall_score"] == 80
+
+    def test_escaped_quotes_and_braces_in_strings(self):
+        """Test escaped quotes and braces inside strings are not structural"""
+        text = '{"answer": "He said \\"}\\" then left", "score": 3}'
+
+        assert extract_json_object(text) == {"answer": 'He said "}" then left', "score": 3}
+
+    def test_truncated_output_repaired(self):
+        """Test output cut off mid-object is closed and the partial member dropped"""
+        text = '{"overall_score": 72, "strengths": ["APIs", "SQL"], "detailed_feedback": "Good wor'
+
+        data = extract_json_object(text)
+
+        assert data["overall_score"] == 72
+        assert data["strengths"] == ["APIs", "SQL"]
+
+        data = extract_json_object('{"score": 6, "weaknesses": ["depth", ')
+        assert data == {"score": 6, "weaknesses": ["depth"]}
+
+    def test_complete_object_beats_trailing_open_brace(self):
+        """Test a stray opening brace after a complete object does not replace it"""
+        text = '{"score": 8, "x": [1,2]} Let me know if you want more {'
+        assert extract_json_object(text) == {"score": 8, "x": [1, 2]}
+
+        assert extract_json_object('{"score": 8} and a set like {"a') == {"score": 8}
+
+    def test_larger_truncated_object_beats_earlier_small_one(self):
+        """Test a truncated object that recovers more than the earlier complete one still wins"""
+        text = 'Example: {"a": 1}. Result: {"score": 7, "strengths": ["APIs", "SQL"], "notes": "cut'
+        assert extract_json_object(text) == {"score": 7, "strengths": ["APIs", "SQL"]}
+
+    def test_unrecoverable_returns_none(self):
+        """Test text without an object yields None"""
+        assert extract_json_object("This is not valid JSON") is None
+        assert extract_json_object("") is None
+        assert extract_json_object('{"score": 6, "notes": "x"', repair=False) is None
+
+    def test_scan_reports_outermost_spans(self):
+        """Test nested objects are folded into their outermost span"""
+        spans, unclosed = scan_objects('x {"a": {"b": 1}} y {"c": 2')
+
+        assert spans == [(2, 17)]
+        assert unclosed == 20
+
+    def test_truncated_main_object_beats_example(self):
+        """Test a truncated main object is repaired rather than returning an earlier example"""
+        text = 'Format: {"a": 1}\n{"overall_score": 55, "weak_topics": ["SQL"], "notes": "cut'
+
+        assert extract_json_object(text) == {"overall_score": 55, "weak_topics": ["SQL"]}
+
+    def test_stray_braces_before_object(self):
+        """Test unbalanced braces in leading prose are skipped"""
+        text = 'Use { for blocks and {{ for templates. ' * 3 + '{"score": 9}'
+
+        assert extract_json_object(text) == {"score": 9}
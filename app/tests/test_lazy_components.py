@@ -0,0 +1,55 @@
+import threading
+import time
+from unittest.mock import Mock
+from app.utils.lazy_components import ComponentRegistry, LazyComponents
+
+
+class TestComponentRegistry:
+    """Test cases for lazy, memoized component construction"""
+
+    def test_components_are_built_once_per_configuration(self):
+        """Test the same name and configuration reuse one build and a new configuration builds again"""
+        registry = ComponentRegistry()
+        built = []
+
+        first = registry.get("agent", lambda: built.append("a") or object(), "key-a")
+        again = registry.get("agent", lambda: built.append("a") or object(), "key-a")
+        other = registry.get("agent", lambda: built.append("b") or object(), "key-b")
+
+        assert first is again
+        assert other is not first
+        assert built == ["a", "b"]
+        stats = registry.get_stats()["components"]["agent"]
+        assert stats["builds"] == 2
+        assert stats["reused"] == 1
+
+    def test_concurrent_first_use_builds_once(self):
+        """Test callers racing for an unbuilt component share one build"""
+        registry = ComponentRegistry()
+        builds = []
+
+        def factory():
+            time.sleep(0.05)
+            builds.append(1)
+            return object()
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(registry.get("agent", factory)))
+                   for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(builds) == 1
+        assert len({id(result) for result in results}) == 1
+
+    def test_lazy_components_build_only_what_is_used(self):
+        """Test looking up one component does not build the others"""
+        registry = ComponentRegistry()
+        components = LazyComponents({"used": lambda: "built", "unused": Mock(side_effect=AssertionError)},
+                                    config=("key",), registry=registry)
+
+        assert components["used"] == "built"
+        assert components.built("unused") is None
+        assert registry.get_stats()["built"] == 1
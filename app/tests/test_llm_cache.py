@@ -0,0 +1,65 @@
+import pytest
+from app.utils.llm_cache import LLMResponseCache
+
+
+class TestLLMResponseCache:
+    """Test cases for LLMResponseCache"""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Create a cache backed by a temporary SQLite file"""
+        return LLMResponseCache(max_memory_entries=2, db_path=str(tmp_path / "cache.sqlite3"))
+
+    def test_make_key_depends_on_all_parts(self):
+        """Test that role, model, temperature and prompt all affect the key"""
+        base = LLMResponseCache.make_key("role", "gemini-1.5-flash", 0.1, "prompt")
+
+        assert base == LLMResponseCache.make_key("role", "gemini-1.5-flash", 0.1, "prompt")
+        assert base != LLMResponseCache.make_key("other", "gemini-1.5-flash", 0.1, "prompt")
+        assert base != LLMResponseCache.make_key("role", "gemini-1.5-pro", 0.1, "prompt")
+        assert base != LLMResponseCache.make_key("role", "gemini-1.5-flash", 0.7, "prompt")
+        assert base != LLMResponseCache.make_key("role", "gemini-1.5-flash", 0.1, "prompt 2")
+
+    def test_hit_and_miss_counters(self, cache):
+        """Test memory hits and misses are counted per namespace"""
+        assert cache.get("k", "CVGapAnalyzerAgent") is None
+        cache.set("k", "value", 60, "CVGapAnalyzerAgent")
+
+        assert cache.get("k", "CVGapAnalyzerAgent") == "value"
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["namespaces"]["CVGapAnalyzerAgent"]["memory_hits"] == 1
+
+    def test_lru_eviction_falls_back_to_disk(self, cache):
+        """Test evicted entries are still served from the disk tier"""
+        cache.set("a", "1", 60)
+        cache.set("b", "2", 60)
+        cache.set("c", "3", 60)
+
+        assert cache.get_stats()["memory_entries"] == 2
+        assert cache.get("a") == "1"
+        assert cache.get_stats()["namespaces"]["default"]["disk_hits"] == 1
+
+    def test_connections_are_closed(self, cache, monkeypatch):
+        """Test every SQLite connection is closed once its operation finishes"""
+        import sqlite3
+        opened = []
+        connect = sqlite3.connect
+        monkeypatch.setattr(sqlite3, "connect", lambda *args, **kwargs: opened.append(connect(*args, **kwargs)) or opened[-1])
+
+        cache.set("k", "value", 60)
+        cache.clear()
+        assert cache.get("k") is None
+
+        assert opened
+        for conn in opened:
+            with pytest.raises(sqlite3.ProgrammingError):
+                conn.execute("SELECT 1")
+
+    def test_expired_entries_are_misses(self, cache):
+        """Test TTL expiry in both tiers"""
+        cache.set("k", "value", -1)
+
+        assert cache.get("k") is None
+        assert cache.purge_expired() == 1
@@ -0,0 +1,83 @@
+import sys
+import types
+from unittest.mock import Mock
+from app.utils import llm_runtime
+from app.utils.llm_provider import LiteLLMProvider, set_llm_provider
+from app.utils import llm_clients
+from app.utils.llm_clients import AgentTask, LLMClientRegistry
+from app.tests.stubs import StubLLMProvider
+
+
+class TestLLMClientRegistry:
+    """Test cases for the shared LLM client registry"""
+
+    def test_identical_settings_share_a_handle(self):
+        """Test agents with the same model settings get one handle"""
+        created = []
+        registry = LLMClientRegistry(llm_factory=lambda **settings: created.append(settings) or Mock(**settings))
+
+        first = registry.llm(model="gemini-1.5-flash", temperature=0.1, api_key="key")
+        second = registry.llm(api_key="key", model="gemini-1.5-flash", temperature=0.1)
+        other = registry.llm(model="gemini-1.5-flash", temperature=0.7, api_key="key")
+
+        assert first is second
+        assert other is not first
+        assert len(created) == 2
+        stats = registry.get_stats()
+        assert stats["handles"] == 2
+        assert stats["handles_reused"] == 1
+
+    def test_pooled_http_client_is_shared(self):
+        """Test one pooled client is created and reused until closed"""
+        registry = LLMClientRegistry(max_connections=4, max_keepalive_connections=2)
+
+        client = registry.http_client()
+        assert registry.http_client() is client
+        assert registry.get_stats()["pool_open"]
+
+        registry.close()
+        assert not registry.get_stats()["pool_open"]
+
+    def test_gemini_calls_use_the_pooled_client(self, monkeypatch):
+        """Test Gemini completions are given the pooled client explicitly"""
+        calls = []
+        litellm = types.ModuleType("litellm")
+        litellm.completion = lambda **kwargs: calls.append(kwargs) or Mock(
+            choices=[Mock(message=Mock(content='{"score": 7}'))]
+        )
+        http_handler = types.ModuleType("litellm.llms.custom_httpx.http_handler")
+        http_handler.HTTPHandler = lambda client: Mock(client=client)
+        monkeypatch.setitem(sys.modules, "litellm", litellm)
+        monkeypatch.setitem(sys.modules, "litellm.llms.custom_httpx.http_handler", http_handler)
+        registry = LLMClientRegistry()
+        monkeypatch.setattr(llm_clients, "_registry", registry)
+
+        owner = Mock()
+        owner.llm.model = "gemini-1.5-flash"
+        owner.agent.role = "Senior Technical Interviewer"
+        LiteLLMProvider().complete(owner, AgentTask(description="Evaluate", expected_output="JSON"))
+        owner.llm.model = "gpt-4o-mini"
+        LiteLLMProvider().complete(owner, AgentTask(description="Evaluate", expected_output="JSON"))
+
+        assert calls[0]["model"] == "gemini/gemini-1.5-flash"
+        assert calls[0]["client"].client is registry.http_client()
+        assert "client" not in calls[1]
+        assert litellm.client_session is registry.http_client()
+        registry.close()
+        assert litellm.client_session is None
+
+    def test_agent_task_runs_through_runtime(self):
+        """Test the lightweight task works with the shared runtime"""
+        provider = StubLLMProvider()
+        set_llm_provider(provider)
+        try:
+            owner = Mock()
+            owner.cache_ttl_seconds = 0
+            owner.llm.model = "gemini-1.5-flash"
+            owner.llm.temperature = 0.1
+            owner.agent.role = "Senior Career Development Advisor"
+            task = AgentTask(description="Analyze", expected_output="JSON", agent=owner.agent)
+
+            assert llm_runtime.execute_agent_task(owner, task) == '{"ok": true}'
+        finally:
+            set_llm_provider(None)
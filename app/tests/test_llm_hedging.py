@@ -0,0 +1,89 @@
+import pytest
+import time
+from app.utils.llm_hedging import HedgePolicy, LLMDeadlineExceeded, LLMHedger
+
+
+class TestLLMHedger:
+    """Test cases for hedged, deadline-bound LLM calls"""
+
+    def _attempt(self, delays, cancelled):
+        """Attempt whose n-th invocation takes ``delays[n]`` seconds unless cancelled"""
+        calls = iter(range(len(delays)))
+
+        def attempt(deadline, cancel):
+            index = next(calls)
+            if cancel.wait(delays[index]):
+                cancelled.append(index)
+                return None
+            return f"attempt-{index}"
+
+        return attempt
+
+    def test_fast_call_is_not_hedged(self):
+        """Test a call finishing before the hedge delay runs once"""
+        hedger = LLMHedger(max_workers=4)
+        policy = HedgePolicy("evaluate_answer", deadline_seconds=5, initial_hedge_delay=0.5)
+
+        assert hedger.run("Agent.evaluate_answer", self._attempt([0.01], []), policy) == "attempt-0"
+
+        stats = hedger.get_stats()["Agent.evaluate_answer"]
+        assert stats["calls"] == 1
+        assert stats["hedged"] == 0
+
+    def test_slow_primary_is_hedged_and_cancelled(self):
+        """Test the hedge wins over a slow primary, which is then cancelled"""
+        hedger = LLMHedger(max_workers=4)
+        policy = HedgePolicy("evaluate_answer", deadline_seconds=5, initial_hedge_delay=0.05)
+        cancelled = []
+
+        assert hedger.run("Agent.evaluate_answer", self._attempt([2.0, 0.01], cancelled), policy) == "attempt-1"
+
+        time.sleep(0.05)
+        assert cancelled == [0]
+        stats = hedger.get_stats()["Agent.evaluate_answer"]
+        assert stats["hedged"] == 1
+        assert stats["hedge_wins"] == 1
+        assert stats["hedge_rate"] == 1.0
+
+    def test_hedge_ratio_caps_extra_load(self):
+        """Test hedging stops once the hedge ratio budget is used"""
+        hedger = LLMHedger(max_workers=4)
+        policy = HedgePolicy("evaluate_answer", deadline_seconds=5, initial_hedge_delay=0.02,
+                             max_hedge_ratio=0.5)
+
+        hedger.run("key", self._attempt([1.0, 0.01], []), policy)
+        assert hedger.run("key", self._attempt([0.1], []), policy) == "attempt-0"
+
+        assert hedger.get_stats()["key"]["hedged"] == 1
+
+    def test_deadline_exceeded(self):
+        """Test a call past its deadline raises and cancels its attempts"""
+        hedger = LLMHedger(max_workers=4, enabled=False)
+        policy = HedgePolicy("generate_interview_questions", deadline_seconds=0.05)
+        cancelled = []
+
+        with pytest.raises(LLMDeadlineExceeded):
+            hedger.run("key", self._attempt([2.0], cancelled), policy)
+
+        time.sleep(0.05)
+        assert cancelled == [0]
+        assert hedger.get_stats()["key"]["deadline_exceeded"] == 1
+
+    def test_primary_error_propagates(self):
+        """Test a failing call raises its error instead of hedging"""
+        hedger = LLMHedger(max_workers=4)
+
+        def attempt(deadline, cancel):
+            raise ValueError("bad request")
+
+        with pytest.raises(ValueError):
+            hedger.run("key", attempt, HedgePolicy("evaluate_answer", initial_hedge_delay=1))
+
+    def test_deadline_env_override(self, monkeypatch):
+        """Test LLM_DEADLINE_<NAME> overrides the policy deadline"""
+        policy = HedgePolicy("evaluate_answer", deadline_seconds=30)
+        monkeypatch.setenv("LLM_DEADLINE_EVALUATE_ANSWER", "12")
+        assert policy.deadline() == 12
+
+        monkeypatch.setenv("LLM_DEADLINE_EVALUATE_ANSWER", "0")
+        assert policy.deadline() is None
@@ -0,0 +1,219 @@
+import pytest
+from unittest.mock import Mock
+from app.utils import llm_runtime
+from app.utils.llm_cache import LLMResponseCache
+from app.utils.llm_scheduler import LLMScheduler, Priority
+from app.utils.llm_provider import response_format_for, set_llm_provider
+from app.utils.llm_hedging import HedgePolicy
+from app.models import llm_responses
+from app.models.llm_responses import AnswerEvaluationResponse, InterviewQuestionSetResponse
+from app.tests.stubs import StubLLMProvider
+
+
+class TestExecuteAgentTask:
+    """Test cases for the shared agent task runner"""
+
+    @pytest.fixture(autouse=True)
+    def isolated_cache(self, monkeypatch):
+        """Use a fresh memory-only cache for each test"""
+        cache = LLMResponseCache(db_path=None)
+        monkeypatch.setattr(llm_runtime, "get_llm_cache", lambda: cache)
+        return cache
+
+    @pytest.fixture(autouse=True)
+    def provider(self):
+        """Route calls to a fake provider"""
+        provider = StubLLMProvider()
+        set_llm_provider(provider)
+        yield provider
+        set_llm_provider(None)
+
+    def _owner(self, ttl):
+        owner = Mock()
+        owner.cache_ttl_seconds = ttl
+        owner.llm.model = "gemini-1.5-flash"
+        owner.llm.temperature = 0.1
+        owner.agent.role = "Senior Career Development Advisor"
+        return owner
+
+    def test_repeated_prompt_served_from_cache(self, provider):
+        """Test that the second identical call does not reach the agent"""
+        owner = self._owner(ttl=60)
+        task = Mock(description="Analyze this CV")
+
+        assert llm_runtime.execute_agent_task(owner, task) == '{"ok": true}'
+        assert llm_runtime.execute_agent_task(owner, task) == '{"ok": true}'
+        assert len(provider.calls) == 1
+
+    def test_zero_ttl_disables_cache(self, provider):
+        """Test agents without a TTL always execute"""
+        owner = self._owner(ttl=0)
+        task = Mock(description="Analyze this CV")
+
+        llm_runtime.execute_agent_task(owner, task)
+        llm_runtime.execute_agent_task(owner, task)
+        assert len(provider.calls) == 2
+
+    def test_response_model_passed_to_provider(self, provider):
+        """Test the response schema reaches the provider"""
+        owner = self._owner(ttl=0)
+        task = Mock(description="Evaluate this answer")
+
+        llm_runtime.execute_agent_task(owner, task, response_model=AnswerEvaluationResponse)
+        assert provider.calls == [AnswerEvaluationResponse]
+
+    def test_hedged_call_goes_through_provider(self, provider):
+        """Test a call with a latency SLO returns the provider output"""
+        owner = self._owner(ttl=0)
+        task = Mock(description="Evaluate this answer")
+        policy = HedgePolicy("evaluate_answer", deadline_seconds=5)
+
+        assert llm_runtime.execute_agent_task(owner, task, hedge=policy) == '{"ok": true}'
+        assert len(provider.calls) == 1
+
+
+class FlakyStreamProvider(StubLLMProvider):
+    """Provider whose streams fail with a rate limit on the given attempts (after ``fail_after`` chunks)"""
+
+    def __init__(self, failing_attempts, fail_after=0):
+        super().__init__()
+        self.failing_attempts = failing_attempts
+        self.fail_after = fail_after
+        self.attempts = 0
+
+    def stream(self, owner, task, response_model=None, timeout=None):
+        self.attempts += 1
+        for index, chunk in enumerate(["{\"ok\"", ": true}"]):
+            if self.attempts in self.failing_attempts and index == self.fail_after:
+                raise RuntimeError("429 Too Many Requests")
+            yield chunk
+
+
+class TestStreamProvider:
+    """Test cases for the governed provider stream"""
+
+    @pytest.fixture
+    def scheduler(self, monkeypatch):
+        """Admit every call and skip the backoff sleeps"""
+        scheduler = LLMScheduler(requests_per_minute=6000, tokens_per_minute=10 ** 7)
+        scheduler.report_rate_limited = Mock()
+        monkeypatch.setattr(llm_runtime, "get_llm_scheduler", lambda: scheduler)
+        monkeypatch.setattr(llm_runtime.time, "sleep", lambda seconds: None)
+        return scheduler
+
+    def test_rate_limit_before_first_chunk_is_retried(self, scheduler):
+        """Test a stream rejected with a 429 is reported and retried"""
+        provider = FlakyStreamProvider(failing_attempts={1})
+        set_llm_provider(provider)
+        try:
+            chunks = list(llm_runtime.stream_provider(Mock(), Mock(description="Analyze"), Priority.INTERACTIVE))
+        finally:
+            set_llm_provider(None)
+
+        assert "".join(chunks) == '{"ok": true}'
+        assert provider.attempts == 2
+        scheduler.report_rate_limited.assert_called_once()
+
+    def test_rate_limit_after_first_chunk_is_raised(self, scheduler):
+        """Test a stream is not restarted once chunks have been relayed"""
+        provider = FlakyStreamProvider(failing_attempts={1}, fail_after=1)
+        set_llm_provider(provider)
+        try:
+            stream = llm_runtime.stream_provider(Mock(), Mock(description="Analyze"), Priority.INTERACTIVE)
+            assert next(stream) == '{"ok"'
+            with pytest.raises(RuntimeError, match="429"):
+                next(stream)
+        finally:
+            set_llm_provider(None)
+
+        assert provider.attempts == 1
+        assert scheduler.get_metrics()["running"] == 0
+
+
+class TestStructuredOutput:
+    """Test cases for schema-validated agent output"""
+
+    def test_native_json_validates_directly(self):
+        """Test JSON-mode output is validated without extraction"""
+        parsed = llm_runtime.parse_structured_output(
+            '{"score": 8, "strengths": ["clear"], "extra_note": "kept"}', AnswerEvaluationResponse
+        )
+
+        assert parsed.score == 8
+        assert parsed.strengths == ["clear"]
+        assert parsed.weaknesses == []
+        assert parsed.model_dump()["extra_note"] == "kept"
+
+    def test_chatty_output_falls_back_to_extractor(self):
+        """Test prose-wrapped output goes through the tolerant path"""
+        before = llm_runtime.get_structured_output_stats().get("AnswerEvaluationResponse", {}).get("tolerant", 0)
+
+        parsed = llm_runtime.parse_structured_output(
+            'Here you go:\n```json\n{"score": 6, "strengths": ["clear"]}\n```', AnswerEvaluationResponse
+        )
+
+        assert parsed.score == 6
+        assert llm_runtime.get_structured_output_stats()["AnswerEvaluationResponse"]["tolerant"] == before + 1
+
+    def test_invalid_fields_are_repaired_and_counted_per_parse(self):
+        """Test dropped fields are reported as repaired on every parse, including memoized ones"""
+        text = 'Here you go:\n```json\n{"score": 6, "technical_accuracy": 42}\n```'
+        before = llm_runtime.get_structured_output_stats().get("AnswerEvaluationResponse", {}).get("repaired", 0)
+
+        parsed = llm_runtime.parse_structured_output(text, AnswerEvaluationResponse)
+        llm_runtime.parse_structured_output(text, AnswerEvaluationResponse)
+
+        assert parsed.score == 6
+        assert parsed.technical_accuracy == 0
+        assert llm_runtime.get_structured_output_stats()["AnswerEvaluationResponse"]["repaired"] == before + 2
+
+    def test_unparseable_output_returns_none(self):
+        """Test output without an object yields None so agents use their fallback"""
+        assert llm_runtime.parse_structured_output("I cannot help with that", AnswerEvaluationResponse) is None
+
+    @pytest.mark.parametrize("text", [
+        '{"evaluation": {"score": 9}}',
+        '{}',
+        '{"score": 85, "strengths": ["clear"]}'
+    ])
+    def test_wrong_shape_output_fails_validation(self, text):
+        """Test nested, empty or wrongly scaled output is rejected rather than filled with defaults"""
+        assert llm_runtime.parse_structured_output(text, AnswerEvaluationResponse) is None
+
+    def test_required_fields_per_schema(self):
+        """Test each schema rejects output missing the field that makes it usable"""
+        assert llm_runtime.parse_structured_output('{"strengths": []}', llm_responses.CVGapAnalysisResponse) is None
+        assert llm_runtime.parse_structured_output('{"questions": []}', InterviewQuestionSetResponse) is None
+        assert llm_runtime.parse_structured_output(
+            '{"evaluations": [{"question_id": "1"}]}', llm_responses.BatchAnswerEvaluationResponse
+        ) is None
+        assert llm_runtime.parse_structured_output(
+            '{"eligibility_assessment": {"hiring_probability": "high"}}', llm_responses.JobFitAnalysisResponse
+        ) is None
+
+    def test_tolerant_validate_drops_invalid_items(self):
+        """Test one malformed question does not discard the set"""
+        parsed = InterviewQuestionSetResponse.tolerant_validate({
+            "questions": [
+                {"id": 1, "question": "Explain indexes"},
+                {"id": 2},
+                {"id": 3, "question": "Design a cache", "time_limit_minutes": "soon"}
+            ],
+            "introduction": "Welcome"
+        })
+
+        assert [question.question for question in parsed.questions] == ["Explain indexes"]
+        assert parsed.introduction == "Welcome"
+
+    def test_response_format_modes(self, monkeypatch):
+        """Test LLM_RESPONSE_FORMAT selects the native output request"""
+        assert response_format_for(None) is None
+        assert response_format_for(AnswerEvaluationResponse) == {"type": "json_object"}
+
+        monkeypatch.setenv("LLM_RESPONSE_FORMAT", "json_schema")
+        response_format = response_format_for(AnswerEvaluationResponse)
+        assert response_format["type"] == "json_schema"
+        assert "score" in response_format["json_schema"]["schema"]["properties"]
+
+        monkeypatch.setenv("LLM_RESPONSE_FORMAT", "off")
+        assert response_format_for(AnswerEvaluationResponse) is None
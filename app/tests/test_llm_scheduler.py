@@ -0,0 +1,93 @@
+import threading
+import time
+from app.utils.llm_scheduler import LLMScheduler, Priority, is_rate_limit_error
+
+
+class TestLLMScheduler:
+    """Test cases for LLMScheduler"""
+
+    def test_acquire_records_wait_per_priority(self):
+        """Test admitted calls are counted under their priority class"""
+        scheduler = LLMScheduler(requests_per_minute=600, tokens_per_minute=100000)
+
+        with scheduler.acquire(Priority.INTERACTIVE, estimated_tokens=100):
+            assert scheduler.get_metrics()["running"] == 1
+
+        metrics = scheduler.get_metrics()
+        assert metrics["running"] == 0
+        assert metrics["priorities"]["interactive"]["admitted"] == 1
+
+    def test_interactive_outranks_background(self):
+        """Test queued interactive calls are admitted before background calls"""
+        scheduler = LLMScheduler(requests_per_minute=6000, tokens_per_minute=10 ** 7, max_concurrent=1)
+        order = []
+        release = threading.Event()
+
+        def worker(priority, name):
+            with scheduler.acquire(priority):
+                order.append(name)
+
+        with scheduler.acquire(Priority.NORMAL):
+            background = threading.Thread(target=worker, args=(Priority.BACKGROUND, "background"))
+            background.start()
+            while scheduler.get_metrics()["queue_depth"] < 1:
+                time.sleep(0.001)
+            interactive = threading.Thread(target=worker, args=(Priority.INTERACTIVE, "interactive"))
+            interactive.start()
+            while scheduler.get_metrics()["queue_depth"] < 2:
+                time.sleep(0.001)
+
+        background.join(5)
+        interactive.join(5)
+        assert order == ["interactive", "background"]
+
+    def test_cancelled_call_spends_no_budget(self):
+        """Test a call cancelled before admission gives up its turn without taking budget"""
+        scheduler = LLMScheduler(requests_per_minute=600, tokens_per_minute=10 ** 7)
+        cancel = threading.Event()
+        cancel.set()
+
+        with scheduler.acquire(Priority.NORMAL, estimated_tokens=100, cancel=cancel) as admitted:
+            assert admitted is False
+
+        metrics = scheduler.get_metrics()
+        assert metrics["requests_available"] == 600
+        assert metrics["cancelled_before_send"] == 1
+        assert metrics["queue_depth"] == 0
+
+    def test_cancel_abandons_a_queued_wait(self):
+        """Test a queued call leaves the queue once cancelled"""
+        scheduler = LLMScheduler(requests_per_minute=6000, tokens_per_minute=10 ** 7, max_concurrent=1)
+        cancel = threading.Event()
+        results = []
+
+        def hedge():
+            with scheduler.acquire(Priority.NORMAL, cancel=cancel) as admitted:
+                results.append(admitted)
+
+        with scheduler.acquire(Priority.NORMAL):
+            waiter = threading.Thread(target=hedge)
+            waiter.start()
+            while scheduler.get_metrics()["queue_depth"] < 1:
+                time.sleep(0.001)
+            cancel.set()
+            waiter.join(2)
+
+            assert results == [False]
+            assert scheduler.get_metrics()["queue_depth"] == 0
+
+    def test_request_bucket_throttles(self):
+        """Test calls wait for the requests-per-minute bucket to refill"""
+        scheduler = LLMScheduler(requests_per_minute=600, tokens_per_minute=10 ** 7)
+        scheduler._requests.available = 0
+
+        started = time.monotonic()
+        with scheduler.acquire(Priority.NORMAL):
+            pass
+
+        assert time.monotonic() - started >= 0.09
+
+    def test_rate_limit_errors_detected(self):
+        """Test 429 responses are recognized"""
+        assert is_rate_limit_error(RuntimeError("429 RESOURCE_EXHAUSTED"))
+        assert not is_rate_limit_error(ValueError("bad json"))
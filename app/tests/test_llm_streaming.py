@@ -0,0 +1,74 @@
+import pytest
+import asyncio
+import threading
+from app.utils.llm_streaming import IncrementalJSONSections, format_sse, stream_on_executor
+
+
+class TestIncrementalJSONSections:
+    """Test cases for IncrementalJSONSections"""
+
+    def test_sections_reported_as_they_complete(self):
+        """Test top-level members are emitted once their value closes"""
+        text = 'Here you go: {"current_level": "mid", "gaps": [{"skill": "a,b}"}], "score": 72}'
+        scanner = IncrementalJSONSections()
+
+        emitted = []
+        for i in range(0, len(text), 7):
+            emitted.append(scanner.feed(text[i:i + 7]))
+
+        names = [name for chunk in emitted for name, _ in chunk]
+        assert names == ["current_level", "gaps", "score"]
+        assert dict(pair for chunk in emitted for pair in chunk)["gaps"] == [{"skill": "a,b}"}]
+
+    def test_incomplete_member_not_reported(self):
+        """Test a member is held back until it is complete"""
+        scanner = IncrementalJSONSections()
+
+        assert scanner.feed('{"summary": "still wri') == []
+        assert scanner.feed('ting", ') == [("summary", "still writing")]
+
+    def test_format_sse(self):
+        """Test Server-Sent Events framing"""
+        assert format_sse("section", {"name": "score"}) == 'event: section\ndata: {"name": "score"}\n\n'
+
+
+class TestStreamOnExecutor:
+    """Test cases for stream_on_executor"""
+
+    def test_generation_runs_ahead_of_a_slow_reader(self):
+        """Test the generator finishes on an agent worker before the client reads its frames"""
+        finished = threading.Event()
+        threads = []
+
+        def frames():
+            threads.append(threading.current_thread().name)
+            yield "a"
+            yield "b"
+            finished.set()
+
+        async def read():
+            relay = stream_on_executor(frames())
+            first = await relay.__anext__()
+            generated = finished.wait(1)
+            return generated, [first] + [frame async for frame in relay]
+
+        generated, received = asyncio.run(read())
+
+        assert generated is True
+        assert received == ["a", "b"]
+        assert threads[0].startswith("agent-worker")
+
+    def test_generator_error_is_raised_to_the_reader(self):
+        """Test an exception from the generator surfaces after its frames"""
+        def frames():
+            yield "a"
+            raise RuntimeError("stream broke")
+
+        async def read():
+            received = []
+            with pytest.raises(RuntimeError, match="stream broke"):
+                async for frame in stream_on_executor(frames()):
+                    received.append(frame)
+            return received
+
+        assert asyncio.run(read()) == ["a"]
@@ -0,0 +1,108 @@
+import pytest
+from unittest.mock import Mock
+from app.utils import llm_runtime
+from app.utils.llm_provider import set_llm_provider
+from app.utils.model_router import ModelRouter
+from app.models.llm_responses import AnswerEvaluationResponse
+from app.tests.stubs import StubLLMProvider
+
+
+class TestModelRouter:
+    """Test cases for model tier routing and escalation"""
+
+    @pytest.fixture
+    def router(self, monkeypatch):
+        router = ModelRouter(light_max_tokens=100)
+        monkeypatch.setattr(llm_runtime, "get_model_router", lambda: router)
+        return router
+
+    @pytest.fixture
+    def provider(self):
+        provider = StubLLMProvider()
+        set_llm_provider(provider)
+        yield provider
+        set_llm_provider(None)
+
+    def _owner(self):
+        owner = Mock()
+        owner.cache_ttl_seconds = 0
+        owner.llm.model = "gemini-1.5-flash"
+        owner.llm.temperature = 0.1
+        owner.agent.role = "Senior Technical Interviewer"
+        return owner
+
+    def test_rules_and_prompt_size(self, router, monkeypatch):
+        """Test configured tiers, auto routing by prompt size and env overrides"""
+        assert router.select("extract_job_requirements", 5000) == "light"
+        assert router.select("evaluate_answer", 50) == "light"
+        assert router.select("evaluate_answer", 500) == "standard"
+        assert router.select("unknown_task", 50) == "standard"
+
+        monkeypatch.setenv("LLM_ROUTE_EXTRACT_JOB_REQUIREMENTS", "strong")
+        assert router.select("extract_job_requirements", 50) == "strong"
+
+    def test_routed_call_uses_tier_model(self, router, provider):
+        """Test a short evaluation goes to the light model and is recorded"""
+        provider.response = '{"score": 7}'
+
+        llm_runtime.execute_agent_task(self._owner(), Mock(description="Short answer"),
+                                       response_model=AnswerEvaluationResponse, route="evaluate_answer")
+
+        assert provider.models == ["gemini-1.5-flash-8b"]
+        stats = router.get_stats()["evaluate_answer:light"]
+        assert stats["calls"] == 1
+        assert stats["rejected"] == 0
+        assert stats["prompt_tokens"] > 0
+
+    def test_invalid_output_escalates(self, router, provider):
+        """Test output failing validation is retried on the next tier"""
+        provider.response = {"gemini-1.5-flash-8b": "I am not sure", "gemini-1.5-flash": '{"score": 4}'}
+
+        result = llm_runtime.execute_agent_task(self._owner(), Mock(description="Short answer"),
+                                                response_model=AnswerEvaluationResponse, route="evaluate_answer")
+
+        assert result == '{"score": 4}'
+        assert provider.models == ["gemini-1.5-flash-8b", "gemini-1.5-flash"]
+        assert router.get_stats()["evaluate_answer:light"]["rejected"] == 1
+
+    @pytest.mark.parametrize("light_output", [
+        '{}',
+        '{"evaluation": {"score": 9}}',
+        '{"score": 7, "technical_accuracy": 42}'
+    ])
+    def test_empty_nested_or_repaired_output_escalates(self, router, provider, light_output):
+        """Test output missing required fields, or valid only after dropping fields, escalates"""
+        provider.response = {"gemini-1.5-flash-8b": light_output, "gemini-1.5-flash": '{"score": 4}'}
+
+        result = llm_runtime.execute_agent_task(self._owner(), Mock(description=f"Answer {light_output}"),
+                                                response_model=AnswerEvaluationResponse, route="evaluate_answer")
+
+        assert result == '{"score": 4}'
+        assert provider.models == ["gemini-1.5-flash-8b", "gemini-1.5-flash"]
+
+    def test_escalation_limit(self, router, provider):
+        """Test escalation stops after max_escalations and returns the last output"""
+        provider.response = "no json here"
+
+        result = llm_runtime.execute_agent_task(self._owner(), Mock(description="Short answer"),
+                                                response_model=AnswerEvaluationResponse, route="evaluate_answer")
+
+        assert result == "no json here"
+        assert len(provider.models) == 2
+
+    def test_unknown_model_family_is_not_rerouted(self, router):
+        """Test agents on models without tiers keep their model"""
+        owner = self._owner()
+        owner.llm.model = "claude-instant"
+
+        assert router.bind(owner, "light") is owner
+        assert router.default_model("resume_analysis", "openai") == "gpt-4"
+
+    def test_crew_agent_routes_only_pick_the_construction_model(self, router, monkeypatch):
+        """Test crew agent routes resolve to one fixed model (auto means standard)"""
+        monkeypatch.setenv("LLM_ROUTE_FINAL_SCORING", "light")
+        monkeypatch.setenv("LLM_ROUTE_INTERVIEW_EVALUATION", "auto")
+
+        assert router.default_model("final_scoring", "openai") == "gpt-4o-mini"
+        assert router.default_model("interview_evaluation", "openai") == "gpt-4"
+        assert router.get_stats() == {}
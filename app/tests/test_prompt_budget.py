@@ -0,0 +1,60 @@
+from app.utils.prompt_budget import PromptSizeMeter, compact_interview_data, compact_json, truncate_to_budget
+
+
+class TestPromptBudget:
+    """Test cases for prompt compaction helpers"""
+
+    def test_truncate_keeps_head_and_tail(self):
+        """Test overlong text is cut to its budget around an omission marker"""
+        text = "start " + "filler " * 2000 + "end"
+
+        truncated = truncate_to_budget(text, 100)
+
+        assert truncated.startswith("start")
+        assert truncated.endswith("end")
+        assert "characters omitted" in truncated
+        assert len(truncated) < 500
+
+    def test_short_text_only_normalized(self):
+        """Test text within budget only has whitespace collapsed"""
+        assert truncate_to_budget("  a   b \n\n\n\n c  ", 100) == "a b\n\nc"
+
+    def test_compact_json_drops_empty_values(self):
+        """Test compact serialization drops empty fields and indentation"""
+        assert compact_json({"a": 1, "b": None, "c": [], "d": {"e": ""}, "f": " x  y "}) == '{"a":1,"f":"x y"}'
+
+    def test_interview_data_dedupes_questions(self):
+        """Test answers reference questions by id and evaluations are stripped"""
+        question = {"id": 1, "question": "Explain indexes", "type": "technical", "hint": "B-trees",
+                    "evaluation_criteria": ["depth"]}
+        interview_data = {
+            "round_number": 1,
+            "questions": [question],
+            "answers": [{
+                "question_id": "1",
+                "question": question,
+                "answer": "word " * 5000,
+                "evaluation": {"score": 6, "detailed_feedback": "long text", "weaknesses": ["vague"]}
+            }],
+            "profession": "Software Engineer"
+        }
+
+        compact = compact_interview_data(interview_data, max_tokens=200)
+
+        assert len(compact["questions"]) == 1
+        assert "hint" not in compact["questions"][0]
+        answer = compact["answers"][0]
+        assert "question" not in answer
+        assert answer["evaluation"] == {"score": 6, "weaknesses": ["vague"]}
+        assert len(answer["answer"]) < 1000
+        assert len(compact_json(compact)) < len(str(interview_data)) // 5
+
+    def test_meter_records_prompt_sizes(self):
+        """Test prompt sizes are aggregated per agent"""
+        meter = PromptSizeMeter()
+        meter.record("Agent", "x" * 400)
+        meter.record("Agent", "x" * 800)
+
+        stats = meter.get_stats()["Agent"]
+        assert stats["calls"] == 2
+        assert stats["max_prompt_tokens"] == 201
@@ -0,0 +1,128 @@
+import pytest
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+from app.utils.question_bank import QuestionBank
+from app.tests.stubs import stub_question_generator
+
+
+class TestQuestionBank:
+    """Test cases for QuestionBank"""
+
+    _generator = staticmethod(stub_question_generator)
+
+    @pytest.fixture
+    def bank(self):
+        """Create a small bank backed by a fake generator"""
+        generator = Mock(side_effect=self._generator)
+        bank = QuestionBank(generator, round_size=4, low_water_mark=0)
+        return bank
+
+    def test_cold_miss_generates_live(self, bank):
+        """Test the first round is generated and flagged as live"""
+        round_data = bank.assemble_round("Software Engineer", "junior", None, "mixed")
+
+        assert round_data["source"] == "live"
+        assert [q["id"] for q in round_data["questions"]] == [1, 2, 3, 4]
+        assert round_data["interview_structure"]["total_questions"] == 4
+        assert bank.generator.call_count == 1
+
+    def test_cold_rounds_share_an_in_flight_fill(self):
+        """Test concurrent cold misses for one key wait on a single generation"""
+        release = threading.Event()
+
+        def slow_generator(*args, **kwargs):
+            release.wait(1)
+            return self._generator(*args, **kwargs)
+
+        generator = Mock(side_effect=slow_generator)
+        bank = QuestionBank(generator, round_size=2, low_water_mark=0)
+        rounds = []
+        threads = [threading.Thread(target=lambda: rounds.append(bank.assemble_round("Engineer", "junior")))
+                   for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert generator.call_count == 1
+        assert sorted(q["question"] for r in rounds for q in r["questions"]) == [
+            f"general question {i}" for i in range(1, 5)
+        ]
+
+    def test_cold_round_refills_stock_drained_by_a_concurrent_round(self, bank):
+        """Test a round whose fresh stock is taken by another round before its take is refilled, not short"""
+        fill = bank._shared_fill
+        key = QuestionBank.make_key("Software Engineer", "junior", "mixed", None)
+
+        def fill_then_lose_stock(fill_key, background=False):
+            added = fill(fill_key, background)
+            if bank.generator.call_count == 1:
+                bank._take_round([key], [3])
+            return added
+
+        bank._shared_fill = fill_then_lose_stock
+        round_data = bank.assemble_round("Software Engineer", "junior")
+
+        assert len(round_data["questions"]) == 4
+        assert bank.generator.call_count == 2
+
+    def test_partial_stock_is_not_taken(self, bank):
+        """Test a round short on any key takes nothing from stock"""
+        key = QuestionBank.make_key("Software Engineer", "junior", "mixed", None)
+        bank._fill(key)
+        bank._take_round([key], [2])
+
+        assert bank._take_round([key], [4], complete=True) is None
+        assert bank.depth(key) == 2
+
+    def test_stocked_round_served_from_bank(self, bank):
+        """Test rounds are assembled without generation when stocked"""
+        key = QuestionBank.make_key("Software Engineer", "junior", "mixed", None)
+        bank._fill(key)
+        bank.generator.reset_mock()
+
+        round_data = asyncio.run(bank.aassemble_round("software engineer", "Junior", None, "mixed"))
+
+        assert round_data["source"] == "bank"
+        assert len(round_data["questions"]) == 4
+        bank.generator.assert_not_called()
+        assert bank.depth(key) == 0
+
+    def test_round_split_across_focus_areas(self, bank):
+        """Test each focus area gets its share of the round"""
+        round_data = bank.assemble_round("Software Engineer", "junior", ["SQL", "APIs"], "mixed")
+
+        areas = [q["focus_area"] for q in round_data["questions"]]
+        assert areas.count("sql") == 2
+        assert areas.count("apis") == 2
+
+    def test_top_up_runs_as_background_work(self, bank):
+        """Test top-ups run on the background executor and ask for background generation"""
+        key = QuestionBank.make_key("Software Engineer", "junior", "mixed", None)
+        bank.low_water_mark = 1
+        threads = []
+        bank.generator.side_effect = lambda *args, **kwargs: (
+            threads.append(threading.current_thread().name), self._generator(*args, **kwargs)
+        )[1]
+
+        assert bank.schedule_top_up(key) is True
+        for _ in range(200):
+            if bank.depth(key):
+                break
+            time.sleep(0.01)
+
+        assert threads and threads[0].startswith("background-worker")
+        assert bank.generator.call_args.kwargs["background"] is True
+
+    def test_refill_excludes_recent_questions(self, bank):
+        """Test new batches are asked not to repeat stocked questions"""
+        key = QuestionBank.make_key("Software Engineer", "junior", "mixed", None)
+        bank._fill(key)
+        bank._fill(key)
+
+        assert bank.generator.call_args.kwargs["exclude_questions"]
+        assert bank.depth(key) == 8
@@ -0,0 +1,67 @@
+import pytest
+import asyncio
+import time
+from unittest.mock import Mock
+from app.utils.question_bank import QuestionBank
+from app.utils.round_prefetcher import RoundPrefetcher
+from app.tests.stubs import stub_question_generator
+
+
+class TestRoundPrefetcher:
+    """Test cases for RoundPrefetcher"""
+
+    @pytest.fixture
+    def prefetcher(self):
+        """Create a prefetcher backed by a fake round assembler"""
+        assemble = Mock(return_value={"questions": [{"id": 1, "question": "Q"}], "source": "bank"})
+        return RoundPrefetcher(assemble)
+
+    def test_matching_start_uses_prefetched_round(self, prefetcher):
+        """Test the next start call gets the prefetched round"""
+        assert prefetcher.schedule("s1", "Software Engineer", "junior", ["SQL", "APIs"])
+
+        round_data = asyncio.run(prefetcher.atake("s1", ["apis", "sql"], "Mixed"))
+
+        assert round_data["source"] == "prefetched"
+        assert round_data["questions"][0]["question"] == "Q"
+        prefetcher.assemble.assert_called_once_with("Software Engineer", "junior", ["SQL", "APIs"], "mixed",
+                                                    background=True)
+        assert prefetcher.get_stats()["hits"] == 1
+        assert asyncio.run(prefetcher.atake("s1", ["SQL", "APIs"])) is None
+
+    def test_different_settings_invalidate(self, prefetcher):
+        """Test different focus areas or difficulty discard the prefetched round"""
+        prefetcher.schedule("s1", "Software Engineer", "junior", ["SQL"])
+        assert asyncio.run(prefetcher.atake("s1", ["Kubernetes"])) is None
+
+        prefetcher.schedule("s2", "Software Engineer", "junior", ["SQL"])
+        assert asyncio.run(prefetcher.atake("s2", ["SQL"], "hard")) is None
+
+        assert prefetcher.get_stats()["invalidated"] == 2
+
+    def test_invalidated_prefetch_returns_its_stock(self):
+        """Test a prefetch discarded after it finished hands its questions back to the bank"""
+        bank = QuestionBank(Mock(side_effect=stub_question_generator), round_size=4, low_water_mark=0)
+        key = QuestionBank.make_key("Software Engineer", "junior", "mixed", None)
+        bank._fill(key)
+        prefetcher = RoundPrefetcher(bank.assemble_round, restock=bank.restock)
+
+        prefetcher.schedule("s1", "Software Engineer", "junior", None)
+        for _ in range(200):
+            if bank.depth(key) == 0:
+                break
+            time.sleep(0.01)
+        assert asyncio.run(prefetcher.atake("s1", ["Kubernetes"])) is None
+
+        assert bank.depth(key) == 4
+        assert [q["question"] for q in bank._stock[key]] == [f"general question {i}" for i in range(1, 5)]
+        assert prefetcher.get_stats()["restocked"] == 1
+        assert bank.get_stats()["questions_restocked"] == 4
+
+    def test_failed_prefetch_falls_back(self, prefetcher):
+        """Test a failed prefetch is reported as a miss to the caller"""
+        prefetcher.assemble.side_effect = RuntimeError("boom")
+        prefetcher.schedule("s1", "Software Engineer", "junior", None)
+
+        assert asyncio.run(prefetcher.atake("s1", None)) is None
+        assert prefetcher.get_stats()["failed"] == 1
@@ -0,0 +1,70 @@
+from app.models.session import InterviewRound
+from app.utils.round_scorer import RoundScoreAggregator
+
+
+class TestRoundScoreAggregator:
+    """Test cases for RoundScoreAggregator"""
+
+    @staticmethod
+    def _evaluation(score, technical=None, clarity=None, depth=None):
+        return {
+            "score": score,
+            "technical_accuracy": technical if technical is not None else score,
+            "clarity_of_explanation": clarity if clarity is not None else score,
+            "depth_of_knowledge": depth if depth is not None else score,
+            "improvement_suggestions": ["Practice joins"]
+        }
+
+    def test_scores_aggregate_incrementally(self):
+        """Test overall and category scores follow each added evaluation"""
+        scorer = RoundScoreAggregator(total_questions=2)
+        scorer.add("1", {"focus_area": "SQL", "type": "technical"}, self._evaluation(8, clarity=6))
+        assert scorer.summary()["overall_score"] == 40.0
+
+        scorer.add("2", {"focus_area": "APIs", "type": "problem_solving"}, self._evaluation(10))
+        summary = scorer.summary()
+
+        assert summary["overall_score"] == 90.0
+        assert summary["performance_level"] == "excellent"
+        assert summary["category_scores"]["technical_knowledge"] == 90.0
+        assert summary["category_scores"]["communication"] == 80.0
+        assert summary["category_scores"]["problem_solving"] == 100.0
+        assert summary["answered_questions"] == 2
+
+    def test_weak_topics_from_low_scores(self):
+        """Test topics averaging below the threshold are reported weakest first"""
+        scorer = RoundScoreAggregator(total_questions=3)
+        scorer.add("1", {"focus_area": "SQL"}, self._evaluation(6))
+        scorer.add("2", {"focus_area": "Caching"}, self._evaluation(3))
+        scorer.add("3", {"focus_area": "APIs"}, self._evaluation(9))
+
+        weak_topics = scorer.summary()["weak_topics"]
+
+        assert [t["topic"] for t in weak_topics] == ["Caching", "SQL"]
+        assert weak_topics[0]["priority"] == "critical"
+        assert weak_topics[0]["practice_recommendations"] == ["Practice joins"]
+
+    def test_reanswer_replaces_evaluation(self):
+        """Test a question's later evaluation replaces the earlier one"""
+        scorer = RoundScoreAggregator(total_questions=1)
+        scorer.add("1", {}, self._evaluation(2))
+        scorer.add("1", {}, {"score": "10"})
+
+        summary = scorer.summary()
+        assert summary["overall_score"] == 100.0
+        assert summary["answered_questions"] == 1
+
+    def test_add_round_skips_pending_answers(self):
+        """Test deferred answers without an evaluation are not scored"""
+        interview_round = InterviewRound(
+            round_id="r1", round_number=1,
+            questions=[{"id": 1}, {"id": 2}],
+            answers=[
+                {"question_id": "1", "question": {"id": 1}, "answer": "a", "evaluation": self._evaluation(10)},
+                {"question_id": "2", "question": {"id": 2}, "answer": "b", "evaluation": None}
+            ]
+        )
+        scorer = RoundScoreAggregator(total_questions=2)
+        scorer.add_round(interview_round)
+
+        assert scorer.summary()["overall_score"] == 50.0
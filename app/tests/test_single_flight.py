@@ -0,0 +1,101 @@
+import threading
+import time
+from unittest.mock import Mock
+from app.utils import llm_runtime
+from app.utils.llm_provider import set_llm_provider
+from app.utils.llm_clients import AgentTask
+from app.utils.single_flight import SingleFlight
+from app.tests.stubs import StubLLMProvider
+
+
+class TestSingleFlight:
+    """Test cases for coalescing identical in-flight calls"""
+
+    def test_concurrent_calls_share_one_execution(self):
+        """Test callers with the same key wait for the first caller's result"""
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def work():
+            calls.append(1)
+            release.wait(1)
+            return "result"
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(flight.do("k", work, "JobMatchAnalyzerAgent")))
+                   for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        while flight.get_stats()["coalesced"] < 3:
+            time.sleep(0.01)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert sorted(shared for _, shared in results) == [False, True, True, True]
+        assert {result for result, _ in results} == {"result"}
+        stats = flight.get_stats()
+        assert stats["namespaces"]["JobMatchAnalyzerAgent"] == {"executions": 1, "coalesced": 3}
+        assert stats["in_flight"] == 0
+
+    def test_errors_are_shared_and_not_remembered(self):
+        """Test waiters get the leader's exception and the next call runs again"""
+        flight = SingleFlight()
+        started, release = threading.Event(), threading.Event()
+
+        def failing():
+            started.set()
+            release.wait(1)
+            raise ValueError("boom")
+
+        errors = []
+
+        def call():
+            try:
+                flight.do("k", failing)
+            except ValueError as e:
+                errors.append(e)
+
+        leader = threading.Thread(target=call)
+        leader.start()
+        started.wait(1)
+        follower = threading.Thread(target=call)
+        follower.start()
+        while flight.get_stats()["coalesced"] < 1:
+            time.sleep(0.01)
+        release.set()
+        leader.join()
+        follower.join()
+
+        assert len(errors) == 2
+        assert flight.do("k", lambda: "ok") == ("ok", False)
+
+    def test_identical_agent_calls_reach_provider_once(self, monkeypatch):
+        """Test concurrent identical prompts make a single provider call even without caching"""
+        monkeypatch.setattr(llm_runtime, "get_single_flight", lambda: flight)
+        flight = SingleFlight()
+        provider = StubLLMProvider()
+        original = provider.complete
+        provider.complete = lambda *args: time.sleep(0.1) or original(*args)
+        set_llm_provider(provider)
+        try:
+            owner = Mock()
+            owner.cache_ttl_seconds = 0
+            owner.llm.model = "gemini-1.5-flash"
+            owner.llm.temperature = 0.1
+            owner.agent.role = "Senior Talent Acquisition Specialist"
+            task = AgentTask(description="Extract requirements", expected_output="JSON", agent=owner.agent)
+
+            threads = [threading.Thread(target=llm_runtime.execute_agent_task, args=(owner, task))
+                       for _ in range(3)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            set_llm_provider(None)
+
+        assert len(provider.calls) == 1
+        assert flight.get_stats()["coalesced"] == 2
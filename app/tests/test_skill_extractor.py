@@ -0,0 +1,48 @@
+from app.utils.skill_extractor import AhoCorasick, SkillExtractor, relevant_excerpts
+
+
+class TestSkillExtractor:
+    """Test cases for local CV skill tagging"""
+
+    CV = """Jane Doe
+Senior Software Engineer
+Summary: 7 years of experience building Python services.
+Acme Corp, Backend Engineer, 2018 - 2024
+- Built REST APIs with FastAPI and PostgreSQL; 5 years with Django
+- Deployed on AWS with Docker and k8s
+Hobbies: hiking, chess and photography
+Certifications: AWS Certified Solutions Architect, CKA
+"""
+
+    def test_aho_corasick_finds_overlapping_patterns(self):
+        """Test every occurrence of every pattern is reported in one pass"""
+        matcher = AhoCorasick({"he": 1, "she": 2, "hers": 3})
+
+        assert sorted(matcher.finditer("ushers")) == [(1, 4, 2), (2, 4, 1), (2, 6, 3)]
+
+    def test_extracts_skills_years_and_certifications(self):
+        """Test aliases map to canonical names and years attach to skills on the same line"""
+        profile = SkillExtractor().extract(self.CV)
+        skills = {skill["name"]: skill for skill in profile["skills"]}
+
+        assert {"Python", "FastAPI", "PostgreSQL", "Django", "AWS", "Docker", "Kubernetes"} <= set(skills)
+        assert skills["Python"]["years"] == 7
+        assert skills["Django"]["years"] == 5
+        assert [cert["name"] for cert in profile["certifications"]] == [
+            "AWS Certified Solutions Architect", "Certified Kubernetes Administrator"
+        ]
+        assert profile["total_years"] == 7
+
+    def test_matches_respect_word_boundaries(self):
+        """Test aliases inside other words are not matched"""
+        profile = SkillExtractor().extract("Managed gardens and ran a jsonify-free kitchen")
+
+        assert profile["skills"] == []
+
+    def test_excerpts_drop_unrelated_lines(self):
+        """Test relevant excerpts keep tagged lines and skip the rest"""
+        profile = SkillExtractor().extract(self.CV)
+        excerpts = relevant_excerpts(self.CV, profile["lines"], max_tokens=500, head_lines=2)
+
+        assert "FastAPI" in excerpts
+        assert "Hobbies" not in excerpts
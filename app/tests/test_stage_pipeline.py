@@ -0,0 +1,103 @@
+import pytest
+import threading
+import time
+from app.utils.stage_pipeline import Stage, StagePipeline
+
+
+class TestStagePipeline:
+    """Test cases for the staged pipeline executor"""
+
+    @staticmethod
+    def _sleeping(delay, fn):
+        def stage(value):
+            time.sleep(delay)
+            return fn(value)
+        return stage
+
+    def test_stages_overlap_across_items(self):
+        """Test a batch takes about as long as its slowest stage, not the sum of all stages"""
+        pipeline = StagePipeline([
+            Stage("first", self._sleeping(0.05, lambda value: value + 1)),
+            Stage("second", self._sleeping(0.05, lambda value: value * 10)),
+            Stage("third", self._sleeping(0.05, str))
+        ])
+
+        started = time.perf_counter()
+        results = list(pipeline.run(range(6)))
+        elapsed = time.perf_counter() - started
+
+        assert sorted(result for _, result, _ in results) == sorted(str((n + 1) * 10) for n in range(6))
+        assert elapsed < 6 * 3 * 0.05 * 0.75
+        assert pipeline.get_stats()["stages"]["second"]["processed"] == 6
+
+    def test_failed_item_skips_later_stages(self):
+        """Test an item whose stage raises is reported with its error and later stages skip it"""
+        seen = []
+
+        def check(value):
+            if value == 2:
+                raise ValueError("bad item")
+            return value
+
+        pipeline = StagePipeline([Stage("check", check), Stage("record", lambda value: seen.append(value) or value)])
+
+        results = {item: (result, error) for item, result, error in pipeline.run([1, 2, 3])}
+
+        assert isinstance(results[2][1], ValueError)
+        assert results[1] == (1, None)
+        assert sorted(seen) == [1, 3]
+        assert pipeline.get_stats()["stages"]["check"]["failed"] == 1
+
+    def test_max_in_flight_bounds_admission(self):
+        """Test no more than max_in_flight items are inside the pipeline at once"""
+        lock = threading.Lock()
+        active, peak = [0], [0]
+
+        def enter(value):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            return value
+
+        def leave(value):
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+            return value
+
+        pipeline = StagePipeline([Stage("enter", enter, workers=4), Stage("leave", leave, workers=4)],
+                                 max_in_flight=3)
+
+        assert len(list(pipeline.run(range(20)))) == 20
+        assert peak[0] <= 3
+
+    def test_input_error_is_raised_after_admitted_items(self):
+        """Test an exception from the input iterable surfaces once admitted items finish"""
+        def items():
+            yield 1
+            raise RuntimeError("input broke")
+
+        pipeline = StagePipeline([Stage("identity", lambda value: value)])
+        results = []
+
+        with pytest.raises(RuntimeError, match="input broke"):
+            for item, _, _ in pipeline.run(items()):
+                results.append(item)
+
+        assert results == [1]
+
+    def test_closing_mid_batch_stops_the_threads(self):
+        """Test threads blocked on full queues exit once the consumer closes the run"""
+        pipeline = StagePipeline([
+            Stage("fast", lambda value: value, queue_size=1),
+            Stage("slow", self._sleeping(0.01, lambda value: value), queue_size=1)
+        ])
+
+        run = pipeline.run(range(1000))
+        next(run)
+        run.close()
+
+        deadline = time.monotonic() + 5
+        while any(thread.name.startswith("pipeline-") for thread in threading.enumerate()):
+            assert time.monotonic() < deadline, "pipeline threads still running after close"
+            time.sleep(0.01)
@@ -0,0 +1,65 @@
+import pytest
+import sys
+import types
+from unittest.mock import Mock
+from app.utils.vector_index import CandidateIndex, HashingTextEmbedder, OnnxTextEmbedder, VectorIndex
+
+
+class TestVectorIndex:
+    """Test cases for the candidate vector index"""
+
+    def test_index_grows_and_replaces_entries(self):
+        """Test adds past the initial capacity keep every vector and re-adding a key replaces it"""
+        index = VectorIndex(dimensions=2, initial_capacity=1)
+        index.add("a", [1.0, 0.0])
+        index.add("b", [0.0, 1.0])
+        index.add("a", [0.0, 1.0], {"version": 2})
+
+        matches = index.search([0.0, 1.0], top_n=2)
+
+        assert len(index) == 2
+        assert {key for key, _, _ in matches} == {"a", "b"}
+        assert all(score == pytest.approx(1.0) for _, score, _ in matches)
+        assert dict((key, metadata) for key, _, metadata in matches)["a"] == {"version": 2}
+
+    def test_remove_moves_last_row(self):
+        """Test removing a key keeps the remaining keys searchable"""
+        index = VectorIndex(dimensions=2)
+        index.add("a", [1.0, 0.0])
+        index.add("b", [0.0, 1.0])
+
+        assert index.remove("a")
+        assert not index.remove("a")
+        assert [key for key, _, _ in index.search([0.0, 1.0], top_n=5)] == ["b"]
+
+    def test_candidate_search_ranks_matching_cvs(self):
+        """Test the best-matching CV ranks first and repeated queries reuse the embedding"""
+        candidates = CandidateIndex(HashingTextEmbedder(dimensions=256))
+        candidates.add("backend", "Backend engineer Python FastAPI PostgreSQL Docker", {"analysis_id": "1"})
+        candidates.add("design", "Product designer Figma user research prototyping", {"analysis_id": "2"})
+
+        job = "Senior backend engineer: Python, FastAPI and PostgreSQL"
+        first = candidates.search(job, top_n=2)
+        candidates.search(job, top_n=2)
+
+        assert [match["user_id"] for match in first] == ["backend", "design"]
+        assert first[0]["analysis_id"] == "1"
+        assert first[0]["similarity"] > first[1]["similarity"]
+        assert candidates.get_stats()["query_cache_hits"] == 1
+
+    def test_onnx_embedder_falls_back_when_the_model_cannot_load(self, monkeypatch):
+        """Test a failed first ONNX call (model download) switches to hashing embeddings"""
+        model = Mock(side_effect=OSError("model download failed"))
+        functions = types.ModuleType("chromadb.utils.embedding_functions")
+        functions.ONNXMiniLM_L6_V2 = Mock(return_value=model)
+        monkeypatch.setitem(sys.modules, "chromadb", types.ModuleType("chromadb"))
+        monkeypatch.setitem(sys.modules, "chromadb.utils", types.ModuleType("chromadb.utils"))
+        monkeypatch.setitem(sys.modules, "chromadb.utils.embedding_functions", functions)
+
+        embedder = OnnxTextEmbedder()
+        vectors = embedder.embed(["Python developer", "Product designer"])
+        embedder.embed(["Data engineer"])
+
+        assert vectors.shape == (2, 384)
+        assert embedder.name == "hashing"
+        assert model.call_count == 1
@@ -0,0 +1,146 @@
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+
+class AgentExecutorSaturated(RuntimeError):
+    """Raised when the agent executor queue is full and cannot accept more work"""
+
+
+class AgentExecutor:
+    """Bounded thread pool that runs blocking agent calls off the event loop"""
+
+    def __init__(self, max_workers: int = 4, max_queue_size: int = 100,
+                 thread_name_prefix: str = "agent-worker"):
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+        self._lock = threading.Lock()
+
+        # Metrics
+        self._queued = 0
+        self._running = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._total_wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+        self._total_run_seconds = 0.0
+
+    def submit(self, fn: Callable[..., Any], *args, **kwargs) -> Future:
+        """
+        Submit a blocking callable to the pool
+
+        Raises:
+            AgentExecutorSaturated: If the number of queued calls has reached max_queue_size
+        """
+        with self._lock:
+            if self._queued >= self.max_queue_size:
+                self._rejected += 1
+                raise AgentExecutorSaturated(
+                    f"Agent executor queue is full ({self._queued} calls waiting)"
+                )
+            self._queued += 1
+            self._submitted += 1
+
+        enqueued_at = time.perf_counter()
+        return self._pool.submit(self._run, enqueued_at, fn, args, kwargs)
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking callable on the pool and await its result"""
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    def _run(self, enqueued_at: float, fn: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+        started_at = time.perf_counter()
+        wait_seconds = started_at - enqueued_at
+
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+            self._total_wait_seconds += wait_seconds
+            self._max_wait_seconds = max(self._max_wait_seconds, wait_seconds)
+
+        failed = False
+        try:
+            return fn(*args, **kwargs)
+        except Exception:
+            failed = True
+            raise
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._completed += 1
+                if failed:
+                    self._failed += 1
+                self._total_run_seconds += time.perf_counter() - started_at
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get a snapshot of queue depth and wait-time metrics"""
+        with self._lock:
+            completed = self._completed
+            started = completed + self._running
+            return {
+                "max_workers": self.max_workers,
+                "max_queue_size": self.max_queue_size,
+                "queue_depth": self._queued,
+                "running": self._running,
+                "submitted": self._submitted,
+                "completed": completed,
+                "failed": self._failed,
+                "rejected": self._rejected,
+                "avg_wait_seconds": self._total_wait_seconds / started if started else 0.0,
+                "max_wait_seconds": self._max_wait_seconds,
+                "avg_run_seconds": self._total_run_seconds / completed if completed else 0.0
+            }
+
+    def shutdown(self, wait: bool = True):
+        """Shut down the underlying thread pool"""
+        self._pool.shutdown(wait=wait)
+
+
+_executor: Optional[AgentExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_agent_executor() -> AgentExecutor:
+    """Get or initialize the process-wide agent executor"""
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = AgentExecutor(
+                    max_workers=int(os.getenv("AGENT_EXECUTOR_WORKERS", "4")),
+                    max_queue_size=int(os.getenv("AGENT_EXECUTOR_MAX_QUEUE", "100"))
+                )
+
+    return _executor
+
+
+_background_executor: Optional[AgentExecutor] = None
+_background_executor_lock = threading.Lock()
+
+
+def get_background_executor() -> AgentExecutor:
+    """
+    Get or initialize the executor for speculative and deferred work
+
+    Question bank top-ups, round prefetches and deferred answer flushes run here so they
+    never occupy the interactive executor's workers.
+    """
+    global _background_executor
+
+    if _background_executor is None:
+        with _background_executor_lock:
+            if _background_executor is None:
+                _background_executor = AgentExecutor(
+                    max_workers=int(os.getenv("BACKGROUND_EXECUTOR_WORKERS", "2")),
+                    max_queue_size=int(os.getenv("BACKGROUND_EXECUTOR_MAX_QUEUE", "100")),
+                    thread_name_prefix="background-worker"
+                )
+
+    return _background_executor
@@ -0,0 +1,153 @@
+import threading
+from typing import Any, Callable, Dict, List
+
+from .agent_executor import AgentExecutorSaturated, get_background_executor
+from .degraded_fallbacks import heuristic_answer_evaluation
+from .llm_runtime import mark_degraded
+from .llm_scheduler import Priority
+
+
+class DeferredAnswerEvaluator:
+    """
+    Evaluates stored round answers in packed multi-answer prompts
+
+    Answers submitted in deferred mode are stored with ``evaluation`` set to None.
+    They are evaluated on the background executor once ``batch_size`` are pending, at
+    background LLM priority, and any remainder is flushed when the round completes. Evaluations are written back into
+    the same answer dicts, so ``InterviewRound.answers`` keeps its usual shape.
+
+    Answers a packed call fails on or leaves out are retried once, split into two smaller
+    packs; whatever is still missing gets the rule-based heuristic evaluation rather than
+    one LLM call per answer.
+    """
+
+    def __init__(self, batch_evaluate: Callable[..., Dict[str, Dict[str, Any]]],
+                 batch_size: int = 5, pack_size: int = 10):
+        """
+        Args:
+            batch_evaluate: Callable with the signature of
+                InteractiveInterviewerAgent.evaluate_answers_batch
+            batch_size: Pending answers that trigger a background flush
+            pack_size: Maximum answers per packed prompt
+        """
+        self.batch_evaluate = batch_evaluate
+        self.batch_size = batch_size
+        self.pack_size = pack_size
+
+        self._round_locks: Dict[str, threading.Lock] = {}
+        self._scheduled: set = set()
+        self._lock = threading.Lock()
+        self._stats = {
+            "answers_evaluated": 0,
+            "packed_calls": 0,
+            "split_retries": 0,
+            "heuristic_fallbacks": 0,
+            "background_flushes": 0
+        }
+
+    @staticmethod
+    def pending(interview_round) -> List[Dict[str, Any]]:
+        """Answers in a round that have not been evaluated yet"""
+        return [answer for answer in interview_round.answers if answer.get("evaluation") is None]
+
+    def flush(self, interview_round, profession: str, final: bool = False,
+              priority: Priority = Priority.BACKGROUND) -> int:
+        """
+        Evaluate every pending answer in a round; returns the number evaluated
+
+        ``final`` marks the flush at round completion, after which the round's lock is dropped.
+        ``priority`` is passed to ``batch_evaluate``; a caller waiting on the flush raises it.
+        """
+        round_id = interview_round.round_id
+        with self._round_lock(round_id):
+            pending = self.pending(interview_round)
+            for start in range(0, len(pending), self.pack_size):
+                self._evaluate_pack(pending[start:start + self.pack_size], profession, priority)
+            if final:
+                with self._lock:
+                    self._round_locks.pop(round_id, None)
+            return len(pending)
+
+    def maybe_schedule_flush(self, interview_round, profession: str) -> bool:
+        """Flush in the background once the batch threshold is reached"""
+        if len(self.pending(interview_round)) < self.batch_size:
+            return False
+
+        round_id = interview_round.round_id
+        with self._lock:
+            if round_id in self._scheduled:
+                return False
+            self._scheduled.add(round_id)
+
+        try:
+            get_background_executor().submit(self._background_flush, interview_round, profession)
+        except AgentExecutorSaturated:
+            with self._lock:
+                self._scheduled.discard(round_id)
+            return False
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get evaluation counters"""
+        with self._lock:
+            return {
+                **self._stats,
+                "batch_size": self.batch_size,
+                "pack_size": self.pack_size
+            }
+
+    def _background_flush(self, interview_round, profession: str):
+        try:
+            self.flush(interview_round, profession)
+        finally:
+            with self._lock:
+                self._scheduled.discard(interview_round.round_id)
+                self._stats["background_flushes"] += 1
+
+    def _evaluate_pack(self, answers: List[Dict[str, Any]], profession: str, priority: Priority,
+                       split: bool = True):
+        items = [
+            {
+                "question_id": str(answer["question_id"]),
+                "question": answer["question"],
+                "answer": answer["answer"]
+            }
+            for answer in answers
+        ]
+
+        try:
+            evaluations = self.batch_evaluate(items, profession, priority=priority)
+        except Exception:
+            evaluations = {}
+
+        missing = []
+        for answer in answers:
+            evaluation = evaluations.get(str(answer["question_id"]))
+            if evaluation is None:
+                missing.append(answer)
+            else:
+                answer["evaluation"] = evaluation
+
+        with self._lock:
+            self._stats["packed_calls"] += 1
+            self._stats["answers_evaluated"] += len(answers) - len(missing)
+
+        if missing and split:
+            with self._lock:
+                self._stats["split_retries"] += 1
+            half = (len(missing) + 1) // 2
+            for part in (missing[:half], missing[half:]):
+                if part:
+                    self._evaluate_pack(part, profession, priority, split=False)
+        elif missing:
+            for answer in missing:
+                answer["evaluation"] = mark_degraded(
+                    heuristic_answer_evaluation(answer["question"], answer["answer"]), "heuristic"
+                )
+            with self._lock:
+                self._stats["heuristic_fallbacks"] += len(missing)
+                self._stats["answers_evaluated"] += len(missing)
+
+    def _round_lock(self, round_id: str) -> threading.Lock:
+        with self._lock:
+            return self._round_locks.setdefault(round_id, threading.Lock())
@@ -0,0 +1,50 @@
+import threading
+import time
+from typing import Any, Dict, Optional
+
+
+class BatchProgress:
+    """Completion counts and throughput of a running batch"""
+
+    def __init__(self, total: Optional[int] = None):
+        """
+        Args:
+            total: Number of items in the batch, if known up front
+        """
+        self.total = total
+        self._lock = threading.Lock()
+        self._started_at = time.perf_counter()
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._errors: Dict[str, str] = {}
+
+    def record_submitted(self):
+        with self._lock:
+            self._submitted += 1
+
+    def record_completed(self):
+        with self._lock:
+            self._completed += 1
+
+    def record_failed(self, item_id: str, error: BaseException):
+        with self._lock:
+            self._failed += 1
+            self._errors[item_id] = str(error)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Counts, elapsed time, throughput and (with a known total) the fraction done"""
+        with self._lock:
+            elapsed = time.perf_counter() - self._started_at
+            finished = self._completed + self._failed
+            return {
+                "total": self.total,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "in_flight": self._submitted - finished,
+                "fraction_done": finished / self.total if self.total else None,
+                "elapsed_seconds": round(elapsed, 3),
+                "throughput_per_minute": round(finished / elapsed * 60, 2) if elapsed > 0 else 0.0,
+                "errors": dict(self._errors)
+            }
@@ -0,0 +1,139 @@
+import os
+import threading
+import time
+from enum import Enum
+from typing import Any, Dict, Optional
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker state"""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """
+    Raised instead of calling the LLM while the circuit is open
+
+    Attributes:
+        retry_after: Seconds until the breaker lets a probe call through
+        stale_result: An expired cached response for the same prompt, if one is available
+    """
+
+    def __init__(self, retry_after: float, stale_result: Optional[str] = None):
+        super().__init__(f"LLM provider unavailable; retry in {retry_after:.0f}s")
+        self.retry_after = retry_after
+        self.stale_result = stale_result
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker around LLM calls
+
+    After ``failure_threshold`` consecutive failures the circuit opens and calls fail
+    fast. Once ``reset_timeout`` seconds have passed it goes half-open and lets up to
+    ``half_open_max_calls`` probe calls through: a successful probe closes the circuit,
+    a failed one opens it again.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0,
+                 half_open_max_calls: int = 1, enabled: bool = True):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._stats = {"opened": 0, "rejected": 0, "failures": 0, "successes": 0}
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def allow(self) -> bool:
+        """Whether a call may go to the provider now"""
+        if not self.enabled:
+            return True
+        with self._lock:
+            self._maybe_half_open()
+            if self._state == CircuitState.CLOSED:
+                return True
+            if self._state == CircuitState.HALF_OPEN and self._probes < self.half_open_max_calls:
+                self._probes += 1
+                return True
+            self._stats["rejected"] += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._stats["successes"] += 1
+            self._failures = 0
+            if self._state == CircuitState.HALF_OPEN:
+                self._state = CircuitState.CLOSED
+
+    def record_failure(self):
+        with self._lock:
+            self._stats["failures"] += 1
+            self._failures += 1
+            if self._state == CircuitState.HALF_OPEN or (
+                self._state == CircuitState.CLOSED and self._failures >= self.failure_threshold
+            ):
+                self._open()
+
+    def retry_after(self) -> float:
+        """Seconds until the next probe is allowed (0 when closed)"""
+        with self._lock:
+            if self._state == CircuitState.CLOSED:
+                return 0.0
+            return max(0.0, self._opened_at + self.reset_timeout - time.monotonic())
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            self._maybe_half_open()
+            return {
+                **self._stats,
+                "state": self._state.value,
+                "consecutive_failures": self._failures,
+                "failure_threshold": self.failure_threshold,
+                "reset_timeout_seconds": self.reset_timeout
+            }
+
+    def _open(self):
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        self._stats["opened"] += 1
+
+    def _maybe_half_open(self):
+        # Also re-arms probes that never reported back (e.g. an abandoned stream)
+        now = time.monotonic()
+        if self._state != CircuitState.CLOSED and now >= self._opened_at + self.reset_timeout:
+            self._state = CircuitState.HALF_OPEN
+            self._opened_at = now
+            self._probes = 0
+
+
+_breaker: Optional[CircuitBreaker] = None
+_breaker_lock = threading.Lock()
+
+
+def get_circuit_breaker() -> CircuitBreaker:
+    """Get or initialize the process-wide LLM circuit breaker"""
+    global _breaker
+
+    if _breaker is None:
+        with _breaker_lock:
+            if _breaker is None:
+                _breaker = CircuitBreaker(
+                    failure_threshold=int(os.getenv("LLM_BREAKER_FAILURE_THRESHOLD", "5")),
+                    reset_timeout=float(os.getenv("LLM_BREAKER_RESET_SECONDS", "30")),
+                    half_open_max_calls=int(os.getenv("LLM_BREAKER_HALF_OPEN_CALLS", "1")),
+                    enabled=os.getenv("LLM_BREAKER_ENABLED", "true").lower() != "false"
+                )
+
+    return _breaker
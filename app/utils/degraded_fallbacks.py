@@ -0,0 +1,147 @@
+import re
+from typing import Any, Dict, List
+
+# Words ignored when matching an answer against its question and criteria
+_STOPWORDS = frozenset("""
+a an and are as at be by can do does for from how i if in is it its of on or that the their
+this to was what when where which who why will with would you your
+""".split())
+
+_WORD = re.compile(r"[a-z][a-z0-9+#.-]*")
+
+_EXAMPLE_MARKERS = ("for example", "for instance", "e.g.", "such as", "in my last", "in my previous",
+                    "we used", "i used", "i built", "i implemented")
+
+
+def _keywords(text: str) -> set:
+    return {word.strip(".-") for word in _WORD.findall(text.lower())
+            if len(word) > 2 and word not in _STOPWORDS}
+
+
+def _clamp(value: float) -> float:
+    return round(min(max(value, 0.0), 10.0), 1)
+
+
+def heuristic_answer_evaluation(question: Dict[str, Any], answer: str) -> Dict[str, Any]:
+    """
+    Rule-based answer evaluation in the shape of AnswerEvaluationResponse
+
+    Scores length, coverage of the question's and evaluation criteria's keywords, structure
+    and use of concrete examples. Used while the LLM evaluator is unavailable.
+    """
+    answer = answer or ""
+    words = answer.split()
+    criteria = [str(item) for item in question.get("evaluation_criteria") or []]
+    expected = _keywords(" ".join([str(question.get("question", ""))] + criteria))
+    covered = expected & _keywords(answer)
+    coverage = len(covered) / len(expected) if expected else 0.5
+
+    length_score = min(len(words) / 15, 4.0)
+    sentences = len([part for part in re.split(r"[.!?]+", answer) if part.strip()])
+    has_example = any(marker in answer.lower() for marker in _EXAMPLE_MARKERS)
+
+    technical = _clamp(coverage * 10)
+    clarity = _clamp(2 + min(sentences, 4) * 1.5 + (1 if len(words) >= 30 else 0))
+    depth = _clamp(length_score * 1.5 + coverage * 4)
+    practical = _clamp(3 + (4 if has_example else 0) + coverage * 3)
+    score = _clamp(length_score + coverage * 4 + (1 if sentences >= 3 else 0) + (1 if has_example else 0))
+
+    strengths, weaknesses, suggestions = [], [], []
+    if coverage >= 0.5:
+        strengths.append("Addresses the main points of the question")
+    else:
+        weaknesses.append("Covers few of the points the question asks about")
+        suggestions.append("Address each part of the question directly")
+    if len(words) < 30:
+        weaknesses.append("Answer is brief")
+        suggestions.append("Expand on your reasoning and trade-offs")
+    if has_example:
+        strengths.append("Uses concrete examples")
+    else:
+        suggestions.append("Support your answer with a concrete example from your experience")
+
+    return {
+        "score": score,
+        "strengths": strengths,
+        "weaknesses": weaknesses,
+        "missing_points": [criterion for criterion in criteria if not _keywords(criterion) & covered],
+        "technical_accuracy": technical,
+        "clarity_of_explanation": clarity,
+        "depth_of_knowledge": depth,
+        "practical_application": practical,
+        "detailed_feedback": "This answer was scored automatically from its coverage, length and structure "
+                             "because the AI evaluator is temporarily unavailable.",
+        "improvement_suggestions": suggestions,
+        "follow_up_needed": False,
+        "recommended_follow_up": ""
+    }
+
+
+def template_round_feedback(scores: Dict[str, Any]) -> Dict[str, Any]:
+    """Round feedback in the shape of RoundFeedbackResponse, written from RoundScoreAggregator scores"""
+    overall = scores.get("overall_score", 0)
+    level = str(scores.get("performance_level", "average")).replace("_", " ")
+    categories = scores.get("category_scores") or {}
+    weak_topics = [topic.get("topic") for topic in scores.get("weak_topics") or [] if topic.get("topic")]
+
+    parts = [f"You scored {overall}/100 this round ({level})."]
+    if categories:
+        best = max(categories, key=categories.get)
+        worst = min(categories, key=categories.get)
+        parts.append(f"Your strongest area was {best.replace('_', ' ')} ({categories[best]}/100)"
+                     f" and your weakest was {worst.replace('_', ' ')} ({categories[worst]}/100).")
+    if weak_topics:
+        parts.append(f"Focus your practice on: {', '.join(weak_topics[:3])}.")
+
+    return {
+        "detailed_feedback": " ".join(parts),
+        "motivational_message": "Every round builds your interview skills - keep practising and you will see "
+                                "steady progress."
+    }
+
+
+def basic_practice_plan(weak_areas: List[Dict[str, Any]], available_time: str = "1 week",
+                        days: int = 5) -> Dict[str, Any]:
+    """Practice plan in the shape of PracticePlanResponse that rotates through the weak areas"""
+    topics = [str(area.get("topic") or area.get("area") or area.get("name") or "")
+              for area in weak_areas if isinstance(area, dict)]
+    topics = [topic for topic in topics if topic] or ["Core interview skills"]
+
+    schedule = []
+    for day in range(1, days + 1):
+        topic = topics[(day - 1) % len(topics)]
+        schedule.append({
+            "day": day,
+            "focus_topics": [topic],
+            "activities": [
+                {"time": "session 1", "activity": f"Review the fundamentals of {topic}", "duration": "45 minutes",
+                 "resources": []},
+                {"time": "session 2", "activity": f"Answer practice questions on {topic} out loud",
+                 "duration": "30 minutes", "resources": []}
+            ],
+            "practice_questions": [f"Explain a recent problem you solved involving {topic}."],
+            "self_assessment": f"Rate your confidence in {topic} from 1 to 10",
+            "daily_goal": f"Explain {topic} clearly with a concrete example"
+        })
+
+    return {
+        "total_duration": available_time,
+        "daily_schedule": schedule,
+        "mock_interview_questions": [
+            {"question": f"Walk me through how you would approach a problem involving {topic}.",
+             "topic": topic, "difficulty": "medium", "time_limit": "5 minutes"}
+            for topic in topics[:5]
+        ],
+        "progress_checkpoints": [
+            {"checkpoint": f"Day {days}", "topics_to_master": topics[:5],
+             "assessment_method": "Mock interview round", "success_criteria": "Average answer score of 7 or more"}
+        ],
+        "final_preparation": {
+            "last_day_activities": ["Run a full mock interview round"],
+            "quick_review_topics": topics[:5],
+            "confidence_boosters": ["Review the answers you scored highest on"]
+        },
+        "success_tips": ["Structure answers as context, approach, result",
+                         "Use concrete examples from your own experience"],
+        "estimated_improvement": ""
+    }
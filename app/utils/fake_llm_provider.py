@@ -0,0 +1,299 @@
+import hashlib
+import json
+import math
+import os
+import random
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Type
+
+from pydantic import BaseModel
+
+from .llm_provider import LLMProvider
+
+SKILLS = [
+    "System design", "SQL", "Python", "Testing", "Cloud infrastructure", "APIs",
+    "Data structures", "Security", "Observability", "Concurrency", "Stakeholder communication"
+]
+LEVELS = ["none", "beginner", "intermediate", "advanced", "expert"]
+PRIORITIES = ["critical", "high", "medium", "low"]
+QUESTION_TYPES = ["technical"] * 4 + ["problem_solving"] * 3 + ["behavioral"] * 2 + ["situational"]
+DIFFICULTIES = ["easy", "medium", "hard"]
+
+
+class FakeLLMError(RuntimeError):
+    """Injected provider failure"""
+
+
+def _pick(rng: random.Random, items: List[Any], count: int) -> List[Any]:
+    return rng.sample(items, min(count, len(items)))
+
+
+def _gap(rng: random.Random, skill: str) -> Dict[str, Any]:
+    return {
+        "skill": skill,
+        "current_level": rng.choice(LEVELS[:3]),
+        "required_level": rng.choice(LEVELS[2:]),
+        "priority": rng.choice(PRIORITIES),
+        "description": f"Strengthen {skill.lower()} through hands-on work"
+    }
+
+
+def _scores(rng: random.Random, low: int, high: int) -> Dict[str, int]:
+    return {
+        key: rng.randint(low, high)
+        for key in ("technical_accuracy", "clarity_of_explanation", "depth_of_knowledge", "practical_application")
+    }
+
+
+def _cv_gaps(rng: random.Random, prompt: str) -> Dict[str, Any]:
+    skills = _pick(rng, SKILLS, 6)
+    return {
+        "current_level": rng.choice(["junior", "mid", "senior"]),
+        "overall_readiness_score": rng.randint(35, 90),
+        "technical_skills_gaps": [_gap(rng, skill) for skill in skills[:3]],
+        "missing_certifications": [{"certification": f"{skills[3]} certification", "priority": rng.choice(PRIORITIES)}],
+        "experience_gaps": [{"area": skills[4], "description": "Limited production exposure"}],
+        "soft_skills_gaps": [{"skill": "Stakeholder communication", "priority": rng.choice(PRIORITIES)}],
+        "educational_gaps": [],
+        "strengths": skills[5:] + ["Delivery focus"],
+        "priority_improvements": [{"area": skill, "priority": rng.choice(PRIORITIES)} for skill in skills[:2]],
+        "career_stage_analysis": "Solid foundation with room to deepen core skills",
+        "recommendations_summary": f"Focus on {skills[0].lower()} and {skills[1].lower()}"
+    }
+
+
+def _recommendations(rng: random.Random, prompt: str) -> Dict[str, Any]:
+    skills = _pick(rng, SKILLS, 3)
+    return {
+        "certifications": [{"name": f"{skill} certification", "cost": rng.randint(0, 400)} for skill in skills[:1]],
+        "courses": [{"title": f"{skill} in practice", "platform": "Online", "duration": "4 weeks"} for skill in skills],
+        "projects": [{"title": f"Build a {skills[0].lower()} project", "skills": skills[:2]}],
+        "books": [{"title": f"Mastering {skills[1]}"}],
+        "communities": [{"name": f"{skills[2]} community"}],
+        "learning_paths": {"short_term": skills[:2], "long_term": skills[2:]},
+        "budget_breakdown": {"total": rng.randint(0, 800)},
+        "quick_wins": [f"Review {skill.lower()} fundamentals" for skill in skills[:2]],
+        "summary": "A focused plan covering the largest gaps first"
+    }
+
+
+def _questions(rng: random.Random, prompt: str) -> Dict[str, Any]:
+    match = re.search(r"FOCUS AREAS:\s*(.+)", prompt)
+    focus_areas = [area.strip() for area in match.group(1).split(",")] if match else ["general"]
+    token = hashlib.sha1(prompt.encode("utf-8")).hexdigest()[:6]
+    return {
+        "questions": [
+            {
+                "id": number,
+                "question": f"[{token}-{number}] How would you approach {rng.choice(SKILLS).lower()} "
+                            f"in the context of {focus_areas[number % len(focus_areas)]}?",
+                "type": QUESTION_TYPES[number % len(QUESTION_TYPES)],
+                "difficulty": rng.choice(DIFFICULTIES),
+                "focus_area": focus_areas[number % len(focus_areas)],
+                "time_limit_minutes": rng.choice([3, 5, 8]),
+                "evaluation_criteria": ["Correctness", "Clarity"],
+                "follow_up_questions": ["What trade-offs did you consider?"]
+            }
+            for number in range(1, 16)
+        ],
+        "interview_structure": {"total_questions": 15, "estimated_duration_minutes": 75},
+        "introduction": "Welcome to your practice interview.",
+        "closing": "Thank you for your time."
+    }
+
+
+def _evaluation(rng: random.Random, prompt: str) -> Dict[str, Any]:
+    score = rng.randint(3, 10)
+    return {
+        "score": score,
+        "strengths": ["Clear structure"],
+        "weaknesses": [] if score >= 8 else ["Could go deeper on trade-offs"],
+        "missing_points": [] if score >= 8 else ["Edge cases"],
+        **_scores(rng, max(0, score - 2), min(10, score + 1)),
+        "detailed_feedback": "A reasonable answer with room for more depth.",
+        "improvement_suggestions": ["Add a concrete example"],
+        "follow_up_needed": score < 6,
+        "recommended_follow_up": "Can you walk through an example?" if score < 6 else ""
+    }
+
+
+def _batch_evaluation(rng: random.Random, prompt: str) -> Dict[str, Any]:
+    return {
+        "evaluations": [
+            {"question_id": question_id, **_evaluation(rng, prompt)}
+            for question_id in re.findall(r"ANSWER ID:\s*(\S+)", prompt)
+        ]
+    }
+
+
+def _adaptive_question(rng: random.Random, prompt: str) -> Dict[str, Any]:
+    skill = rng.choice(SKILLS)
+    return {
+        "question": f"Tell me more about how you applied {skill.lower()} in a recent project.",
+        "rationale": "Probes an area from earlier answers",
+        "type": "technical",
+        "difficulty": rng.choice(DIFFICULTIES),
+        "evaluation_criteria": ["Depth", "Concrete examples"],
+        "time_limit_minutes": 5
+    }
+
+
+def _round_feedback(rng: random.Random, prompt: str) -> Dict[str, Any]:
+    return {
+        "detailed_feedback": "Good structure overall; deepen the technical trade-offs.",
+        "motivational_message": "Nice progress this round."
+    }
+
+
+def _practice_plan(rng: random.Random, prompt: str) -> Dict[str, Any]:
+    topics = _pick(rng, SKILLS, 2)
+    return {
+        "total_duration": "1 week",
+        "daily_schedule": [{"day": day, "focus_topics": topics, "activities": [], "daily_goal": "Practice"}
+                           for day in range(1, 6)],
+        "mock_interview_questions": [{"question": f"Explain {topic.lower()}", "topic": topic,
+                                      "difficulty": "medium", "time_limit": "5 minutes"} for topic in topics],
+        "progress_checkpoints": [{"checkpoint": "Day 3", "topics_to_master": topics}],
+        "final_preparation": {"quick_review_topics": topics},
+        "success_tips": ["Think aloud", "Use examples"],
+        "estimated_improvement": f"{rng.randint(10, 30)}%"
+    }
+
+
+def _job_fit(rng: random.Random, prompt: str) -> Dict[str, Any]:
+    skills = _pick(rng, SKILLS, 5)
+    fit = rng.randint(30, 95)
+    return {
+        "job_analysis": {"title": "Software Engineer", "seniority_level": "mid"},
+        "required_skills": [{"skill": skill, "importance": "high"} for skill in skills[:3]],
+        "preferred_skills": [{"skill": skill, "importance": "medium"} for skill in skills[3:]],
+        "required_qualifications": [],
+        "eligibility_assessment": {
+            "overall_fit_score": fit,
+            "skills_match_percentage": rng.randint(30, 100),
+            "experience_match_percentage": rng.randint(30, 100),
+            "education_match_percentage": rng.randint(30, 100),
+            "hiring_probability": "high" if fit >= 75 else "medium",
+            "confidence_level": "medium"
+        },
+        "matching_qualifications": [{"qualification": skills[0]}],
+        "missing_critical_skills": [{"skill": skills[1], "priority": "high"}],
+        "missing_preferred_skills": [{"skill": skills[4], "priority": "low"}],
+        "improvement_recommendations": [{"area": skills[1], "action": "Build a small project"}],
+        "preparation_timeline": {"weeks": rng.randint(2, 12)},
+        "application_advice": {"readiness_percentage": fit},
+        "detailed_analysis": "A reasonable fit with one critical gap.",
+        "next_steps": ["Close the critical gap", "Apply"]
+    }
+
+
+def _job_requirements(rng: random.Random, prompt: str) -> Dict[str, Any]:
+    skills = _pick(rng, SKILLS, 6)
+    return {
+        "job_title": "Software Engineer",
+        "seniority_level": rng.choice(["junior", "mid", "senior"]),
+        "technical_skills": skills[:4],
+        "soft_skills": ["Communication", "Teamwork"],
+        "education_required": ["Bachelor's degree or equivalent"],
+        "experience_required": {"years": str(rng.randint(1, 8)), "types": skills[4:]},
+        "certifications": [],
+        "tools_and_technologies": ["Git", "Docker"],
+        "key_responsibilities": ["Design and build services"],
+        "preferred_skills": ["Kubernetes"]
+    }
+
+
+# Response builders keyed by response schema name
+RESPONSE_BUILDERS: Dict[str, Callable[[random.Random, str], Dict[str, Any]]] = {
+    "CVGapAnalysisResponse": _cv_gaps,
+    "LearningRecommendationsResponse": _recommendations,
+    "InterviewQuestionSetResponse": _questions,
+    "AnswerEvaluationResponse": _evaluation,
+    "BatchAnswerEvaluationResponse": _batch_evaluation,
+    "AdaptiveQuestionResponse": _adaptive_question,
+    "RoundFeedbackResponse": _round_feedback,
+    "PracticePlanResponse": _practice_plan,
+    "JobFitAnalysisResponse": _job_fit,
+    "JobRequirementsResponse": _job_requirements
+}
+
+
+class FakeLLMProvider(LLMProvider):
+    """
+    Deterministic offline provider for load tests and local runs
+
+    Responses are schema-valid JSON derived from a hash of the prompt, so the same prompt
+    always yields the same response. Latency is log-normal around ``latency_median``
+    seconds, and ``error_rate`` / ``rate_limit_rate`` inject generic and HTTP 429 failures.
+    """
+
+    name = "fake"
+
+    def __init__(self, latency_median: float = 0.3, latency_sigma: float = 0.5,
+                 error_rate: float = 0.0, rate_limit_rate: float = 0.0, seed: int = 0,
+                 chunk_size: int = 64):
+        self.latency_median = latency_median
+        self.latency_sigma = latency_sigma
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.chunk_size = chunk_size
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "FakeLLMProvider":
+        """Configure from LLM_FAKE_* environment variables"""
+        return cls(
+            latency_median=float(os.getenv("LLM_FAKE_LATENCY_MEDIAN_MS", "300")) / 1000,
+            latency_sigma=float(os.getenv("LLM_FAKE_LATENCY_SIGMA", "0.5")),
+            error_rate=float(os.getenv("LLM_FAKE_ERROR_RATE", "0")),
+            rate_limit_rate=float(os.getenv("LLM_FAKE_RATE_LIMIT_RATE", "0")),
+            seed=int(os.getenv("LLM_FAKE_SEED", "0"))
+        )
+
+    @staticmethod
+    def respond(prompt: str, response_model: Optional[Type[BaseModel]] = None) -> str:
+        """The response text for a prompt"""
+        rng = random.Random(hashlib.sha256(prompt.encode("utf-8")).digest())
+        builder = RESPONSE_BUILDERS.get(response_model.__name__) if response_model is not None else None
+        if builder is not None:
+            return json.dumps(builder(rng, prompt))
+        if response_model is not None:
+            return response_model().model_dump_json()
+        return json.dumps({"result": "ok", "score": rng.randint(1, 10)})
+
+    def complete(self, owner: Any, task: Any, response_model: Optional[Type[BaseModel]] = None,
+                 timeout: Optional[float] = None) -> str:
+        self._wait(self._sample_latency(), timeout)
+        return self.respond(task.description, response_model)
+
+    def stream(self, owner: Any, task: Any, response_model: Optional[Type[BaseModel]] = None,
+               timeout: Optional[float] = None) -> Iterator[str]:
+        text = self.respond(task.description, response_model)
+        chunks = [text[i:i + self.chunk_size] for i in range(0, len(text), self.chunk_size)] or [""]
+        latency = self._sample_latency()
+        # A third of the latency before the first token, the rest spread across chunks
+        self._wait(latency / 3, timeout)
+        for chunk in chunks:
+            yield chunk
+            time.sleep(latency * 2 / 3 / len(chunks))
+
+    def _sample_latency(self) -> float:
+        with self._lock:
+            failure = self._rng.random()
+            latency = self._rng.lognormvariate(math.log(self.latency_median), self.latency_sigma) \
+                if self.latency_median > 0 else 0.0
+        if failure < self.rate_limit_rate:
+            raise FakeLLMError("429 RESOURCE_EXHAUSTED: fake provider rate limit")
+        if failure < self.rate_limit_rate + self.error_rate:
+            raise FakeLLMError("500 fake provider error")
+        return latency
+
+    @staticmethod
+    def _wait(latency: float, timeout: Optional[float]):
+        if timeout is not None and latency > timeout:
+            time.sleep(max(0.0, timeout))
+            raise TimeoutError(f"Fake provider request exceeded its {timeout:.2f}s timeout")
+        time.sleep(latency)
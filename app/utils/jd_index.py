@@ -0,0 +1,83 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .single_flight import SingleFlight
+
+
+class JobRequirementIndex:
+    """
+    Structured job requirements keyed by normalized job description hash
+
+    Requirements are extracted once per posting (whitespace and case differences do not
+    count as a new posting) and reused by every fit analysis against it. Concurrent
+    lookups of a posting that is still being extracted share the one extraction.
+    Extractions that failed to parse or were served degraded are not stored.
+    """
+
+    def __init__(self, extractor: Callable[[str], Dict[str, Any]], max_entries: int = 256):
+        """
+        Args:
+            extractor: Callable with the signature of JobMatchAnalyzerAgent.extract_job_requirements
+            max_entries: Postings kept before the least recently used is evicted
+        """
+        self.extractor = extractor
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._flights = SingleFlight()
+        self._stats = {"hits": 0, "extractions": 0, "unstored": 0}
+
+    @staticmethod
+    def normalize(job_description: str) -> str:
+        """Collapse whitespace and case so re-pasted postings share one entry"""
+        return " ".join(job_description.split()).casefold()
+
+    @classmethod
+    def make_key(cls, job_description: str) -> str:
+        """Hash of the normalized job description"""
+        return hashlib.sha256(cls.normalize(job_description).encode("utf-8")).hexdigest()
+
+    def get(self, job_description: str) -> Tuple[str, Dict[str, Any]]:
+        """
+        Requirements for a posting, extracting them on first use
+
+        Returns:
+            (jd_hash, requirements)
+        """
+        key = self.make_key(job_description)
+        requirements = self.lookup(key)
+        if requirements is not None:
+            return key, requirements
+
+        requirements, _ = self._flights.do(key, lambda: self._extract(key, job_description))
+        return key, dict(requirements)
+
+    def lookup(self, jd_hash: str) -> Optional[Dict[str, Any]]:
+        """Stored requirements for a hash, or None"""
+        with self._lock:
+            requirements = self._entries.get(jd_hash)
+            if requirements is None:
+                return None
+            self._entries.move_to_end(jd_hash)
+            self._stats["hits"] += 1
+            return dict(requirements)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit and extraction counters"""
+        with self._lock:
+            return {**self._stats, "entries": len(self._entries), "max_entries": self.max_entries}
+
+    def _extract(self, key: str, job_description: str) -> Dict[str, Any]:
+        requirements = self.extractor(job_description)
+        with self._lock:
+            self._stats["extractions"] += 1
+            if "error" in requirements or requirements.get("degraded"):
+                self._stats["unstored"] += 1
+                return requirements
+            self._entries[key] = requirements
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return requirements
@@ -0,0 +1,173 @@
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from ..models.job import Job, JobStatus
+from .circuit_breaker import CircuitOpenError
+
+
+def _circuit_open(error: Optional[BaseException]) -> bool:
+    """Whether a job failed because the LLM circuit breaker is open (directly or wrapped)"""
+    while error is not None:
+        if isinstance(error, CircuitOpenError):
+            return True
+        error = error.__cause__
+    return False
+
+
+class JobQueue:
+    """
+    Local background job subsystem: a job table plus a worker pool
+
+    The worker count caps how many long-running analyses (and therefore concurrent LLM
+    calls) run at once. Jobs submitted with ``retry=True`` (only those safe to run twice:
+    they read and return, or overwrite the same record) have failed attempts retried
+    automatically up to ``max_attempts`` (except while the LLM circuit breaker is open)
+    after an exponential backoff that does not hold a worker. Failed jobs can also be
+    retried later without the user resubmitting. Finished jobs are kept for ``finished_ttl_seconds`` and at most
+    ``max_finished_jobs`` of them, oldest first out.
+    """
+
+    def __init__(self, max_workers: int = 2, max_attempts: int = 2, retry_backoff_seconds: float = 2.0,
+                 finished_ttl_seconds: float = 3600.0, max_finished_jobs: int = 1000):
+        self.max_workers = max_workers
+        self.max_attempts = max_attempts
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.finished_ttl_seconds = finished_ttl_seconds
+        self.max_finished_jobs = max_finished_jobs
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job-worker")
+        self._jobs: Dict[str, Job] = {}
+        self._work: Dict[str, Tuple[Callable[..., Dict[str, Any]], tuple, dict, int]] = {}
+        self._lock = threading.Lock()
+        self._evicted = 0
+
+    def submit(self, kind: str, fn: Callable[..., Dict[str, Any]], *args, retry: bool = False, **kwargs) -> Job:
+        """
+        Queue a callable and return its job record immediately
+
+        Args:
+            retry: Retry failed attempts automatically; only for jobs that are safe to run twice
+        """
+        attempts = self.max_attempts if retry else 1
+        job = Job(job_id=str(uuid.uuid4()), kind=kind, max_attempts=attempts)
+        with self._lock:
+            self._evict_finished()
+            self._jobs[job.job_id] = job
+            self._work[job.job_id] = (fn, args, kwargs, attempts)
+        self._pool.submit(self._run, job.job_id)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Get a job by id"""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def retry(self, job_id: str) -> Job:
+        """
+        Re-queue a failed job
+
+        Raises:
+            KeyError: If the job does not exist (or was evicted)
+            ValueError: If the job has not failed
+        """
+        with self._lock:
+            job = self._jobs[job_id]
+            if job.status != JobStatus.FAILED:
+                raise ValueError(f"Only failed jobs can be retried (job is {job.status.value})")
+            job.status = JobStatus.QUEUED
+            job.error = None
+            job.finished_at = None
+            job.max_attempts = job.attempts + self._work[job_id][3]
+        self._pool.submit(self._run, job_id)
+        return job
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get job counts by status"""
+        with self._lock:
+            self._evict_finished()
+            counts = {status.value: 0 for status in JobStatus}
+            for job in self._jobs.values():
+                counts[job.status.value] += 1
+            evicted = self._evicted
+        return {
+            "max_workers": self.max_workers,
+            "max_attempts": self.max_attempts,
+            "jobs": counts,
+            "evicted": evicted
+        }
+
+    def retry_delay(self, attempts: int) -> float:
+        """Backoff before the automatic retry that follows attempt number ``attempts``"""
+        return self.retry_backoff_seconds * (2 ** (attempts - 1))
+
+    def _run(self, job_id: str):
+        with self._lock:
+            job = self._jobs[job_id]
+            fn, args, kwargs, _ = self._work[job_id]
+            job.status = JobStatus.RUNNING
+            job.attempts += 1
+            job.started_at = datetime.now()
+
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            with self._lock:
+                job.error = str(e)
+                # An open circuit will still be open on an immediate retry
+                if job.attempts < job.max_attempts and not _circuit_open(e):
+                    job.status = JobStatus.QUEUED
+                    retry = threading.Timer(self.retry_delay(job.attempts), self._pool.submit,
+                                            args=(self._run, job_id))
+                    retry.daemon = True
+                    retry.start()
+                    return
+                job.status = JobStatus.FAILED
+                job.finished_at = datetime.now()
+            return
+
+        with self._lock:
+            job.result = result
+            job.error = None
+            job.status = JobStatus.DONE
+            job.finished_at = datetime.now()
+            del self._work[job_id]
+
+    def _evict_finished(self):
+        """Drop finished jobs past their TTL, then the oldest beyond the size bound (lock held)"""
+        finished = sorted(
+            (job for job in self._jobs.values() if job.finished_at is not None),
+            key=lambda job: job.finished_at
+        )
+        cutoff = datetime.now() - timedelta(seconds=self.finished_ttl_seconds)
+        excess = len(finished) - self.max_finished_jobs
+        for index, job in enumerate(finished):
+            if index >= excess and job.finished_at >= cutoff:
+                break
+            del self._jobs[job.job_id]
+            self._work.pop(job.job_id, None)
+            self._evicted += 1
+
+
+_queue: Optional[JobQueue] = None
+_queue_lock = threading.Lock()
+
+
+def get_job_queue() -> JobQueue:
+    """Get or initialize the process-wide job queue"""
+    global _queue
+
+    if _queue is None:
+        with _queue_lock:
+            if _queue is None:
+                _queue = JobQueue(
+                    max_workers=int(os.getenv("JOB_WORKERS", "2")),
+                    max_attempts=int(os.getenv("JOB_MAX_ATTEMPTS", "2")),
+                    retry_backoff_seconds=float(os.getenv("JOB_RETRY_BACKOFF_SECONDS", "2")),
+                    finished_ttl_seconds=float(os.getenv("JOB_FINISHED_TTL_SECONDS", "3600")),
+                    max_finished_jobs=int(os.getenv("JOB_MAX_FINISHED", "1000"))
+                )
+
+    return _queue
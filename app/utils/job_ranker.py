@@ -0,0 +1,133 @@
+import re
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+_TOKEN = re.compile(r"[a-z][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+
+# Words that carry no signal when matching CVs to postings
+STOPWORDS = frozenset("""
+a about above after all also an and any are as at be been being both but by can could did do does
+doing for from had has have having he her here how i if in into is it its just may me more most
+must my no nor not of on once only or other our out over own same she should so some such than that
+the their them then there these they this those through to too under until up very was we were what
+when where which while who whom why will with would you your years year experience work working
+team role job candidate candidates ability strong excellent good knowledge skills skill required
+requirements preferred plus using including etc
+""".split())
+
+# Weight of the BM25 similarity vs skill coverage in the local score
+BM25_WEIGHT = 0.6
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word tokens without stopwords"""
+    return [token for token in _TOKEN.findall((text or "").lower())
+            if len(token) > 1 and token not in STOPWORDS]
+
+
+def _skill_names(items: Iterable[Any]) -> List[str]:
+    names = []
+    for item in items or []:
+        if isinstance(item, dict):
+            item = item.get("skill") or item.get("certification") or item.get("area") or item.get("name")
+        if item:
+            names.append(str(item))
+    return names
+
+
+def candidate_profile(cv_analysis: Any = None, user: Any = None) -> Dict[str, Any]:
+    """
+    Local matching profile from a CVAnalysis (or just the user profile)
+
+    Returns:
+        Dict with ``text`` (what the candidate offers) and ``gaps`` (skills and
+        certifications the gap analysis found missing)
+    """
+    if cv_analysis is None:
+        text = " ".join(str(part) for part in (getattr(user, "profession", ""),
+                                               getattr(user, "experience_level", "")) if part)
+        return {"text": text, "gaps": []}
+
+    offered = [cv_analysis.cv_content, cv_analysis.profession, cv_analysis.current_level]
+    offered.extend(cv_analysis.strengths or [])
+    gaps = _skill_names(cv_analysis.technical_skills_gaps) + _skill_names(cv_analysis.missing_certifications)
+    return {"text": " ".join(str(part) for part in offered if part), "gaps": gaps}
+
+
+def bm25_scores(query: List[str], documents: List[List[str]],
+                k1: float = 1.5, b: float = 0.75) -> np.ndarray:
+    """BM25 score of each tokenized document for a tokenized query, computed as one matrix product"""
+    if not documents:
+        return np.zeros(0)
+
+    vocabulary: Dict[str, int] = {}
+    for document in documents:
+        for token in document:
+            vocabulary.setdefault(token, len(vocabulary))
+    query_ids = sorted({vocabulary[token] for token in query if token in vocabulary})
+    if not query_ids:
+        return np.zeros(len(documents))
+
+    columns = {term: column for column, term in enumerate(query_ids)}
+    tf = np.zeros((len(documents), len(query_ids)))
+    for row, document in enumerate(documents):
+        for token in document:
+            column = columns.get(vocabulary[token])
+            if column is not None:
+                tf[row, column] += 1
+
+    lengths = np.array([len(document) for document in documents], dtype=float)
+    average_length = lengths.mean() or 1.0
+    document_frequency = (tf > 0).sum(axis=0)
+    idf = np.log1p((len(documents) - document_frequency + 0.5) / (document_frequency + 0.5))
+    norm = k1 * (1 - b + b * lengths / average_length)
+    return ((tf * (k1 + 1)) / (tf + norm[:, None])) @ idf
+
+
+def rank_jobs_locally(profile: Dict[str, Any], job_descriptions: List[str]) -> List[Dict[str, Any]]:
+    """
+    Score postings against a candidate profile without any LLM call
+
+    The local score (0-100) blends BM25 similarity of each posting to the candidate's
+    text (normalized to the best posting) with the share of the posting's terms the
+    candidate covers, less the share of the candidate's known gaps the posting asks for.
+
+    Returns:
+        One dict per posting (``index``, ``local_score``, ``bm25``, ``skill_coverage``,
+        ``gap_hits``), best first
+    """
+    documents = [tokenize(jd) for jd in job_descriptions]
+    offered = tokenize(profile.get("text", ""))
+    bm25 = bm25_scores(offered, documents)
+    best = bm25.max() if len(bm25) else 0.0
+    similarity = bm25 / best if best > 0 else np.zeros(len(documents))
+
+    offered_terms = set(offered)
+    gap_terms = [set(tokenize(gap)) for gap in profile.get("gaps", [])]
+
+    ranked = []
+    for index, document in enumerate(documents):
+        terms = set(document)
+        coverage = len(terms & offered_terms) / len(terms) if terms else 0.0
+        gap_hits = sum(1 for gap in gap_terms if gap and gap <= terms)
+        gap_penalty = gap_hits / len(gap_terms) if gap_terms else 0.0
+        score = BM25_WEIGHT * similarity[index] + (1 - BM25_WEIGHT) * max(coverage - gap_penalty, 0.0)
+        ranked.append({
+            "index": index,
+            "local_score": round(float(score) * 100, 1),
+            "bm25": round(float(bm25[index]), 3),
+            "skill_coverage": round(coverage * 100, 1),
+            "gap_hits": gap_hits
+        })
+
+    ranked.sort(key=lambda entry: entry["local_score"], reverse=True)
+    return ranked
+
+
+def fit_score(analysis: Optional[Dict[str, Any]]) -> Optional[float]:
+    """Overall fit score (0-100) from a job fit analysis, if it has one"""
+    try:
+        return float(((analysis or {}).get("eligibility_assessment") or {})["overall_fit_score"])
+    except (KeyError, TypeError, ValueError):
+        return None
@@ -0,0 +1,186 @@
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+# Closing cut-backs tried when repairing a truncated object
+MAX_REPAIR_ATTEMPTS = 8
+
+_CLOSERS = {"{": "}", "[": "]"}
+
+# Objects that fail to decode before the extractor falls back to the scanner
+MAX_DECODE_FAILURES = 4
+
+# A brace, or a whole (possibly unterminated) string literal
+_TOKEN = re.compile(r'[{}]|"[^"\\]*(?:\\.[^"\\]*)*"?', re.DOTALL)
+
+# A complete string literal, and anything that is not a bracket
+_STRING = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_NON_BRACKET = re.compile(r'[^{}\[\]]+')
+
+_decoder = json.JSONDecoder()
+
+
+def scan_objects(text: str) -> Tuple[List[Tuple[int, int]], Optional[int]]:
+    """
+    Single pass over model output locating JSON objects
+
+    Strings and escapes are tracked inside braces only, so quotes in surrounding prose
+    do not derail the scan. String bodies are skipped with one regex match each, so the
+    Python-level loop only runs per brace and string rather than per character.
+
+    Returns:
+        (spans, unclosed_start): ``(start, end)`` spans of the outermost balanced
+        ``{...}`` objects in order, and the start of the outermost object still open
+        when the text ends (truncated output), or None
+    """
+    spans: List[Tuple[int, int]] = []
+    openers: List[int] = []
+    position = 0
+
+    while True:
+        if not openers:
+            position = text.find("{", position)
+            if position < 0:
+                break
+            openers.append(position)
+            position += 1
+            continue
+
+        match = _TOKEN.search(text, position)
+        if match is None:
+            break
+        token = match.group()
+        position = match.end()
+
+        if token == "{":
+            openers.append(match.start())
+        elif token == "}":
+            start = openers.pop()
+            # Drop spans this object encloses; only outermost spans are kept
+            while spans and spans[-1][0] > start:
+                spans.pop()
+            spans.append((start, position))
+
+    return spans, (openers[0] if openers else None)
+
+
+def _drop_open_string(fragment: str) -> str:
+    """Cut a fragment back to before a string literal that the truncation left open"""
+    try:
+        _decoder.raw_decode(fragment)
+    except json.JSONDecodeError as e:
+        if e.msg.startswith("Unterminated string"):
+            return fragment[:e.pos]
+    return fragment
+
+
+def _close_fragment(fragment: str) -> Optional[str]:
+    """
+    Close the open containers of a truncated fragment (without open strings)
+
+    Returns None when the fragment ends in a scalar or key that may have been cut short.
+    """
+    fragment = fragment.rstrip()
+    if fragment.endswith(","):
+        fragment = fragment[:-1].rstrip()
+    elif fragment[-1:] not in ("}", "]", '"', "{", "["):
+        return None
+
+    # Cancel matched bracket pairs (one pass per nesting level); openers left are still open
+    brackets = _NON_BRACKET.sub("", _STRING.sub("", fragment))
+    previous = None
+    while brackets != previous:
+        previous = brackets
+        brackets = brackets.replace("{}", "").replace("[]", "")
+    stack = [char for char in brackets if char in _CLOSERS]
+
+    return fragment + "".join(_CLOSERS[opener] for opener in reversed(stack))
+
+
+def repair_truncated(fragment: str) -> Optional[Dict[str, Any]]:
+    """
+    Recover an object from output that was cut off mid-way
+
+    Members the truncation may have cut short (open strings, trailing numbers and
+    literals, keys without values) are dropped by cutting back to earlier commas until
+    the closed fragment parses.
+    """
+    for _ in range(MAX_REPAIR_ATTEMPTS):
+        fragment = _drop_open_string(fragment)
+        closed = _close_fragment(fragment)
+        if closed is not None:
+            try:
+                data = json.loads(closed)
+                if isinstance(data, dict):
+                    return data
+            except json.JSONDecodeError:
+                pass
+        cut = fragment.rfind(",")
+        if cut <= 0:
+            return None
+        fragment = fragment[:cut]
+    return None
+
+
+def _size(data: Dict[str, Any]) -> int:
+    return len(json.dumps(data, separators=(",", ":")))
+
+
+def extract_json_object(text: str, repair: bool = True) -> Optional[Dict[str, Any]]:
+    """
+    Extract the JSON object from model output
+
+    Handles prose (including braces) before and after the object, markdown fences,
+    several objects (the largest one that parses wins) and, with ``repair``, output
+    truncated before the object was closed.
+
+    Returns:
+        The parsed object, or None if no object could be recovered
+    """
+    if not text:
+        return None
+
+    # Fast path: decode each candidate object in C, skipping past the ones that parse
+    best: Optional[Dict[str, Any]] = None
+    best_length = 0
+    failures = 0
+    truncated_at: Optional[int] = None
+    position = text.find("{")
+    while position >= 0 and failures < MAX_DECODE_FAILURES:
+        try:
+            data, end = _decoder.raw_decode(text, position)
+        except json.JSONDecodeError as e:
+            if e.pos >= len(text.rstrip()) or e.msg.startswith("Unterminated string"):
+                # Ran off the end: the output was truncated inside this object
+                truncated_at = position
+                break
+            failures += 1
+            position = text.find("{", position + 1)
+            continue
+        if isinstance(data, dict) and end - position > best_length:
+            best, best_length = data, end - position
+        position = text.find("{", end)
+
+    if repair and truncated_at is not None:
+        repaired = repair_truncated(text[truncated_at:])
+        # A trailing stray brace must not displace a complete object found earlier
+        if repaired is not None and (best is None or _size(repaired) > _size(best)):
+            return repaired
+    if best is not None:
+        return best
+
+    # Slow path for output the decoder could not get through (stray braces in prose)
+
+    spans, unclosed_start = scan_objects(text)
+
+    for start, end in sorted(spans, key=lambda span: span[0] - span[1]):
+        try:
+            data = json.loads(text[start:end])
+        except json.JSONDecodeError:
+            continue
+        if isinstance(data, dict):
+            return data
+
+    if repair and unclosed_start is not None:
+        return repair_truncated(text[unclosed_start:])
+    return None
@@ -0,0 +1,117 @@
+import hashlib
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Tuple
+
+from .single_flight import SingleFlight
+
+
+class ComponentRegistry:
+    """
+    Builds expensive components (agents, crews) on first use, once per configuration
+
+    A component is identified by its name plus the configuration it was built with, so
+    two crews with the same settings share agents while a different API key or model
+    gets its own. Concurrent first requests share one build. Build times are recorded
+    per component; their sum is the cold-start cost a worker pays for what it used.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._components: Dict[Tuple[str, str], Any] = {}
+        self._flights = SingleFlight()
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    @staticmethod
+    def config_key(*config: Any) -> str:
+        """Digest of the configuration (keeps API keys out of the registry's keys)"""
+        return hashlib.sha256(repr(config).encode("utf-8")).hexdigest()[:16]
+
+    def get(self, name: str, factory: Callable[[], Any], *config: Any) -> Any:
+        """The component built by ``factory`` for ``name`` and ``config``, building it if needed"""
+        key = (name, self.config_key(*config))
+        with self._lock:
+            component = self._components.get(key)
+            counts = self._stats.setdefault(name, {"builds": 0, "reused": 0, "build_seconds": 0.0})
+            if component is not None:
+                counts["reused"] += 1
+                return component
+
+        component, _ = self._flights.do(f"{name}:{key[1]}", lambda: self._build(key, factory))
+        return component
+
+    def peek(self, name: str, *config: Any) -> Optional[Any]:
+        """The component if it has already been built, without building it"""
+        with self._lock:
+            return self._components.get((name, self.config_key(*config)))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Builds, reuse and build time per component"""
+        with self._lock:
+            components = {name: dict(counts) for name, counts in self._stats.items()}
+            built = len(self._components)
+        return {
+            "built": built,
+            "cold_start_seconds": round(sum(counts["build_seconds"] for counts in components.values()), 4),
+            "components": components
+        }
+
+    def _build(self, key: Tuple[str, str], factory: Callable[[], Any]) -> Any:
+        with self._lock:
+            component = self._components.get(key)
+        if component is not None:
+            return component
+
+        started = time.perf_counter()
+        component = factory()
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self._components[key] = component
+            counts = self._stats[key[0]]
+            counts["builds"] += 1
+            counts["build_seconds"] += elapsed
+        return component
+
+
+class LazyComponents(Mapping):
+    """
+    Read-only mapping whose values are built through a ComponentRegistry on first access
+
+    Lets call sites keep ``components['name']`` lookups while only the components a
+    process actually touches are constructed.
+    """
+
+    def __init__(self, factories: Dict[str, Callable[[], Any]], config: Tuple = (),
+                 registry: Optional[ComponentRegistry] = None):
+        self._factories = factories
+        self._config = config
+        self._registry = registry or get_component_registry()
+
+    def __getitem__(self, name: str) -> Any:
+        return self._registry.get(name, self._factories[name], *self._config)
+
+    def built(self, name: str) -> Optional[Any]:
+        """The component if something has already used it, else None"""
+        return self._registry.peek(name, *self._config)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._factories)
+
+    def __len__(self) -> int:
+        return len(self._factories)
+
+
+_registry: Optional[ComponentRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_component_registry() -> ComponentRegistry:
+    """Get or initialize the process-wide component registry"""
+    global _registry
+
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = ComponentRegistry()
+
+    return _registry
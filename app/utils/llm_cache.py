@@ -0,0 +1,178 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+
+class LLMResponseCache:
+    """Two-tier (in-memory LRU + SQLite) cache for rendered LLM prompts"""
+
+    def __init__(self, max_memory_entries: int = 512, db_path: Optional[str] = None):
+        self.max_memory_entries = max_memory_entries
+        self.db_path = db_path
+        self._memory: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+        if self.db_path:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with self._connect() as conn:
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS llm_responses (
+                        key TEXT PRIMARY KEY,
+                        namespace TEXT NOT NULL,
+                        value TEXT NOT NULL,
+                        expires_at REAL NOT NULL
+                    )
+                    """
+                )
+
+    @staticmethod
+    def make_key(role: str, model: str, temperature: Any, description: str) -> str:
+        """Hash the parts of a call that determine its response"""
+        payload = json.dumps([role, model, temperature, description], ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str, namespace: str = "default") -> Optional[str]:
+        """Get a cached response, checking memory first and then disk"""
+        now = time.time()
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    self._count(namespace, "memory_hits")
+                    return value
+                # Expired entries stay until evicted so get_stale() can still serve them
+
+        if self.db_path:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT value, expires_at FROM llm_responses WHERE key = ?", (key,)
+                ).fetchone()
+            if row is not None and row[1] > now:
+                with self._lock:
+                    self._remember(key, row[0], row[1])
+                    self._count(namespace, "disk_hits")
+                return row[0]
+
+        with self._lock:
+            self._count(namespace, "misses")
+        return None
+
+    def get_stale(self, key: str, namespace: str = "default") -> Optional[str]:
+        """Get a cached response even if it has expired (fallback while the LLM is unavailable)"""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._count(namespace, "stale_hits")
+                return entry[0]
+
+        if self.db_path:
+            with self._connect() as conn:
+                row = conn.execute("SELECT value FROM llm_responses WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                with self._lock:
+                    self._count(namespace, "stale_hits")
+                return row[0]
+
+        return None
+
+    def set(self, key: str, value: str, ttl_seconds: float, namespace: str = "default"):
+        """Store a response in both tiers"""
+        expires_at = time.time() + ttl_seconds
+
+        with self._lock:
+            self._remember(key, value, expires_at)
+            self._count(namespace, "writes")
+
+        if self.db_path:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_responses (key, namespace, value, expires_at) VALUES (?, ?, ?, ?)",
+                    (key, namespace, value, expires_at)
+                )
+
+    def purge_expired(self) -> int:
+        """Remove expired entries from the disk tier"""
+        if not self.db_path:
+            return 0
+        with self._connect() as conn:
+            cursor = conn.execute("DELETE FROM llm_responses WHERE expires_at <= ?", (time.time(),))
+            return cursor.rowcount
+
+    def clear(self):
+        """Remove all cached responses and reset counters"""
+        with self._lock:
+            self._memory.clear()
+            self._stats.clear()
+        if self.db_path:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM llm_responses")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters per namespace"""
+        with self._lock:
+            namespaces = {name: dict(counts) for name, counts in self._stats.items()}
+            memory_entries = len(self._memory)
+
+        hits = sum(c.get("memory_hits", 0) + c.get("disk_hits", 0) for c in namespaces.values())
+        misses = sum(c.get("misses", 0) for c in namespaces.values())
+        return {
+            "memory_entries": memory_entries,
+            "max_memory_entries": self.max_memory_entries,
+            "disk_enabled": bool(self.db_path),
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            "namespaces": namespaces
+        }
+
+    def _remember(self, key: str, value: str, expires_at: float):
+        self._memory[key] = (value, expires_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _count(self, namespace: str, counter: str):
+        counts = self._stats.setdefault(namespace, {})
+        counts[counter] = counts.get(counter, 0) + 1
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """A connection for one transaction, committed (or rolled back) and then closed"""
+        conn = sqlite3.connect(self.db_path, timeout=5)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+
+_cache: Optional[LLMResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """Get or initialize the process-wide LLM response cache"""
+    global _cache
+
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = LLMResponseCache(
+                    max_memory_entries=int(os.getenv("LLM_CACHE_MAX_ENTRIES", "512")),
+                    db_path=os.getenv("LLM_CACHE_PATH", ".cache/llm_cache.sqlite3") or None
+                )
+
+    return _cache
@@ -0,0 +1,142 @@
+import os
+import sys
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class AgentTask:
+    """
+    A rendered prompt for the shared LLM layer
+
+    Carries what the runtime reads from a task (``description``, ``expected_output`` and
+    the ``agent`` persona) without the validation cost of building a crewai Task per call.
+    """
+
+    __slots__ = ("description", "expected_output", "agent")
+
+    def __init__(self, description: str, expected_output: str, agent: Any = None):
+        self.description = description
+        self.expected_output = expected_output
+        self.agent = agent
+
+
+def _default_llm_factory(**settings) -> Any:
+    from crewai import LLM
+    return LLM(**settings)
+
+
+class LLMClientRegistry:
+    """
+    Process-wide registry of LLM handles sharing one pooled HTTP client
+
+    Agents ask for a handle with their model settings; identical settings share one
+    handle. All calls go out through a single keep-alive connection pool (so TLS sessions
+    are reused across agents and calls) capped at ``max_connections`` sockets.
+    """
+
+    def __init__(self, max_connections: int = 20, max_keepalive_connections: int = 10,
+                 keepalive_expiry: float = 60.0, http2: bool = False,
+                 llm_factory: Callable[..., Any] = _default_llm_factory):
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = http2
+        self._llm_factory = llm_factory
+        self._lock = threading.Lock()
+        self._handles: Dict[Tuple, Any] = {}
+        self._http_client = None
+        self._litellm_client = None
+        self._requests = 0
+        self._reused = 0
+
+    def llm(self, **settings) -> Any:
+        """Shared LLM handle for these settings (model, provider, temperature, api_key, ...)"""
+        key = tuple(sorted((name, str(value)) for name, value in settings.items()))
+        with self._lock:
+            self._requests += 1
+            handle = self._handles.get(key)
+            if handle is None:
+                handle = self._handles[key] = self._llm_factory(**settings)
+            else:
+                self._reused += 1
+            return handle
+
+    def http_client(self) -> Any:
+        """The pooled HTTP client, created and installed as litellm's session on first use"""
+        with self._lock:
+            if self._http_client is None:
+                import httpx
+
+                self._http_client = httpx.Client(
+                    limits=httpx.Limits(
+                        max_connections=self.max_connections,
+                        max_keepalive_connections=self.max_keepalive_connections,
+                        keepalive_expiry=self.keepalive_expiry
+                    ),
+                    http2=self.http2
+                )
+                try:
+                    import litellm
+                    litellm.client_session = self._http_client
+                except ImportError:
+                    pass
+            return self._http_client
+
+    def litellm_client(self) -> Any:
+        """
+        litellm's HTTP handler over the pooled client, passed explicitly as ``client=`` on
+        calls whose provider ignores ``litellm.client_session`` (Gemini)
+        """
+        http_client = self.http_client()
+        with self._lock:
+            if self._litellm_client is None:
+                from litellm.llms.custom_httpx.http_handler import HTTPHandler
+
+                self._litellm_client = HTTPHandler(client=http_client)
+            return self._litellm_client
+
+    def close(self):
+        """Close pooled connections (the client is recreated on next use)"""
+        with self._lock:
+            if self._http_client is not None:
+                self._http_client.close()
+                # Don't leave litellm sending requests through the closed client
+                litellm = sys.modules.get("litellm")
+                if litellm is not None and getattr(litellm, "client_session", None) is self._http_client:
+                    litellm.client_session = None
+                self._http_client = None
+            self._litellm_client = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Handle reuse and pool limits"""
+        with self._lock:
+            return {
+                "handles": len(self._handles),
+                "handle_requests": self._requests,
+                "handles_reused": self._reused,
+                "pool_open": self._http_client is not None,
+                "max_connections": self.max_connections,
+                "max_keepalive_connections": self.max_keepalive_connections,
+                "http2": self.http2
+            }
+
+
+_registry: Optional[LLMClientRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_llm_client_registry() -> LLMClientRegistry:
+    """Get or initialize the process-wide LLM client registry"""
+    global _registry
+
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = LLMClientRegistry(
+                    max_connections=int(os.getenv("LLM_POOL_MAX_CONNECTIONS", "20")),
+                    max_keepalive_connections=int(os.getenv("LLM_POOL_MAX_KEEPALIVE", "10")),
+                    keepalive_expiry=float(os.getenv("LLM_POOL_KEEPALIVE_SECONDS", "60")),
+                    http2=os.getenv("LLM_POOL_HTTP2", "false").lower() == "true"
+                )
+
+    return _registry
@@ -0,0 +1,209 @@
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Optional
+
+
+class LLMDeadlineExceeded(TimeoutError):
+    """Raised when no attempt of a deadline-bound LLM call finished in time"""
+
+
+class HedgePolicy:
+    """
+    Latency SLO for one agent task
+
+    Args:
+        name: Task name, used for latency tracking and the ``LLM_DEADLINE_<NAME>`` override
+        deadline_seconds: Overall deadline propagated into every attempt (None for no deadline)
+        hedge: Fire a second request once the call runs past the observed percentile
+        hedge_percentile: Latency percentile after which the hedge fires
+        initial_hedge_delay: Hedge delay until ``min_samples`` latencies have been observed
+        min_hedge_delay: Lower bound on the hedge delay
+        min_samples: Observations needed before the percentile is trusted
+        max_hedge_ratio: Cap on the share of calls that may hedge, bounding extra load
+    """
+
+    def __init__(self, name: str, deadline_seconds: Optional[float] = None, hedge: bool = True,
+                 hedge_percentile: float = 0.95, initial_hedge_delay: float = 8.0,
+                 min_hedge_delay: float = 1.0, min_samples: int = 20, max_hedge_ratio: float = 0.1):
+        self.name = name
+        self.deadline_seconds = deadline_seconds
+        self.hedge = hedge
+        self.hedge_percentile = hedge_percentile
+        self.initial_hedge_delay = initial_hedge_delay
+        self.min_hedge_delay = min_hedge_delay
+        self.min_samples = min_samples
+        self.max_hedge_ratio = max_hedge_ratio
+
+    def deadline(self) -> Optional[float]:
+        """Deadline in seconds (env ``LLM_DEADLINE_<NAME>`` overrides; 0 disables)"""
+        override = os.getenv(f"LLM_DEADLINE_{self.name.upper()}")
+        if override is not None:
+            return float(override) or None
+        return self.deadline_seconds
+
+
+class LatencyTracker:
+    """Rolling window of call latencies"""
+
+    def __init__(self, window: int = 200):
+        self._samples: deque = deque(maxlen=window)
+
+    def record(self, seconds: float):
+        self._samples.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class LLMHedger:
+    """
+    Runs deadline-bound LLM calls, hedging slow ones
+
+    The call is an ``attempt(deadline, cancel)`` callable: ``deadline`` is the absolute
+    ``time.monotonic()`` by which it must finish (or None), and ``cancel`` is an event set
+    once another attempt has won, which the attempt checks to abandon its request. When
+    the primary attempt runs past the policy's latency percentile a second attempt is
+    fired; the first to succeed wins and the other is cancelled.
+    """
+
+    def __init__(self, max_workers: int = 16, enabled: bool = True):
+        self.enabled = enabled
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="llm-hedge")
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, LatencyTracker] = {}
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+    def run(self, key: str, attempt: Callable[[Optional[float], threading.Event], Optional[str]],
+            policy: HedgePolicy) -> str:
+        """Run ``attempt`` under ``policy``, returning the first successful result"""
+        started = time.monotonic()
+        deadline_seconds = policy.deadline()
+        deadline = started + deadline_seconds if deadline_seconds else None
+        hedge_at = started + self._hedge_delay(key, policy) if self._may_hedge(key, policy) else None
+        cancel = threading.Event()
+
+        self._count(key, "calls")
+        futures = {self._pool.submit(self._timed, attempt, deadline, cancel): "primary"}
+        error: Optional[BaseException] = None
+
+        try:
+            while futures:
+                wake_times = [t for t in (deadline, hedge_at) if t is not None]
+                timeout = max(0.0, min(wake_times) - time.monotonic()) if wake_times else None
+                done, _ = wait(list(futures), timeout=timeout, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    label = futures.pop(future)
+                    try:
+                        result, elapsed = future.result()
+                    except Exception as e:
+                        error = error or e
+                        continue
+                    if result is None:
+                        continue
+                    self._record_win(key, label, elapsed, time.monotonic() - started)
+                    return result
+
+                now = time.monotonic()
+                if deadline is not None and now >= deadline:
+                    self._count(key, "deadline_exceeded")
+                    raise LLMDeadlineExceeded(f"{key} missed its {deadline_seconds:.1f}s deadline")
+                if hedge_at is not None and now >= hedge_at:
+                    hedge_at = None
+                    if futures:
+                        self._count(key, "hedged")
+                        futures[self._pool.submit(self._timed, attempt, deadline, cancel)] = "hedge"
+        finally:
+            cancel.set()
+
+        raise error if error is not None else LLMDeadlineExceeded(f"{key} was cancelled")
+
+    @staticmethod
+    def _timed(attempt, deadline, cancel):
+        started = time.monotonic()
+        result = attempt(deadline, cancel)
+        return result, time.monotonic() - started
+
+    def _hedge_delay(self, key: str, policy: HedgePolicy) -> float:
+        with self._lock:
+            tracker = self._latencies.get(key)
+            if tracker is None or len(tracker) < policy.min_samples:
+                return policy.initial_hedge_delay
+            return max(policy.min_hedge_delay, tracker.percentile(policy.hedge_percentile))
+
+    def _may_hedge(self, key: str, policy: HedgePolicy) -> bool:
+        if not (self.enabled and policy.hedge):
+            return False
+        with self._lock:
+            stats = self._stats.get(key)
+            if not stats or not stats["calls"]:
+                return True
+            return stats["hedged"] / stats["calls"] < policy.max_hedge_ratio
+
+    def _stats_for(self, key: str) -> Dict[str, Any]:
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = {
+                "calls": 0, "hedged": 0, "hedge_wins": 0, "deadline_exceeded": 0,
+                "estimated_seconds_saved": 0.0
+            }
+        return stats
+
+    def _count(self, key: str, field: str):
+        with self._lock:
+            self._stats_for(key)[field] += 1
+
+    def _record_win(self, key: str, label: str, attempt_seconds: float, total_seconds: float):
+        with self._lock:
+            tracker = self._latencies.setdefault(key, LatencyTracker())
+            stats = self._stats_for(key)
+            if label == "hedge":
+                # The primary was still running; credit the gap to the observed tail
+                stats["hedge_wins"] += 1
+                tail = tracker.percentile(0.99)
+                if tail is not None:
+                    stats["estimated_seconds_saved"] += max(0.0, tail - total_seconds)
+            tracker.record(attempt_seconds)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-task call, hedge and latency statistics"""
+        with self._lock:
+            result = {}
+            for key, stats in self._stats.items():
+                tracker = self._latencies.get(key)
+                result[key] = {
+                    **stats,
+                    "estimated_seconds_saved": round(stats["estimated_seconds_saved"], 3),
+                    "hedge_rate": stats["hedged"] / stats["calls"] if stats["calls"] else 0.0,
+                    "p50_seconds": tracker.percentile(0.5) if tracker else None,
+                    "p95_seconds": tracker.percentile(0.95) if tracker else None
+                }
+            return result
+
+
+_hedger: Optional[LLMHedger] = None
+_hedger_lock = threading.Lock()
+
+
+def get_llm_hedger() -> LLMHedger:
+    """Get or initialize the process-wide LLM hedger"""
+    global _hedger
+
+    if _hedger is None:
+        with _hedger_lock:
+            if _hedger is None:
+                _hedger = LLMHedger(
+                    max_workers=int(os.getenv("LLM_HEDGE_WORKERS", "16")),
+                    enabled=os.getenv("LLM_HEDGING_ENABLED", "true").lower() != "false"
+                )
+
+    return _hedger
@@ -0,0 +1,148 @@
+import os
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterator, List, Optional, Type
+
+from pydantic import BaseModel
+
+
+def render_messages(agent: Any, task: Any) -> List[Dict[str, str]]:
+    """Render an agent persona and task into chat messages"""
+    system = f"You are {agent.role}. {agent.backstory}\nYour personal goal is: {agent.goal}"
+    user = f"{task.description}\n\nThis is the expected criteria for your final answer: {task.expected_output}"
+    return [
+        {"role": "system", "content": system},
+        {"role": "user", "content": user}
+    ]
+
+
+def litellm_model_name(llm: Any) -> str:
+    """Provider-qualified model name for litellm"""
+    model = str(getattr(llm, "model", None) or getattr(llm, "model_name", ""))
+    if "/" in model:
+        return model
+    if model.startswith("gemini"):
+        return f"gemini/{model}"
+    return model
+
+
+def response_format_for(response_model: Optional[Type[BaseModel]]) -> Optional[Dict[str, Any]]:
+    """
+    Native structured output request for a response schema
+
+    LLM_RESPONSE_FORMAT selects ``json_object`` (JSON mode, the default), ``json_schema``
+    (JSON mode constrained to the schema) or ``off`` (free text).
+    """
+    mode = os.getenv("LLM_RESPONSE_FORMAT", "json_object").lower()
+    if response_model is None or mode == "off":
+        return None
+    if mode == "json_schema":
+        return {
+            "type": "json_schema",
+            "json_schema": {"name": response_model.__name__, "schema": response_model.model_json_schema()}
+        }
+    return {"type": "json_object"}
+
+
+class LLMProvider(ABC):
+    """Backend that runs a rendered agent task and returns the model's text"""
+
+    name = "base"
+
+    @abstractmethod
+    def complete(self, owner: Any, task: Any, response_model: Optional[Type[BaseModel]] = None,
+                 timeout: Optional[float] = None) -> str:
+        """Run a task to completion (``timeout`` in seconds bounds the request)"""
+
+    def stream(self, owner: Any, task: Any, response_model: Optional[Type[BaseModel]] = None,
+               timeout: Optional[float] = None) -> Iterator[str]:
+        """
+        Run a task, yielding text chunks (providers without streaming yield one chunk)
+
+        Closing the iterator early abandons the request.
+        """
+        yield self.complete(owner, task, response_model, timeout)
+
+
+class LiteLLMProvider(LLMProvider):
+    """Calls the agent's model through litellm, requesting native JSON output for schemas"""
+
+    name = "litellm"
+
+    def complete(self, owner: Any, task: Any, response_model: Optional[Type[BaseModel]] = None,
+                 timeout: Optional[float] = None) -> str:
+        response = self._request(owner, task, response_model, timeout, stream=False)
+        return response.choices[0].message.content or ""
+
+    def stream(self, owner: Any, task: Any, response_model: Optional[Type[BaseModel]] = None,
+               timeout: Optional[float] = None) -> Iterator[str]:
+        response = self._request(owner, task, response_model, timeout, stream=True)
+        try:
+            for chunk in response:
+                text = chunk.choices[0].delta.content
+                if text:
+                    yield text
+        finally:
+            # Release the HTTP stream when the caller stops early
+            close = getattr(response, "close", None)
+            if close is not None:
+                close()
+
+    @staticmethod
+    def _request(owner: Any, task: Any, response_model: Optional[Type[BaseModel]],
+                 timeout: Optional[float], stream: bool):
+        import litellm
+
+        from .llm_clients import get_llm_client_registry
+
+        llm = owner.llm
+        model = litellm_model_name(llm)
+        kwargs = {}
+        # Route the call through the shared connection pool: installed as litellm's session
+        # for OpenAI-compatible providers, passed explicitly for Gemini, which ignores it
+        registry = get_llm_client_registry()
+        registry.http_client()
+        if model.startswith("gemini/"):
+            kwargs["client"] = registry.litellm_client()
+        response_format = response_format_for(response_model)
+        if response_format is not None:
+            kwargs["response_format"] = response_format
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+
+        return litellm.completion(
+            model=model,
+            messages=render_messages(owner.agent, task),
+            temperature=getattr(llm, "temperature", None),
+            api_key=getattr(llm, "api_key", None),
+            stream=stream,
+            **kwargs
+        )
+
+
+_provider: Optional[LLMProvider] = None
+_provider_lock = threading.Lock()
+
+
+def get_llm_provider() -> LLMProvider:
+    """Get or initialize the process-wide LLM provider (env LLM_PROVIDER: litellm or fake)"""
+    global _provider
+
+    if _provider is None:
+        with _provider_lock:
+            if _provider is None:
+                if os.getenv("LLM_PROVIDER", "litellm").lower() == "fake":
+                    from .fake_llm_provider import FakeLLMProvider
+                    _provider = FakeLLMProvider.from_env()
+                else:
+                    _provider = LiteLLMProvider()
+
+    return _provider
+
+
+def set_llm_provider(provider: Optional[LLMProvider]):
+    """Replace the process-wide LLM provider (None restores the default on next use)"""
+    global _provider
+
+    with _provider_lock:
+        _provider = provider
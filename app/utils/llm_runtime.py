@@ -0,0 +1,300 @@
+import os
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Type
+
+from pydantic import ValidationError
+
+from ..models.llm_responses import LLMResponse
+from .circuit_breaker import CircuitOpenError, get_circuit_breaker
+from .json_extraction import extract_json_object
+from .llm_cache import LLMResponseCache, get_llm_cache
+from .llm_hedging import HedgePolicy, LLMDeadlineExceeded, get_llm_hedger
+from .llm_provider import get_llm_provider
+from .llm_scheduler import Priority, estimate_tokens, get_llm_scheduler, is_rate_limit_error
+from .model_router import get_model_router
+from .prompt_budget import get_prompt_meter
+from .single_flight import get_single_flight
+
+# Allowance for the response when budgeting tokens per call
+OUTPUT_TOKEN_ALLOWANCE = 1500
+
+RATE_LIMIT_RETRIES = 2
+
+
+def _llm_settings(owner: Any):
+    """Get (model, temperature) from an agent wrapper's LLM"""
+    llm = owner.llm
+    model = getattr(llm, "model", None) or getattr(llm, "model_name", "unknown")
+    return str(model), getattr(llm, "temperature", None)
+
+
+def cache_key_for(owner: Any, task: Any) -> str:
+    """Cache key for running a task on an agent wrapper"""
+    model, temperature = _llm_settings(owner)
+    return LLMResponseCache.make_key(owner.agent.role, model, temperature, task.description)
+
+
+def estimate_task_tokens(task: Any) -> int:
+    """Token budget to reserve for a task (prompt plus response allowance)"""
+    return estimate_tokens(task.description) + OUTPUT_TOKEN_ALLOWANCE
+
+
+def _call_provider(owner: Any, task: Any, priority: Priority,
+                   response_model: Optional[Type[LLMResponse]],
+                   deadline: Optional[float] = None,
+                   cancel: Optional[threading.Event] = None) -> Optional[str]:
+    """
+    One provider call under the LLM governor, retrying rate-limit errors
+
+    With a ``deadline`` (``time.monotonic()``) the remaining time is passed to the provider
+    as its request timeout. With a ``cancel`` event the response is streamed and abandoned
+    as soon as the event is set, in which case None is returned; an attempt cancelled
+    before it is admitted gives up its place in the governor without spending budget.
+    """
+    scheduler = get_llm_scheduler()
+    provider = get_llm_provider()
+    attempt = 0
+    while True:
+        try:
+            with scheduler.acquire(priority, estimate_task_tokens(task), cancel) as admitted:
+                if not admitted:
+                    # The other attempt won before this one was sent; no budget was spent
+                    return None
+                timeout = None
+                if deadline is not None:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        raise LLMDeadlineExceeded("Deadline passed while waiting for the LLM governor")
+                if cancel is None:
+                    return provider.complete(owner, task, response_model, timeout)
+
+                chunks = []
+                stream = provider.stream(owner, task, response_model, timeout)
+                try:
+                    for chunk in stream:
+                        if cancel.is_set():
+                            return None
+                        chunks.append(chunk)
+                finally:
+                    stream.close()
+                return "".join(chunks)
+        except Exception as e:
+            if not is_rate_limit_error(e) or attempt >= RATE_LIMIT_RETRIES:
+                raise
+            scheduler.report_rate_limited()
+            attempt += 1
+            time.sleep(attempt)
+
+
+def stream_provider(owner: Any, task: Any, priority: Priority,
+                    response_model: Optional[Type[LLMResponse]] = None) -> Iterator[str]:
+    """
+    Stream one provider call under the LLM governor, retrying rate-limit errors
+
+    Rate-limit errors are reported to the scheduler and retried like _call_provider's, but
+    only until the first chunk has been yielded; after that the caller has relayed part of
+    the response and the error is raised. The scheduler slot is held while streaming.
+    """
+    scheduler = get_llm_scheduler()
+    provider = get_llm_provider()
+    attempt = 0
+    while True:
+        started = False
+        try:
+            with scheduler.acquire(priority, estimate_task_tokens(task)):
+                stream = provider.stream(owner, task, response_model)
+                try:
+                    for chunk in stream:
+                        started = True
+                        yield chunk
+                finally:
+                    stream.close()
+                return
+        except Exception as e:
+            if started or not is_rate_limit_error(e) or attempt >= RATE_LIMIT_RETRIES:
+                raise
+            scheduler.report_rate_limited()
+            attempt += 1
+            time.sleep(attempt)
+
+
+def _run_task(owner: Any, namespace: str, task: Any, priority: Priority,
+              response_model: Optional[Type[LLMResponse]], hedge: Optional[HedgePolicy],
+              accept: Optional[Callable[[str], bool]] = None) -> Tuple[str, bool, bool]:
+    """
+    Serve a task from the cache or run it once
+
+    Concurrent calls with the same rendered prompt share one in-flight execution.
+
+    Returns:
+        (result, accepted, cached): results rejected by ``accept`` are not cached; ``cached``
+        is also True for calls that shared another caller's execution
+
+    Raises:
+        CircuitOpenError: The circuit breaker is open; carries any expired cached response
+    """
+    ttl = getattr(owner, "cache_ttl_seconds", 0)
+    use_cache = ttl > 0 and os.getenv("LLM_CACHE_ENABLED", "true").lower() != "false"
+    cache = get_llm_cache()
+    key = cache_key_for(owner, task)
+
+    if use_cache:
+        cached = cache.get(key, namespace)
+        if cached is not None:
+            return cached, accept is None or accept(cached), True
+
+    def run() -> str:
+        breaker = get_circuit_breaker()
+        if not breaker.allow():
+            raise CircuitOpenError(breaker.retry_after(), cache.get_stale(key, namespace) if use_cache else None)
+
+        get_prompt_meter().record(namespace, task.description)
+        try:
+            if hedge is None:
+                result = _call_provider(owner, task, priority, response_model)
+            else:
+                result = get_llm_hedger().run(
+                    f"{namespace}.{hedge.name}",
+                    lambda deadline, cancel: _call_provider(owner, task, priority, response_model, deadline, cancel),
+                    hedge
+                )
+        except Exception:
+            breaker.record_failure()
+            raise
+        breaker.record_success()
+
+        if use_cache and (accept is None or accept(result)):
+            cache.set(key, result, ttl, namespace)
+        return result
+
+    result, shared = get_single_flight().do(key, run, namespace)
+    return result, accept is None or accept(result), shared
+
+
+def execute_agent_task(owner: Any, task: Any, priority: Priority = Priority.NORMAL,
+                       response_model: Optional[Type[LLMResponse]] = None,
+                       hedge: Optional[HedgePolicy] = None,
+                       route: Optional[str] = None) -> str:
+    """
+    Execute a task through the shared LLM layer
+
+    Args:
+        owner: Agent wrapper exposing ``agent``, ``llm`` and ``cache_ttl_seconds``
+        task: The rendered AgentTask
+        priority: Scheduling class for the global LLM governor
+        response_model: Response schema; requests native structured output from the provider
+        hedge: Latency SLO; applies its deadline and hedges calls slower than the observed tail
+        route: Task name for the model router, which picks the model tier and escalates to a
+            stronger tier when the output fails ``response_model`` validation
+
+    Returns:
+        str: Raw model output
+    """
+    namespace = owner.__class__.__name__
+    router = get_model_router()
+
+    if route is None or not router.enabled:
+        result, _, _ = _run_task(owner, namespace, task, priority, response_model, hedge)
+        return result
+
+    accept = None
+    if response_model is not None:
+        accept = lambda text: router.accepts(_parse_structured(text, response_model)[1])
+
+    prompt_tokens = estimate_tokens(task.description)
+    tier = router.select(route, prompt_tokens)
+    escalations = 0
+    while True:
+        routed = router.bind(owner, tier)
+        started = time.monotonic()
+        result, accepted, cached = _run_task(routed, namespace, task, priority, response_model, hedge, accept)
+        if not cached:
+            router.record(route, tier, _llm_settings(routed)[0], time.monotonic() - started,
+                          prompt_tokens, estimate_tokens(result), accepted)
+
+        next_tier = router.escalation(tier)
+        if accepted or next_tier is None or escalations >= router.max_escalations:
+            return result
+        escalations += 1
+        tier = next_tier
+
+
+_structured_stats: Dict[str, Dict[str, int]] = {}
+_structured_lock = threading.Lock()
+
+# Parse outcomes: "native" (validated as sent), "tolerant" (extracted from surrounding prose),
+# "repaired" (invalid fields dropped and filled from defaults) and "failed"
+PARSE_OUTCOMES = ("native", "tolerant", "repaired", "failed")
+
+
+def _record_structured(response_model: Type[LLMResponse], outcome: str):
+    with _structured_lock:
+        stats = _structured_stats.setdefault(response_model.__name__, dict.fromkeys(PARSE_OUTCOMES, 0))
+        stats[outcome] += 1
+
+
+@lru_cache(maxsize=64)
+def _parse_structured(text: str, response_model: Type[LLMResponse]) -> Tuple[Optional[LLMResponse], str]:
+    """Parse and outcome, memoized so the router's check and the agent's parse of the same
+    output share one validation (outcomes are counted by the callers, not here)"""
+    try:
+        return response_model.model_validate_json(text), "native"
+    except ValidationError:
+        pass
+
+    data = extract_json_object(text)
+    if data is None:
+        return None, "failed"
+    try:
+        return response_model.model_validate(data), "tolerant"
+    except ValidationError:
+        pass
+    try:
+        return response_model.tolerant_validate(data), "repaired"
+    except ValidationError:
+        return None, "failed"
+
+
+def parse_structured_output(text: str, response_model: Type[LLMResponse]) -> Optional[LLMResponse]:
+    """
+    Validate model output into its response schema
+
+    Output from native structured output mode validates directly; anything else goes
+    through the tolerant extractor and validation. Returns None if neither succeeds.
+    """
+    parsed, outcome = _parse_structured(text, response_model)
+    _record_structured(response_model, outcome)
+    return parsed
+
+
+def degraded_response(error: CircuitOpenError, parse: Callable[[str], Dict[str, Any]],
+                      fallback: Optional[Callable[[], Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """
+    Result to serve while the circuit breaker is open
+
+    Prefers the expired cached response for the same prompt (run through ``parse``), then
+    ``fallback``; re-raises ``error`` when neither is available. The result is flagged with
+    ``degraded`` and ``degraded_source``.
+    """
+    if error.stale_result is not None:
+        data = parse(error.stale_result)
+        if "error" not in data:
+            return mark_degraded(data, "stale_cache")
+    if fallback is not None:
+        return mark_degraded(fallback(), "heuristic")
+    raise error
+
+
+def mark_degraded(data: Dict[str, Any], source: str) -> Dict[str, Any]:
+    """Flag a result as served without a live LLM call"""
+    data["degraded"] = True
+    data["degraded_source"] = source
+    return data
+
+
+def get_structured_output_stats() -> Dict[str, Dict[str, int]]:
+    """Per-schema counts of native, tolerant and failed parses"""
+    with _structured_lock:
+        return {name: dict(stats) for name, stats in _structured_stats.items()}
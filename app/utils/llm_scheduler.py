@@ -0,0 +1,193 @@
+import heapq
+import itertools
+import os
+import threading
+import time
+from contextlib import contextmanager
+from enum import IntEnum
+from typing import Any, Dict, Iterator, Optional
+
+
+class Priority(IntEnum):
+    """LLM call priority classes (lower runs first)"""
+    INTERACTIVE = 0
+    NORMAL = 1
+    BACKGROUND = 2
+
+
+class TokenBucket:
+    """Token bucket refilled continuously up to its capacity"""
+
+    def __init__(self, capacity: float, refill_per_second: float):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.available = capacity
+        self._updated_at = time.monotonic()
+
+    def refill(self):
+        now = time.monotonic()
+        self.available = min(self.capacity, self.available + (now - self._updated_at) * self.refill_per_second)
+        self._updated_at = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until ``amount`` is available (0 if available now)"""
+        self.refill()
+        if self.available >= amount:
+            return 0.0
+        return (amount - self.available) / self.refill_per_second
+
+    def take(self, amount: float):
+        self.available -= amount
+
+    def drain(self):
+        """Empty the bucket, e.g. after the provider reports a rate limit"""
+        self.refill()
+        self.available = 0.0
+
+
+class LLMScheduler:
+    """
+    Process-wide governor for LLM calls
+
+    Calls are admitted strictly in priority order (FIFO within a class) once a
+    concurrency slot and enough requests-per-minute and tokens-per-minute budget
+    are available. The budgets should match the provider quota (LLM_REQUESTS_PER_MINUTE,
+    LLM_TOKENS_PER_MINUTE); the defaults are conservative.
+    """
+
+    def __init__(self, requests_per_minute: float = 60, tokens_per_minute: float = 1_000_000,
+                 max_concurrent: int = 8):
+        self.max_concurrent = max_concurrent
+        self._requests = TokenBucket(requests_per_minute, requests_per_minute / 60.0)
+        self._tokens = TokenBucket(tokens_per_minute, tokens_per_minute / 60.0)
+        self._condition = threading.Condition()
+        self._waiters: list = []
+        self._sequence = itertools.count()
+        self._running = 0
+        self._rate_limited = 0
+        self._cancelled = 0
+        self._stats = {
+            priority.name.lower(): {"admitted": 0, "total_wait_seconds": 0.0, "max_wait_seconds": 0.0}
+            for priority in Priority
+        }
+
+    @contextmanager
+    def acquire(self, priority: Priority = Priority.NORMAL, estimated_tokens: int = 0,
+                cancel: Optional[threading.Event] = None) -> Iterator[bool]:
+        """
+        Block until the call may run, then hold a concurrency slot for its duration
+
+        With a ``cancel`` event (a hedge that may lose before it sends) the wait is abandoned
+        once the event is set, and a call cancelled by the time it is admitted takes no
+        request or token budget. Yields False in both cases; the caller must not send.
+        """
+        tokens = min(max(estimated_tokens, 0), self._tokens.capacity)
+        entry = (int(priority), next(self._sequence))
+        enqueued_at = time.monotonic()
+        # An Event does not wake the condition, so a cancellable wait polls it
+        poll = 0.05 if cancel is not None else None
+
+        cancelled = False
+        with self._condition:
+            heapq.heappush(self._waiters, entry)
+            while True:
+                if cancel is not None and cancel.is_set():
+                    cancelled = True
+                    break
+                if self._waiters[0] == entry and self._running < self.max_concurrent:
+                    wait = max(self._requests.wait_time(1), self._tokens.wait_time(tokens))
+                    if wait == 0:
+                        break
+                    self._condition.wait(timeout=min(wait, poll) if poll else wait)
+                else:
+                    self._condition.wait(timeout=poll)
+
+            if cancelled:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+                self._cancelled += 1
+            else:
+                heapq.heappop(self._waiters)
+                self._requests.take(1)
+                self._tokens.take(tokens)
+                self._running += 1
+                self._record_wait(priority, time.monotonic() - enqueued_at)
+            self._condition.notify_all()
+
+        if cancelled:
+            yield False
+            return
+
+        try:
+            yield True
+        finally:
+            with self._condition:
+                self._running -= 1
+                self._condition.notify_all()
+
+    def report_rate_limited(self):
+        """Back every caller off after the provider returned a rate-limit error"""
+        with self._condition:
+            self._rate_limited += 1
+            self._requests.drain()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get queue depth, budget and per-priority wait metrics"""
+        with self._condition:
+            self._requests.refill()
+            self._tokens.refill()
+            priorities = {}
+            for name, stats in self._stats.items():
+                admitted = stats["admitted"]
+                priorities[name] = {
+                    "admitted": admitted,
+                    "avg_wait_seconds": stats["total_wait_seconds"] / admitted if admitted else 0.0,
+                    "max_wait_seconds": stats["max_wait_seconds"]
+                }
+            return {
+                "queue_depth": len(self._waiters),
+                "running": self._running,
+                "max_concurrent": self.max_concurrent,
+                "requests_available": round(self._requests.available, 2),
+                "tokens_available": round(self._tokens.available),
+                "rate_limited": self._rate_limited,
+                "cancelled_before_send": self._cancelled,
+                "priorities": priorities
+            }
+
+    def _record_wait(self, priority: Priority, wait_seconds: float):
+        stats = self._stats[priority.name.lower()]
+        stats["admitted"] += 1
+        stats["total_wait_seconds"] += wait_seconds
+        stats["max_wait_seconds"] = max(stats["max_wait_seconds"], wait_seconds)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate (about four characters per token)"""
+    return len(text) // 4 + 1
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Whether an exception looks like a provider rate-limit (HTTP 429) response"""
+    message = f"{type(error).__name__} {error}".lower()
+    return "429" in message or "ratelimit" in message or "rate limit" in message or "resource_exhausted" in message
+
+
+_scheduler: Optional[LLMScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_llm_scheduler() -> LLMScheduler:
+    """Get or initialize the process-wide LLM scheduler"""
+    global _scheduler
+
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = LLMScheduler(
+                    requests_per_minute=float(os.getenv("LLM_REQUESTS_PER_MINUTE", "60")),
+                    tokens_per_minute=float(os.getenv("LLM_TOKENS_PER_MINUTE", "1000000")),
+                    max_concurrent=int(os.getenv("LLM_MAX_CONCURRENCY", "8"))
+                )
+
+    return _scheduler
@@ -0,0 +1,214 @@
+import asyncio
+import json
+import os
+import threading
+from concurrent.futures import Future
+from contextlib import ExitStack, closing
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+from .agent_executor import get_agent_executor
+from .circuit_breaker import CircuitOpenError, get_circuit_breaker
+from .llm_cache import get_llm_cache
+from .llm_runtime import cache_key_for, mark_degraded, stream_provider
+from .llm_scheduler import Priority, estimate_tokens
+from .model_router import get_model_router
+from .prompt_budget import get_prompt_meter
+
+
+class IncrementalJSONSections:
+    """
+    Incremental scanner that reports top-level JSON members as soon as they are complete
+
+    Each character is scanned once, so feeding a streamed response costs linear time overall.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._position = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._member_start: Optional[int] = None
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """Add a chunk and return the (key, value) members it completed"""
+        self._buffer += chunk
+        completed = []
+
+        while self._position < len(self._buffer):
+            char = self._buffer[self._position]
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+                if self._depth == 1 and char == "{":
+                    self._member_start = self._position + 1
+            elif char in "}]":
+                if self._depth == 1:
+                    completed.extend(self._close_member())
+                self._depth = max(self._depth - 1, 0)
+            elif char == "," and self._depth == 1:
+                completed.extend(self._close_member())
+                self._member_start = self._position + 1
+
+            self._position += 1
+
+        return completed
+
+    def _close_member(self) -> List[Tuple[str, Any]]:
+        if self._member_start is None:
+            return []
+        segment = self._buffer[self._member_start:self._position].strip()
+        self._member_start = None
+        if not segment:
+            return []
+        try:
+            member = json.loads("{" + segment + "}")
+        except json.JSONDecodeError:
+            return []
+        return list(member.items())
+
+
+def stream_agent_events(owner: Any, task: Any, finalize: Callable[[str], Any],
+                        response_model: Optional[Type[BaseModel]] = None,
+                        route: Optional[str] = None,
+                        priority: Priority = Priority.NORMAL) -> Iterator[Dict[str, Any]]:
+    """
+    Stream a task as progress events
+
+    Yields dicts with an ``event`` name and ``data``: ``llm_started``, ``token`` for each text
+    chunk, ``section`` for each top-level JSON member once it is complete, and finally
+    ``result`` with ``finalize`` applied to the full response text. ``response_model``
+    requests native structured output for that schema. ``route`` names the task for the
+    model router (streamed output is not escalated). While the circuit breaker is open an
+    expired cached response is replayed and its result flagged as degraded; without one
+    CircuitOpenError is raised before any event is sent.
+
+    The provider call goes through stream_provider at ``priority``, so rate limits are
+    reported to the LLM scheduler and retried until the first token. The scheduler slot is
+    held while the provider streams, so consume this through stream_on_executor, which
+    reads it at generation speed rather than the client's.
+    """
+    ttl = getattr(owner, "cache_ttl_seconds", 0)
+    use_cache = ttl > 0 and os.getenv("LLM_CACHE_ENABLED", "true").lower() != "false"
+    namespace = owner.__class__.__name__
+
+    router = get_model_router()
+    if route is not None and router.enabled:
+        owner = router.bind(owner, router.select(route, estimate_tokens(task.description)))
+    key = None
+
+    cached = None
+    if use_cache:
+        key = cache_key_for(owner, task)
+        cached = get_llm_cache().get(key, namespace)
+
+    breaker = get_circuit_breaker()
+    degraded = False
+    if cached is None and not breaker.allow():
+        cached = get_llm_cache().get_stale(key, namespace) if use_cache else None
+        if cached is None:
+            raise CircuitOpenError(breaker.retry_after())
+        degraded = True
+
+    yield {"event": "llm_started", "data": {"agent": namespace, "cached": cached is not None}}
+
+    sections = IncrementalJSONSections()
+    parts = []
+    with ExitStack() as stack:
+        if cached is not None:
+            chunks = [cached]
+        else:
+            get_prompt_meter().record(namespace, task.description)
+            chunks = stack.enter_context(closing(stream_provider(owner, task, priority, response_model)))
+
+        try:
+            for text in chunks:
+                parts.append(text)
+                yield {"event": "token", "data": {"text": text}}
+                for name, value in sections.feed(text):
+                    yield {"event": "section", "data": {"name": name, "value": value}}
+        except Exception:
+            if cached is None:
+                breaker.record_failure()
+            raise
+
+    full_text = "".join(parts)
+    if cached is None:
+        breaker.record_success()
+        if use_cache:
+            get_llm_cache().set(key, full_text, ttl, namespace)
+
+    result = finalize(full_text)
+    if degraded and isinstance(result, dict):
+        result = mark_degraded(result, "stale_cache")
+    yield {"event": "result", "data": result}
+
+
+_END = object()
+
+
+def stream_on_executor(frames: Iterator[str]) -> AsyncIterator[str]:
+    """
+    Run a blocking frame generator on the agent executor and relay its frames
+
+    The generator runs ahead of the client, with its frames buffered, so anything it holds
+    while generating (such as an LLM scheduler slot) is released when generation finishes,
+    not when a slow client has read the last frame. Closing the relay (the client
+    disconnected) stops the generator at its next frame. Call this from the request
+    handler so saturation is reported before the response starts.
+
+    Raises:
+        AgentExecutorSaturated: If the executor queue is full
+    """
+    loop = asyncio.get_running_loop()
+    buffered: "asyncio.Queue" = asyncio.Queue()
+    stop = threading.Event()
+
+    def put(item: Any):
+        try:
+            loop.call_soon_threadsafe(buffered.put_nowait, item)
+        except RuntimeError:
+            # The event loop is gone; nobody is reading any more
+            stop.set()
+
+    def produce():
+        try:
+            for frame in frames:
+                if stop.is_set():
+                    break
+                put(frame)
+        finally:
+            frames.close()
+            put(_END)
+
+    future = get_agent_executor().submit(produce)
+    return _relay(buffered, future, stop)
+
+
+async def _relay(buffered: "asyncio.Queue", future: Future, stop: threading.Event) -> AsyncIterator[str]:
+    try:
+        while True:
+            frame = await buffered.get()
+            if frame is _END:
+                break
+            yield frame
+        # Surface an error the generator raised instead of yielding
+        await asyncio.wrap_future(future)
+    finally:
+        stop.set()
+
+
+def format_sse(event: str, data: Any) -> str:
+    """Format a Server-Sent Events frame"""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
@@ -0,0 +1,190 @@
+import os
+import threading
+from typing import Any, Dict, Optional
+
+# Tiers from cheapest to strongest; escalation moves one step right
+MODEL_TIERS = ("light", "standard", "strong")
+
+# Models per provider family and tier (env LLM_MODEL_<FAMILY>_<TIER> overrides)
+DEFAULT_MODELS = {
+    "gemini": {"light": "gemini-1.5-flash-8b", "standard": "gemini-1.5-flash", "strong": "gemini-1.5-pro"},
+    "openai": {"light": "gpt-4o-mini", "standard": "gpt-4", "strong": "gpt-4"}
+}
+
+# Tier per task (env LLM_ROUTE_<TASK> overrides); "auto" picks by prompt size, unknown tasks
+# use "standard"
+DEFAULT_ROUTES = {
+    "extract_job_requirements": "light",
+    "evaluate_answer": "auto",
+    "generate_adaptive_question": "auto",
+    "generate_round_feedback": "auto",
+    "evaluate_answers_batch": "standard",
+    "generate_interview_questions": "standard",
+    "analyze_cv_gaps": "standard",
+    "generate_recommendations": "standard",
+    "analyze_job_fit": "standard",
+    "generate_practice_plan": "standard",
+    # Crew agents (ResumeAnalyzerAgent, InterviewEvaluatorAgent, ScoringAgent) run through
+    # crewai's executor, not execute_agent_task, so they are not routed per call: their rule
+    # only picks the one model they bind at construction (default_model), with no auto tier,
+    # escalation or router.record. Their calls do not appear in get_stats.
+    "resume_analysis": "standard",
+    "interview_evaluation": "standard",
+    "final_scoring": "standard"
+}
+
+
+def model_family(model: str) -> Optional[str]:
+    """Provider family of a model name, or None if the router has no tiers for it"""
+    name = model.split("/")[-1]
+    if name.startswith("gemini"):
+        return "gemini"
+    if name.startswith("gpt"):
+        return "openai"
+    return None
+
+
+class _RoutedLLM:
+    """An agent's LLM settings with the model replaced"""
+
+    def __init__(self, llm: Any, model: str):
+        self._llm = llm
+        self.model = model
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._llm, name)
+
+
+class _RoutedOwner:
+    """An agent wrapper whose calls go to a routed model"""
+
+    def __init__(self, owner: Any, model: str):
+        self._owner = owner
+        self.llm = _RoutedLLM(owner.llm, model)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._owner, name)
+
+
+class ModelRouter:
+    """
+    Picks the model tier for each agent task
+
+    A task's tier comes from its configured rule; ``auto`` rules send prompts up to
+    ``light_max_tokens`` to the light tier and larger ones to the standard tier. Callers
+    escalate one tier when the output fails validation or only validates after invalid
+    fields were dropped (and, when ``strict``, when it had to be extracted from prose).
+
+    Only calls made through execute_agent_task or stream_agent_events with a ``route`` are
+    routed; the crewai-based crew agents take a fixed model from default_model instead.
+    """
+
+    def __init__(self, enabled: bool = True, light_max_tokens: int = 1500, max_escalations: int = 1,
+                 strict: bool = False):
+        self.enabled = enabled
+        self.light_max_tokens = light_max_tokens
+        self.max_escalations = max_escalations
+        self.strict = strict
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+    @staticmethod
+    def rule(task_name: str) -> str:
+        """Configured tier (or ``auto``) for a task"""
+        rule = os.getenv(f"LLM_ROUTE_{task_name.upper()}", DEFAULT_ROUTES.get(task_name, "standard")).lower()
+        return rule if rule == "auto" or rule in MODEL_TIERS else "standard"
+
+    @staticmethod
+    def model_for(family: str, tier: str) -> str:
+        """Model serving a tier for a provider family"""
+        return os.getenv(f"LLM_MODEL_{family.upper()}_{tier.upper()}", DEFAULT_MODELS[family][tier])
+
+    def select(self, task_name: str, prompt_tokens: int) -> str:
+        """Tier for a task with a prompt of ``prompt_tokens``"""
+        rule = self.rule(task_name)
+        if rule != "auto":
+            return rule
+        return "light" if prompt_tokens <= self.light_max_tokens else "standard"
+
+    def default_model(self, task_name: str, family: str) -> str:
+        """
+        Model for agents that bind one model at construction (``auto`` means standard)
+
+        These are the crew agents, which call their model through crewai; the router never
+        sees those calls, so they are neither escalated nor recorded.
+        """
+        rule = self.rule(task_name) if self.enabled else "standard"
+        return self.model_for(family, "standard" if rule == "auto" else rule)
+
+    def accepts(self, parse_outcome: str) -> bool:
+        """Whether a structured-output parse outcome is confident enough to keep (repaired and
+        failed outputs never are)"""
+        return parse_outcome == "native" or (parse_outcome == "tolerant" and not self.strict)
+
+    @staticmethod
+    def escalation(tier: str) -> Optional[str]:
+        """Next stronger tier, or None at the top"""
+        index = MODEL_TIERS.index(tier)
+        return MODEL_TIERS[index + 1] if index + 1 < len(MODEL_TIERS) else None
+
+    def bind(self, owner: Any, tier: str) -> Any:
+        """
+        The agent wrapper with its model replaced by the tier's model (unchanged if unknown)
+
+        The wrapper only takes effect for callers that send ``owner.llm`` to the LLM provider;
+        an agent wrapper that calls its crewai Agent directly keeps its construction model.
+        """
+        model = str(getattr(owner.llm, "model", None) or getattr(owner.llm, "model_name", ""))
+        family = model_family(model)
+        if family is None:
+            return owner
+        routed = self.model_for(family, tier)
+        return owner if routed == model else _RoutedOwner(owner, routed)
+
+    def record(self, task_name: str, tier: str, model: str, latency_seconds: float,
+               prompt_tokens: int, completion_tokens: int, accepted: bool):
+        """Record one routed call"""
+        with self._lock:
+            stats = self._stats.setdefault(f"{task_name}:{tier}", {
+                "model": model, "calls": 0, "rejected": 0, "total_latency_seconds": 0.0,
+                "prompt_tokens": 0, "completion_tokens": 0
+            })
+            stats["model"] = model
+            stats["calls"] += 1
+            stats["rejected"] += 0 if accepted else 1
+            stats["total_latency_seconds"] += latency_seconds
+            stats["prompt_tokens"] += prompt_tokens
+            stats["completion_tokens"] += completion_tokens
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-route call counts, rejections (escalation triggers), latency and estimated tokens"""
+        with self._lock:
+            return {
+                route: {
+                    **stats,
+                    "total_latency_seconds": round(stats["total_latency_seconds"], 3),
+                    "avg_latency_seconds": stats["total_latency_seconds"] / stats["calls"] if stats["calls"] else 0.0
+                }
+                for route, stats in self._stats.items()
+            }
+
+
+_router: Optional[ModelRouter] = None
+_router_lock = threading.Lock()
+
+
+def get_model_router() -> ModelRouter:
+    """Get or initialize the process-wide model router"""
+    global _router
+
+    if _router is None:
+        with _router_lock:
+            if _router is None:
+                _router = ModelRouter(
+                    enabled=os.getenv("LLM_ROUTER_ENABLED", "true").lower() != "false",
+                    light_max_tokens=int(os.getenv("LLM_ROUTER_LIGHT_MAX_TOKENS", "1500")),
+                    max_escalations=int(os.getenv("LLM_ROUTER_MAX_ESCALATIONS", "1")),
+                    strict=os.getenv("LLM_ROUTER_STRICT", "false").lower() == "true"
+                )
+
+    return _router
@@ -0,0 +1,152 @@
+import json
+import os
+import re
+import threading
+from typing import Any, Dict, List, Optional
+
+from .llm_scheduler import estimate_tokens
+
+# Default token budgets for the variable-size parts of prompts, overridable with
+# PROMPT_BUDGET_<NAME> (e.g. PROMPT_BUDGET_CV_TEXT=4000)
+DEFAULT_BUDGETS = {
+    "cv_text": 6000,
+    "cv_excerpts": 1500,
+    "job_description": 3000,
+    "answer": 800,
+    "interview_data": 6000,
+    "context": 2000
+}
+
+# Question fields that matter to an evaluator; ids, hints and rationale are dropped
+QUESTION_FIELDS = ("id", "question", "type", "focus_area", "difficulty", "evaluation_criteria")
+
+# Evaluation fields kept when an evaluation is passed on as context
+EVALUATION_FIELDS = (
+    "score", "technical_accuracy", "clarity_of_explanation", "depth_of_knowledge",
+    "practical_application", "strengths", "weaknesses", "missing_points"
+)
+
+_SPACES = re.compile(r"[ \t\f\v]+")
+_BLANK_LINES = re.compile(r"\n\s*\n+")
+
+
+def token_budget(name: str) -> int:
+    """Token budget for a prompt section"""
+    return int(os.getenv(f"PROMPT_BUDGET_{name.upper()}", str(DEFAULT_BUDGETS[name])))
+
+
+def normalize_whitespace(text: str) -> str:
+    """Collapse runs of spaces and blank lines"""
+    lines = (_SPACES.sub(" ", line).strip() for line in (text or "").splitlines())
+    return _BLANK_LINES.sub("\n\n", "\n".join(lines)).strip()
+
+
+def truncate_to_budget(text: str, max_tokens: int) -> str:
+    """
+    Normalize whitespace and cut text to roughly ``max_tokens``
+
+    The head and the tail are kept (two thirds / one third) since CVs, job descriptions
+    and answers tend to put their summary and their conclusion at the ends.
+    """
+    text = normalize_whitespace(text)
+    if estimate_tokens(text) <= max_tokens:
+        return text
+
+    max_chars = max(max_tokens, 1) * 4
+    head = text[:max_chars * 2 // 3]
+    tail = text[-(max_chars // 3):] if max_chars >= 3 else ""
+    omitted = len(text) - len(head) - len(tail)
+    return f"{head}\n[... {omitted} characters omitted ...]\n{tail}"
+
+
+def _prune(value: Any) -> Any:
+    if isinstance(value, dict):
+        pruned = {key: _prune(item) for key, item in value.items()}
+        return {key: item for key, item in pruned.items() if item not in (None, "", [], {})}
+    if isinstance(value, list):
+        return [item for item in (_prune(item) for item in value) if item not in (None, "", [], {})]
+    if isinstance(value, str):
+        return normalize_whitespace(value)
+    return value
+
+
+def compact_json(data: Any) -> str:
+    """Serialize for a prompt: no indentation, empty values dropped, whitespace collapsed"""
+    return json.dumps(_prune(data), separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def compact_interview_data(interview_data: Dict[str, Any],
+                           max_tokens: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Compact a round for an analysis prompt
+
+    Each question is listed once with the fields an evaluator needs, answers refer to it by
+    ``question_id`` instead of embedding a copy, evaluations keep only their scores and
+    findings, and answers share the budget (capped at the per-answer budget).
+    """
+    max_tokens = max_tokens or token_budget("interview_data")
+    answers = interview_data.get("answers", []) or []
+    answer_budget = min(token_budget("answer"), max(max_tokens // max(len(answers), 1), 50))
+
+    questions: Dict[str, Dict[str, Any]] = {}
+    for question in interview_data.get("questions", []) or []:
+        questions[str(question.get("id"))] = {field: question.get(field) for field in QUESTION_FIELDS}
+
+    compact_answers: List[Dict[str, Any]] = []
+    for answer in answers:
+        question = answer.get("question") or {}
+        question_id = str(answer.get("question_id", question.get("id")))
+        if question_id not in questions and question:
+            questions[question_id] = {field: question.get(field) for field in QUESTION_FIELDS}
+
+        evaluation = answer.get("evaluation") or {}
+        compact_answers.append({
+            "question_id": question_id,
+            "answer": truncate_to_budget(str(answer.get("answer", "")), answer_budget),
+            "evaluation": {field: evaluation.get(field) for field in EVALUATION_FIELDS}
+        })
+
+    return _prune({
+        "round_number": interview_data.get("round_number"),
+        "profession": interview_data.get("profession"),
+        "questions": list(questions.values()),
+        "answers": compact_answers
+    })
+
+
+class PromptSizeMeter:
+    """Per-agent prompt size measurements for calls that reach the model"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    def record(self, namespace: str, prompt: str) -> int:
+        """Record one prompt and return its estimated token count"""
+        tokens = estimate_tokens(prompt)
+        with self._lock:
+            stats = self._stats.setdefault(namespace, {"calls": 0, "total_tokens": 0, "max_tokens": 0})
+            stats["calls"] += 1
+            stats["total_tokens"] += tokens
+            stats["max_tokens"] = max(stats["max_tokens"], tokens)
+        return tokens
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get call counts and average/max prompt tokens per agent"""
+        with self._lock:
+            return {
+                namespace: {
+                    "calls": stats["calls"],
+                    "avg_prompt_tokens": stats["total_tokens"] / stats["calls"],
+                    "max_prompt_tokens": stats["max_tokens"]
+                }
+                for namespace, stats in self._stats.items()
+            }
+
+
+_meter = PromptSizeMeter()
+
+
+def get_prompt_meter() -> PromptSizeMeter:
+    """Get the process-wide prompt size meter"""
+    return _meter
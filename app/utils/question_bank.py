@@ -0,0 +1,352 @@
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from .agent_executor import AgentExecutorSaturated, get_agent_executor, get_background_executor
+from .circuit_breaker import CircuitOpenError
+from .single_flight import SingleFlight
+
+BankKey = Tuple[str, str, str, str]
+
+GENERAL_FOCUS = "general"
+
+# Fills a cold round may run before settling for what is stocked (concurrent rounds can
+# drain a key between its fill and the take)
+COLD_FILL_ATTEMPTS = 2
+
+
+class QuestionBank:
+    """
+    Pre-generated interview questions keyed by (profession, experience_level, difficulty, focus_area)
+
+    Rounds are assembled from stocked questions; the bank is topped up in the background
+    (on the background executor, at background LLM priority) whenever a key drops below
+    the low-water mark, and live generation only happens on a cold miss. If a cold miss hits an open LLM circuit breaker, the round is made up from
+    any questions stocked or recently served for the profession instead.
+    """
+
+    def __init__(self, generator: Callable[..., Dict[str, Any]],
+                 round_size: int = 15, low_water_mark: int = 15,
+                 exclude_window: int = 30):
+        """
+        Args:
+            generator: Callable with the signature of
+                InteractiveInterviewerAgent.generate_interview_questions
+            round_size: Number of questions in an assembled round
+            low_water_mark: Stock level per key below which a background top-up is scheduled
+            exclude_window: How many recent questions per key are passed to the generator
+                so new batches do not repeat them
+        """
+        self.generator = generator
+        self.round_size = round_size
+        self.low_water_mark = low_water_mark
+        self.exclude_window = exclude_window
+
+        self._stock: Dict[BankKey, Deque[Dict[str, Any]]] = {}
+        self._recent: Dict[BankKey, Deque[str]] = {}
+        self._served: Dict[str, Deque[Dict[str, Any]]] = {}
+        self._filling: set = set()
+        self._fills = SingleFlight()
+        self._lock = threading.Lock()
+
+        self._stats = {
+            "rounds_from_bank": 0,
+            "cold_misses": 0,
+            "fills": 0,
+            "failed_fills": 0,
+            "degraded_rounds": 0,
+            "questions_served": 0,
+            "questions_restocked": 0
+        }
+
+    @staticmethod
+    def make_key(profession: str, experience_level: str, difficulty: str,
+                 focus_area: Optional[str]) -> BankKey:
+        """Normalize the bank key"""
+        return (
+            profession.strip().lower(),
+            (experience_level or "").strip().lower(),
+            (difficulty or "mixed").strip().lower(),
+            (focus_area or GENERAL_FOCUS).strip().lower()
+        )
+
+    def assemble_round(self, profession: str, experience_level: str,
+                       focus_areas: Optional[List[str]] = None,
+                       difficulty: str = "mixed", background: bool = False) -> Dict[str, Any]:
+        """
+        Assemble a round, generating live only for keys that are out of stock
+
+        ``background`` rounds (prefetches) generate at background LLM priority.
+
+        Returns:
+            Dict with the same shape as generate_interview_questions plus a ``source``
+            field (``bank``, ``live`` or ``degraded``)
+
+        Raises:
+            CircuitOpenError: The LLM is unavailable and the bank has nothing for the profession
+        """
+        keys = self._keys_for(profession, experience_level, focus_areas, difficulty)
+        quotas = self._quotas(len(keys))
+
+        cold = False
+        round_data = self._take_round(keys, quotas, complete=True)
+        for _ in range(COLD_FILL_ATTEMPTS):
+            if round_data is not None:
+                break
+            cold = True
+            for key, quota in zip(keys, quotas):
+                if self.depth(key) < quota:
+                    try:
+                        self._shared_fill(key, background)
+                    except CircuitOpenError as e:
+                        return self._degraded_round(keys, quotas, e)
+            round_data = self._take_round(keys, quotas, complete=True)
+        if round_data is None:
+            # The generator came up short (or other rounds keep draining the keys)
+            round_data = self._take_round(keys, quotas)
+
+        with self._lock:
+            if cold:
+                self._stats["cold_misses"] += 1
+            else:
+                self._stats["rounds_from_bank"] += 1
+        round_data["source"] = "live" if cold else "bank"
+        return round_data
+
+    async def aassemble_round(self, profession: str, experience_level: str,
+                              focus_areas: Optional[List[str]] = None,
+                              difficulty: str = "mixed") -> Dict[str, Any]:
+        """Assemble a round on the event loop when stocked, otherwise on the agent executor"""
+        keys = self._keys_for(profession, experience_level, focus_areas, difficulty)
+        quotas = self._quotas(len(keys))
+
+        round_data = self._take_round(keys, quotas, complete=True)
+        if round_data is not None:
+            with self._lock:
+                self._stats["rounds_from_bank"] += 1
+            round_data["source"] = "bank"
+            return round_data
+
+        return await get_agent_executor().run(
+            self.assemble_round, profession, experience_level, focus_areas, difficulty
+        )
+
+    def warm(self, profession: str, experience_level: str,
+             focus_areas: Optional[List[str]] = None, difficulty: str = "mixed"):
+        """Schedule background fills for every key a round with these settings would use"""
+        for key in self._keys_for(profession, experience_level, focus_areas, difficulty):
+            self.schedule_top_up(key)
+
+    def schedule_top_up(self, key: BankKey) -> bool:
+        """Fill a key in the background if it is below the low-water mark and not already filling"""
+        with self._lock:
+            if key in self._filling or len(self._stock.get(key, ())) >= self.low_water_mark:
+                return False
+            self._filling.add(key)
+
+        try:
+            get_background_executor().submit(self._background_fill, key)
+        except AgentExecutorSaturated:
+            with self._lock:
+                self._filling.discard(key)
+            return False
+        return True
+
+    def restock(self, round_data: Dict[str, Any]) -> int:
+        """
+        Return the stocked questions of a round that was never served to the front of their keys
+
+        Only the questions the round took from stock are returned (not the recently served
+        ones a degraded round was padded with). Returns the number of questions restocked.
+        """
+        questions = round_data.get("questions", [])
+        restocked = 0
+        with self._lock:
+            offset = 0
+            for key, count in round_data.get("stock_taken", []):
+                stock = self._stock.setdefault(tuple(key), deque())
+                taken = questions[offset:offset + count]
+                offset += count
+                for question in reversed(taken):
+                    stock.appendleft({k: v for k, v in question.items() if k != "id"})
+                restocked += len(taken)
+            self._stats["questions_served"] -= restocked
+            self._stats["questions_restocked"] += restocked
+        return restocked
+
+    def depth(self, key: BankKey) -> int:
+        """Number of stocked questions for a key"""
+        with self._lock:
+            return len(self._stock.get(key, ()))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get bank counters and stock levels"""
+        with self._lock:
+            return {
+                **self._stats,
+                "round_size": self.round_size,
+                "low_water_mark": self.low_water_mark,
+                "keys": len(self._stock),
+                "stocked_questions": sum(len(stock) for stock in self._stock.values()),
+                "filling": len(self._filling)
+            }
+
+    def _keys_for(self, profession: str, experience_level: str,
+                  focus_areas: Optional[List[str]], difficulty: str) -> List[BankKey]:
+        areas = [area for area in (focus_areas or []) if area and area.strip()] or [GENERAL_FOCUS]
+        keys = []
+        for area in areas:
+            key = self.make_key(profession, experience_level, difficulty, area)
+            if key not in keys:
+                keys.append(key)
+        return keys
+
+    def _quotas(self, key_count: int) -> List[int]:
+        base, extra = divmod(self.round_size, key_count)
+        return [base + (1 if i < extra else 0) for i in range(key_count)]
+
+    def _shared_fill(self, key: BankKey, background: bool = False) -> int:
+        """Fill a key, or wait for the fill of it already running and share its outcome"""
+        added, _ = self._fills.do("|".join(key), lambda: self._fill(key, background))
+        return added
+
+    def _background_fill(self, key: BankKey):
+        try:
+            # A cold round may have filled the key while this top-up was queued
+            if self.depth(key) < self.low_water_mark:
+                self._shared_fill(key, background=True)
+        except Exception:
+            with self._lock:
+                self._stats["failed_fills"] += 1
+        finally:
+            with self._lock:
+                self._filling.discard(key)
+
+    def _fill(self, key: BankKey, background: bool = False) -> int:
+        """Generate a batch of questions for a key and add the new ones to stock"""
+        profession, experience_level, difficulty, focus_area = key
+        with self._lock:
+            exclude = list(self._recent.get(key, ()))
+
+        data = self.generator(
+            profession,
+            experience_level,
+            None if focus_area == GENERAL_FOCUS else [focus_area],
+            difficulty,
+            exclude_questions=exclude or None,
+            background=background
+        )
+
+        added = 0
+        with self._lock:
+            stock = self._stock.setdefault(key, deque())
+            recent = self._recent.setdefault(key, deque(maxlen=self.exclude_window))
+            seen = {q.get("question", "").strip().lower() for q in stock}
+            for question in data.get("questions", []) or []:
+                if not isinstance(question, dict) or not question.get("question"):
+                    continue
+                text = question["question"].strip().lower()
+                if text in seen:
+                    continue
+                seen.add(text)
+                stock.append(question)
+                recent.append(question["question"])
+                added += 1
+            self._stats["fills"] += 1
+        return added
+
+    def _degraded_round(self, keys: List[BankKey], quotas: List[int],
+                        error: CircuitOpenError) -> Dict[str, Any]:
+        """Round from whatever the bank has for the profession, ignoring level, difficulty and focus"""
+        profession = keys[0][0]
+        with self._lock:
+            candidates = [key for key in self._stock if key[0] == profession and key not in keys]
+            served = list(self._served.get(profession, ()))
+
+        round_data = self._take_round(keys + candidates, quotas + [self.round_size] * len(candidates),
+                                      limit=self.round_size)
+        questions = round_data["questions"]
+        if len(questions) < self.round_size:
+            seen = {q.get("question", "").strip().lower() for q in questions}
+            for question in reversed(served):
+                text = question.get("question", "").strip().lower()
+                if text not in seen:
+                    seen.add(text)
+                    questions.append(dict(question, id=len(questions) + 1))
+                if len(questions) >= self.round_size:
+                    break
+
+        if not questions:
+            raise error
+
+        with self._lock:
+            self._stats["degraded_rounds"] += 1
+        return {
+            "questions": questions,
+            "interview_structure": self._structure(questions),
+            "source": "degraded",
+            "degraded": True,
+            "stock_taken": round_data["stock_taken"]
+        }
+
+    def _take_round(self, keys: List[BankKey], quotas: List[int], limit: Optional[int] = None,
+                    complete: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Take up to each key's quota from stock
+
+        With ``complete`` nothing is taken (None is returned) unless every key has its full
+        quota; the check and the take happen under one lock, so concurrent rounds cannot
+        both pass the check and leave one of them short.
+        """
+        questions = []
+        taken = []
+        with self._lock:
+            if complete and any(len(self._stock.get(key, ())) < quota for key, quota in zip(keys, quotas)):
+                return None
+            for key, quota in zip(keys, quotas):
+                stock = self._stock.get(key, deque())
+                if limit is not None:
+                    quota = min(quota, limit - len(questions))
+                count = min(quota, len(stock))
+                for _ in range(count):
+                    questions.append(dict(stock.popleft()))
+                if count:
+                    taken.append((key, count))
+            self._stats["questions_served"] += len(questions)
+            served = self._served.setdefault(keys[0][0], deque(maxlen=self.round_size * 4))
+            served.extend(questions)
+
+        for key in keys:
+            self.schedule_top_up(key)
+
+        for number, question in enumerate(questions, start=1):
+            question["id"] = number
+
+        return {
+            "questions": questions,
+            "interview_structure": self._structure(questions),
+            # Which keys the questions came from, in order, so restock() can return them
+            "stock_taken": taken
+        }
+
+    @staticmethod
+    def _structure(questions: List[Dict[str, Any]]) -> Dict[str, Any]:
+        distribution = {"easy": 0, "medium": 0, "hard": 0}
+        for question in questions:
+            level = str(question.get("difficulty", "medium")).lower()
+            if level in distribution:
+                distribution[level] += 1
+
+        duration = 0
+        for question in questions:
+            try:
+                duration += int(question.get("time_limit_minutes", 0) or 0)
+            except (TypeError, ValueError):
+                continue
+
+        return {
+            "total_questions": len(questions),
+            "estimated_duration_minutes": duration,
+            "difficulty_distribution": distribution,
+            "recommended_order": "as listed"
+        }
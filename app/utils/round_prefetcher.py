@@ -0,0 +1,136 @@
+import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .agent_executor import AgentExecutorSaturated, get_background_executor
+
+PrefetchSpec = Tuple[Tuple[str, ...], str]
+
+
+class RoundPrefetcher:
+    """
+    Speculatively assembles a session's next interview round in the background
+
+    After a round completes the next round's focus areas are already known (the session's
+    weak topics), so the question set is prepared while the user reads their report. The
+    prepared round is only served when the next start call asks for the same focus areas
+    and difficulty; anything else invalidates it. Prefetches run on the background
+    executor, and a discarded prefetch hands the questions it took back to the bank.
+    """
+
+    def __init__(self, assemble: Callable[..., Dict[str, Any]], max_entries: int = 256,
+                 restock: Optional[Callable[[Dict[str, Any]], Any]] = None):
+        """
+        Args:
+            assemble: Callable with the signature of QuestionBank.assemble_round
+            max_entries: Maximum number of sessions with a pending prefetch
+            restock: Callable with the signature of QuestionBank.restock, given the
+                rounds that were assembled but never served
+        """
+        self.assemble = assemble
+        self.max_entries = max_entries
+        self.restock = restock
+
+        self._entries: "OrderedDict[str, Tuple[PrefetchSpec, Future]]" = OrderedDict()
+        # Reentrant: a finished prefetch discarded under the lock restocks immediately
+        self._lock = threading.RLock()
+
+        self._stats = {
+            "scheduled": 0,
+            "hits": 0,
+            "misses": 0,
+            "invalidated": 0,
+            "failed": 0,
+            "evicted": 0,
+            "restocked": 0
+        }
+
+    @staticmethod
+    def make_spec(focus_areas: Optional[List[str]], difficulty: str) -> PrefetchSpec:
+        """Normalize the settings a prefetched round was assembled for"""
+        areas = tuple(sorted({area.strip().lower() for area in (focus_areas or []) if area and area.strip()}))
+        return areas, (difficulty or "mixed").strip().lower()
+
+    def schedule(self, session_id: str, profession: str, experience_level: str,
+                 focus_areas: Optional[List[str]] = None, difficulty: str = "mixed") -> bool:
+        """Start assembling the next round for a session, replacing any earlier prefetch"""
+        spec = self.make_spec(focus_areas, difficulty)
+
+        try:
+            future = get_background_executor().submit(
+                self.assemble, profession, experience_level, focus_areas or None, difficulty, background=True
+            )
+        except AgentExecutorSaturated:
+            return False
+
+        with self._lock:
+            previous = self._entries.pop(session_id, None)
+            if previous is not None:
+                self._discard(previous[1])
+            self._entries[session_id] = (spec, future)
+            self._stats["scheduled"] += 1
+            while len(self._entries) > self.max_entries:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._discard(evicted)
+                self._stats["evicted"] += 1
+        return True
+
+    def invalidate(self, session_id: str):
+        """Drop a session's prefetched round"""
+        with self._lock:
+            entry = self._entries.pop(session_id, None)
+            if entry is not None:
+                self._discard(entry[1])
+                self._stats["invalidated"] += 1
+
+    async def atake(self, session_id: str, focus_areas: Optional[List[str]] = None,
+                    difficulty: str = "mixed") -> Optional[Dict[str, Any]]:
+        """
+        Claim a session's prefetched round if it matches the requested settings
+
+        Waits for a prefetch that is still running. Returns None on a miss, a mismatch
+        or a failed prefetch, so the caller falls back to assembling the round itself.
+        """
+        with self._lock:
+            entry = self._entries.pop(session_id, None)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            spec, future = entry
+            if spec != self.make_spec(focus_areas, difficulty):
+                self._discard(future)
+                self._stats["invalidated"] += 1
+                return None
+
+        try:
+            round_data = await asyncio.wrap_future(future)
+        except Exception:
+            with self._lock:
+                self._stats["failed"] += 1
+            return None
+
+        with self._lock:
+            self._stats["hits"] += 1
+        return {**round_data, "source": "prefetched"}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get prefetch counters"""
+        with self._lock:
+            return {
+                **self._stats,
+                "pending": len(self._entries)
+            }
+
+    def _discard(self, future: Future):
+        """Cancel a prefetch, or return its round to the bank once it finishes"""
+        if not future.cancel():
+            future.add_done_callback(self._return_stock)
+
+    def _return_stock(self, future: Future):
+        if self.restock is None or future.cancelled() or future.exception() is not None:
+            return
+        self.restock(future.result())
+        with self._lock:
+            self._stats["restocked"] += 1
@@ -0,0 +1,169 @@
+import threading
+from typing import Any, Dict, List, Optional
+
+# Evaluation field (0-10) behind each category score (0-100)
+CATEGORY_FIELDS = {
+    "technical_knowledge": "technical_accuracy",
+    "communication": "clarity_of_explanation",
+    "depth_of_understanding": "depth_of_knowledge",
+    "practical_application": "practical_application"
+}
+
+PROBLEM_SOLVING_TYPES = ("problem_solving", "situational")
+
+# Topics averaging below this answer score (0-10) are reported as weak
+WEAK_TOPIC_THRESHOLD = 7.0
+
+
+def _number(value: Any) -> Optional[float]:
+    try:
+        return min(max(float(value), 0.0), 10.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def _mean(values: List[float]) -> float:
+    return sum(values) / len(values) if values else 0.0
+
+
+def performance_level(score: float) -> str:
+    """Map a 0-100 score to the performance levels used by the performance analyzer"""
+    if score >= 85:
+        return "excellent"
+    if score >= 70:
+        return "good"
+    if score >= 55:
+        return "average"
+    if score >= 40:
+        return "below_average"
+    return "poor"
+
+
+def _topic_level(average: float) -> str:
+    if average >= 8:
+        return "advanced"
+    if average >= 6:
+        return "intermediate"
+    if average >= 3:
+        return "beginner"
+    return "none"
+
+
+def _topic_priority(average: float) -> str:
+    if average < 4:
+        return "critical"
+    if average < 5.5:
+        return "high"
+    if average < 6.5:
+        return "medium"
+    return "low"
+
+
+class RoundScoreAggregator:
+    """
+    Incremental, deterministic scoring of an interview round from per-answer evaluations
+
+    Updated on every evaluated answer with the numeric fields evaluate_answer returns, so
+    the round's overall score, category scores and weak topics are available the moment
+    the round completes without another LLM call. Re-answering a question replaces its
+    earlier evaluation.
+    """
+
+    def __init__(self, total_questions: int):
+        self.total_questions = total_questions
+        self._answers: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, question_id: str, question: Dict[str, Any], evaluation: Dict[str, Any]):
+        """Record (or replace) the evaluation for one question"""
+        if not isinstance(evaluation, dict):
+            return
+
+        fields = {name: _number(evaluation.get(name)) for name in CATEGORY_FIELDS.values()}
+        entry = {
+            "score": _number(evaluation.get("score")),
+            "fields": fields,
+            "topic": str(question.get("focus_area") or question.get("type") or "general").strip() or "general",
+            "type": str(question.get("type", "")).lower(),
+            "suggestions": [
+                str(item) for item in
+                (evaluation.get("improvement_suggestions") or []) + (evaluation.get("missing_points") or [])
+                if item
+            ]
+        }
+        with self._lock:
+            self._answers[str(question_id)] = entry
+
+    def add_round(self, interview_round: Any):
+        """Record every evaluated answer of a round (idempotent)"""
+        for answer in interview_round.answers:
+            if answer.get("evaluation") is not None:
+                self.add(answer.get("question_id"), answer.get("question") or {}, answer["evaluation"])
+
+    @property
+    def answered(self) -> int:
+        with self._lock:
+            return len(self._answers)
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Current round scores in the shape of the performance analysis
+
+        The overall score spreads answer scores over every question in the round, so
+        unanswered questions count as zero.
+        """
+        with self._lock:
+            answers = list(self._answers.values())
+
+        scores = [a["score"] for a in answers if a["score"] is not None]
+        question_count = max(self.total_questions, len(answers), 1)
+        overall = round(sum(scores) / question_count * 10, 1)
+
+        category_scores = {}
+        for category, field in CATEGORY_FIELDS.items():
+            values = [a["fields"][field] for a in answers if a["fields"][field] is not None]
+            category_scores[category] = round(_mean(values) * 10, 1)
+
+        problem_solving = [a["score"] for a in answers
+                           if a["type"] in PROBLEM_SOLVING_TYPES and a["score"] is not None]
+        category_scores["problem_solving"] = round(_mean(problem_solving or scores) * 10, 1)
+
+        question_types: Dict[str, List[float]] = {}
+        topics: Dict[str, Dict[str, Any]] = {}
+        for answer in answers:
+            if answer["score"] is None:
+                continue
+            if answer["type"]:
+                question_types.setdefault(answer["type"], []).append(answer["score"])
+            topic = topics.setdefault(answer["topic"].lower(), {"name": answer["topic"], "scores": [], "suggestions": []})
+            topic["scores"].append(answer["score"])
+            topic["suggestions"].extend(answer["suggestions"])
+
+        weak_topics = []
+        for topic in topics.values():
+            average = _mean(topic["scores"])
+            if average >= WEAK_TOPIC_THRESHOLD:
+                continue
+            weak_topics.append({
+                "topic": topic["name"],
+                "current_level": _topic_level(average),
+                "required_level": "advanced",
+                "priority": _topic_priority(average),
+                "average_score": round(average, 1),
+                "practice_recommendations": list(dict.fromkeys(topic["suggestions"]))[:3]
+            })
+        weak_topics.sort(key=lambda topic: topic["average_score"])
+
+        return {
+            "overall_score": overall,
+            "performance_level": performance_level(overall),
+            "category_scores": category_scores,
+            "question_type_analysis": {
+                name: {"score": round(_mean(values) * 10, 1), "answered": len(values)}
+                for name, values in question_types.items()
+            },
+            "weak_topics": weak_topics,
+            "answered_questions": len(answers),
+            "total_questions": self.total_questions,
+            "scoring": "deterministic"
+        }
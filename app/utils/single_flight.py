@@ -0,0 +1,98 @@
+import os
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class _Flight:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Collapses concurrent identical calls into one execution
+
+    The first caller for a key runs the function; callers arriving with the same key while
+    it is in flight wait for it and share its result (or exception). Nothing is kept once
+    the call finishes, so this is independent of the response cache.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._flights: Dict[str, _Flight] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def do(self, key: str, fn: Callable[[], Any], namespace: str = "default") -> Tuple[Any, bool]:
+        """
+        Run ``fn`` once per in-flight ``key``
+
+        Returns:
+            (result, shared): ``shared`` is True for callers that waited on another caller's execution
+        """
+        if not self.enabled:
+            return fn(), False
+
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            self._count(namespace, "executions" if leader else "coalesced")
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result, True
+
+        try:
+            flight.result = fn()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.result, False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Executions and collapsed calls per namespace"""
+        with self._lock:
+            namespaces = {name: dict(counts) for name, counts in self._stats.items()}
+            in_flight = len(self._flights)
+
+        return {
+            "enabled": self.enabled,
+            "in_flight": in_flight,
+            "executions": sum(c.get("executions", 0) for c in namespaces.values()),
+            "coalesced": sum(c.get("coalesced", 0) for c in namespaces.values()),
+            "namespaces": namespaces
+        }
+
+    def _count(self, namespace: str, counter: str):
+        counts = self._stats.setdefault(namespace, {})
+        counts[counter] = counts.get(counter, 0) + 1
+
+
+_single_flight: Optional[SingleFlight] = None
+_single_flight_lock = threading.Lock()
+
+
+def get_single_flight() -> SingleFlight:
+    """Get or initialize the process-wide single-flight group for LLM calls"""
+    global _single_flight
+
+    if _single_flight is None:
+        with _single_flight_lock:
+            if _single_flight is None:
+                _single_flight = SingleFlight(
+                    enabled=os.getenv("LLM_SINGLE_FLIGHT_ENABLED", "true").lower() != "false"
+                )
+
+    return _single_flight
@@ -0,0 +1,213 @@
+import re
+import threading
+from bisect import bisect_right
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .llm_scheduler import estimate_tokens
+from .skill_taxonomy import CERTIFICATIONS, SKILLS
+
+# "5 years", "3+ yrs", "10 years of experience"
+_YEARS = re.compile(r"(\d{1,2})\s*\+?\s*(?:years?|yrs?)\b", re.IGNORECASE)
+# "2018 - 2022", "Jan 2019 – Present"
+_DATE_RANGE = re.compile(
+    r"((?:19|20)\d{2})\s*(?:-|–|—|to)\s*(?:\w+\.?\s+)?((?:19|20)\d{2}|present|current|now)",
+    re.IGNORECASE
+)
+_EXPERIENCE_LINE = re.compile(r"\b(experience|engineer|developer|analyst|manager|lead|intern|"
+                              r"scientist|architect|consultant|designer)\b", re.IGNORECASE)
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+class AhoCorasick:
+    """Multi-pattern matcher: finds every occurrence of any pattern in one pass over the text"""
+
+    def __init__(self, patterns: Dict[str, Any]):
+        """
+        Args:
+            patterns: Lowercase pattern text mapped to the value reported for its matches
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[int, Any]]] = [[]]
+
+        for pattern, value in patterns.items():
+            node = 0
+            for char in pattern:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                node = next_node
+            self._output[node].append((len(pattern), value))
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0) if node else 0
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, int, Any]]:
+        """Yield (start, end, value) for every match in ``text``"""
+        node = 0
+        for index, char in enumerate(text):
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+            for length, value in self._output[node]:
+                yield index - length + 1, index + 1, value
+
+
+class SkillExtractor:
+    """
+    Local skill, certification and experience tagging for CV text
+
+    Matches the bundled taxonomy's aliases on word boundaries in a single pass and
+    attributes "N years" mentions to the skills on the same line.
+    """
+
+    def __init__(self, skills: Dict[str, Tuple[str, List[str]]] = SKILLS,
+                 certifications: Dict[str, Tuple[str, List[str]]] = CERTIFICATIONS):
+        patterns: Dict[str, Tuple[str, str, str]] = {}
+        # Certifications first so a shared alias (e.g. "aws certified ...") reports the certification
+        for name, (issuer, aliases) in certifications.items():
+            for alias in aliases + [name]:
+                patterns.setdefault(alias.lower(), ("certification", name, issuer))
+        for name, (category, aliases) in skills.items():
+            for alias in aliases + [name]:
+                patterns.setdefault(alias.lower(), ("skill", name, category))
+        self._matcher = AhoCorasick(patterns)
+
+    def extract(self, text: str) -> Dict[str, Any]:
+        """
+        Tag a CV
+
+        Returns:
+            Dict with ``skills`` (name, category, mentions, years), ``certifications``
+            (name, issuer), ``total_years`` of experience and the ``lines`` (indexes) that
+            mention anything tagged
+        """
+        lowered = (text or "").lower()
+        matches = self._word_matches(lowered)
+
+        line_starts = [0] + [index + 1 for index, char in enumerate(lowered) if char == "\n"]
+        line_years = self._years_per_line(lowered.split("\n"))
+
+        skills: Dict[str, Dict[str, Any]] = {}
+        certifications: Dict[str, Dict[str, Any]] = {}
+        lines = set()
+        for start, _, (kind, name, detail) in matches:
+            line = self._line_of(line_starts, start)
+            lines.add(line)
+            if kind == "certification":
+                certifications.setdefault(name, {"name": name, "issuer": detail})
+                continue
+            entry = skills.setdefault(name, {"name": name, "category": detail, "mentions": 0, "years": None})
+            entry["mentions"] += 1
+            years = line_years.get(line)
+            if years is not None and (entry["years"] is None or years > entry["years"]):
+                entry["years"] = years
+
+        return {
+            "skills": sorted(skills.values(), key=lambda entry: (-entry["mentions"], entry["name"])),
+            "certifications": list(certifications.values()),
+            "total_years": self._total_years(text or ""),
+            "lines": sorted(lines)
+        }
+
+    def _word_matches(self, lowered: str) -> List[Tuple[int, int, Any]]:
+        """Longest non-overlapping matches that start and end on word boundaries"""
+        candidates = [
+            (start, end, value) for start, end, value in self._matcher.finditer(lowered)
+            if (start == 0 or not _is_word_char(lowered[start - 1]) or not _is_word_char(lowered[start]))
+            and (end == len(lowered) or not _is_word_char(lowered[end]) or not _is_word_char(lowered[end - 1]))
+        ]
+        candidates.sort(key=lambda match: (match[0], -(match[1] - match[0])))
+        selected, covered_to = [], -1
+        for match in candidates:
+            if match[0] >= covered_to:
+                selected.append(match)
+                covered_to = match[1]
+        return selected
+
+    @staticmethod
+    def _line_of(line_starts: List[int], offset: int) -> int:
+        return bisect_right(line_starts, offset) - 1
+
+    @staticmethod
+    def _years_per_line(lines: List[str]) -> Dict[int, int]:
+        years = {}
+        for index, line in enumerate(lines):
+            found = [int(value) for value in _YEARS.findall(line) if 0 < int(value) <= 50]
+            if found:
+                years[index] = max(found)
+        return years
+
+    @staticmethod
+    def _total_years(text: str) -> Optional[float]:
+        """Longest stated experience, or the span covered by employment date ranges"""
+        stated = [int(value) for value in _YEARS.findall(text) if 0 < int(value) <= 50]
+        current_year = datetime.now().year
+        starts, ends = [], []
+        for start, end in _DATE_RANGE.findall(text):
+            start_year = int(start)
+            end_year = current_year if not end[:1].isdigit() else int(end)
+            if start_year <= end_year <= current_year:
+                starts.append(start_year)
+                ends.append(end_year)
+        span = max(ends) - min(starts) if starts else 0
+        total = max(stated + [span])
+        return float(total) if total else None
+
+
+def relevant_excerpts(text: str, tagged_lines: List[int], max_tokens: int, head_lines: int = 5) -> str:
+    """
+    The CV lines worth sending to the model, within a token budget
+
+    Keeps the first ``head_lines`` non-empty lines (name, title, summary), then lines that
+    mention tagged skills or look like role/experience lines, in document order.
+    """
+    lines = (text or "").split("\n")
+    wanted = set(tagged_lines)
+    wanted.update(index for index, line in enumerate(lines) if _EXPERIENCE_LINE.search(line))
+    wanted.update([index for index, line in enumerate(lines) if line.strip()][:head_lines])
+
+    kept, used = [], 0
+    for index in sorted(wanted):
+        line = " ".join(lines[index].split())
+        if not line:
+            continue
+        cost = estimate_tokens(line) + 1
+        if used + cost > max_tokens:
+            break
+        kept.append(line)
+        used += cost
+    return "\n".join(kept)
+
+
+_extractor: Optional[SkillExtractor] = None
+_extractor_lock = threading.Lock()
+
+
+def get_skill_extractor() -> SkillExtractor:
+    """Get or initialize the process-wide skill extractor (the matcher is built once)"""
+    global _extractor
+
+    if _extractor is None:
+        with _extractor_lock:
+            if _extractor is None:
+                _extractor = SkillExtractor()
+
+    return _extractor
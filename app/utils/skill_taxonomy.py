@@ -0,0 +1,145 @@
+"""
+Bundled skill and certification taxonomy for local CV pre-tagging
+
+Each entry maps a canonical name to its category and the aliases it appears under in
+CVs. Aliases are matched case-insensitively on word boundaries.
+"""
+from typing import Dict, List, Tuple
+
+# canonical name -> (category, aliases)
+SKILLS: Dict[str, Tuple[str, List[str]]] = {
+    # Programming languages
+    "Python": ("language", ["python", "python3"]),
+    "Java": ("language", ["java"]),
+    "JavaScript": ("language", ["javascript", "js", "ecmascript"]),
+    "TypeScript": ("language", ["typescript", "ts"]),
+    "C": ("language", ["c language", "ansi c"]),
+    "C++": ("language", ["c++", "cpp"]),
+    "C#": ("language", ["c#", "csharp"]),
+    "Go": ("language", ["golang", "go language"]),
+    "Rust": ("language", ["rust"]),
+    "Ruby": ("language", ["ruby"]),
+    "PHP": ("language", ["php"]),
+    "Kotlin": ("language", ["kotlin"]),
+    "Swift": ("language", ["swift"]),
+    "Scala": ("language", ["scala"]),
+    "R": ("language", ["r language", "rstudio"]),
+    "SQL": ("language", ["sql", "t-sql", "pl/sql"]),
+    "Bash": ("language", ["bash", "shell scripting"]),
+    "MATLAB": ("language", ["matlab"]),
+    # Frameworks and libraries
+    "Django": ("framework", ["django"]),
+    "Flask": ("framework", ["flask"]),
+    "FastAPI": ("framework", ["fastapi"]),
+    "Spring": ("framework", ["spring", "spring boot", "springboot"]),
+    "Node.js": ("framework", ["node.js", "nodejs", "node"]),
+    "Express": ("framework", ["express.js", "expressjs"]),
+    "React": ("framework", ["react", "react.js", "reactjs"]),
+    "Angular": ("framework", ["angular", "angularjs"]),
+    "Vue": ("framework", ["vue", "vue.js", "vuejs"]),
+    "Next.js": ("framework", ["next.js", "nextjs"]),
+    ".NET": ("framework", [".net", "dotnet", "asp.net"]),
+    "Ruby on Rails": ("framework", ["rails", "ruby on rails"]),
+    "pandas": ("framework", ["pandas"]),
+    "NumPy": ("framework", ["numpy"]),
+    "scikit-learn": ("framework", ["scikit-learn", "sklearn"]),
+    "TensorFlow": ("framework", ["tensorflow"]),
+    "PyTorch": ("framework", ["pytorch", "torch"]),
+    "Keras": ("framework", ["keras"]),
+    "Spark": ("framework", ["spark", "pyspark", "apache spark"]),
+    "Hadoop": ("framework", ["hadoop"]),
+    "Airflow": ("framework", ["airflow", "apache airflow"]),
+    "dbt": ("framework", ["dbt"]),
+    "GraphQL": ("framework", ["graphql"]),
+    "REST APIs": ("framework", ["rest", "restful", "rest api", "rest apis"]),
+    "gRPC": ("framework", ["grpc"]),
+    # Data stores and messaging
+    "PostgreSQL": ("database", ["postgresql", "postgres"]),
+    "MySQL": ("database", ["mysql", "mariadb"]),
+    "SQL Server": ("database", ["sql server", "mssql"]),
+    "Oracle Database": ("database", ["oracle database", "oracle db"]),
+    "MongoDB": ("database", ["mongodb", "mongo"]),
+    "Redis": ("database", ["redis"]),
+    "Elasticsearch": ("database", ["elasticsearch", "elastic search", "opensearch"]),
+    "Cassandra": ("database", ["cassandra"]),
+    "DynamoDB": ("database", ["dynamodb"]),
+    "Snowflake": ("database", ["snowflake"]),
+    "BigQuery": ("database", ["bigquery"]),
+    "Kafka": ("database", ["kafka", "apache kafka"]),
+    "RabbitMQ": ("database", ["rabbitmq"]),
+    # Cloud and infrastructure
+    "AWS": ("cloud", ["aws", "amazon web services", "ec2", "s3", "lambda"]),
+    "Azure": ("cloud", ["azure", "microsoft azure"]),
+    "GCP": ("cloud", ["gcp", "google cloud", "google cloud platform"]),
+    "Docker": ("devops", ["docker", "containers", "containerization"]),
+    "Kubernetes": ("devops", ["kubernetes", "k8s", "eks", "gke", "aks"]),
+    "Terraform": ("devops", ["terraform"]),
+    "Ansible": ("devops", ["ansible"]),
+    "CI/CD": ("devops", ["ci/cd", "continuous integration", "continuous delivery", "continuous deployment"]),
+    "Jenkins": ("devops", ["jenkins"]),
+    "GitHub Actions": ("devops", ["github actions"]),
+    "GitLab CI": ("devops", ["gitlab ci", "gitlab-ci"]),
+    "Git": ("devops", ["git", "github", "gitlab", "bitbucket"]),
+    "Linux": ("devops", ["linux", "unix", "ubuntu", "centos"]),
+    "Prometheus": ("devops", ["prometheus"]),
+    "Grafana": ("devops", ["grafana"]),
+    "Observability": ("devops", ["observability", "monitoring", "opentelemetry"]),
+    # Practices and domains
+    "Microservices": ("practice", ["microservices", "microservice", "service-oriented architecture"]),
+    "Distributed Systems": ("practice", ["distributed systems", "distributed computing"]),
+    "System Design": ("practice", ["system design", "software architecture", "architecture design"]),
+    "Unit Testing": ("practice", ["unit testing", "unit tests", "pytest", "junit", "tdd",
+                                  "test-driven development"]),
+    "Agile": ("practice", ["agile", "scrum", "kanban"]),
+    "Machine Learning": ("domain", ["machine learning", "ml"]),
+    "Deep Learning": ("domain", ["deep learning", "neural networks"]),
+    "NLP": ("domain", ["nlp", "natural language processing"]),
+    "Computer Vision": ("domain", ["computer vision"]),
+    "Data Analysis": ("domain", ["data analysis", "data analytics", "analytics"]),
+    "Data Engineering": ("domain", ["data engineering", "etl", "data pipelines"]),
+    "Statistics": ("domain", ["statistics", "statistical modeling", "a/b testing"]),
+    "Data Visualization": ("domain", ["data visualization", "tableau", "power bi", "looker"]),
+    "Security": ("domain", ["security", "cybersecurity", "owasp", "penetration testing"]),
+    "Networking": ("domain", ["networking", "tcp/ip", "dns"]),
+    "Mobile Development": ("domain", ["mobile development", "android", "ios"]),
+    "Product Management": ("domain", ["product management", "product roadmap", "roadmapping"]),
+    "UX Design": ("domain", ["ux", "user experience", "ui/ux", "figma", "user research"]),
+    "Project Management": ("domain", ["project management", "jira", "stakeholder management"]),
+    # Soft skills
+    "Leadership": ("soft", ["leadership", "led a team", "team lead", "tech lead"]),
+    "Mentoring": ("soft", ["mentoring", "mentored", "coaching"]),
+    "Communication": ("soft", ["communication", "presentations", "public speaking"]),
+    "Collaboration": ("soft", ["collaboration", "cross-functional", "teamwork"]),
+    "Problem Solving": ("soft", ["problem solving", "problem-solving", "troubleshooting"]),
+}
+
+# canonical name -> (issuer, aliases)
+CERTIFICATIONS: Dict[str, Tuple[str, List[str]]] = {
+    "AWS Certified Solutions Architect": ("Amazon", ["aws certified solutions architect",
+                                                     "aws solutions architect"]),
+    "AWS Certified Developer": ("Amazon", ["aws certified developer"]),
+    "AWS Certified Cloud Practitioner": ("Amazon", ["aws certified cloud practitioner", "aws cloud practitioner"]),
+    "Azure Fundamentals (AZ-900)": ("Microsoft", ["az-900", "azure fundamentals"]),
+    "Azure Administrator (AZ-104)": ("Microsoft", ["az-104", "azure administrator"]),
+    "Azure Solutions Architect (AZ-305)": ("Microsoft", ["az-305", "azure solutions architect"]),
+    "Google Professional Cloud Architect": ("Google", ["professional cloud architect"]),
+    "Google Professional Data Engineer": ("Google", ["professional data engineer"]),
+    "Certified Kubernetes Administrator": ("CNCF", ["certified kubernetes administrator", "cka"]),
+    "Certified Kubernetes Application Developer": ("CNCF", ["certified kubernetes application developer",
+                                                           "ckad"]),
+    "HashiCorp Terraform Associate": ("HashiCorp", ["terraform associate"]),
+    "PMP": ("PMI", ["pmp", "project management professional"]),
+    "PRINCE2": ("Axelos", ["prince2"]),
+    "Certified ScrumMaster": ("Scrum Alliance", ["certified scrummaster", "csm"]),
+    "Professional Scrum Master": ("Scrum.org", ["professional scrum master", "psm i", "psm"]),
+    "CISSP": ("ISC2", ["cissp"]),
+    "CompTIA Security+": ("CompTIA", ["security+", "comptia security+"]),
+    "CEH": ("EC-Council", ["ceh", "certified ethical hacker"]),
+    "CCNA": ("Cisco", ["ccna"]),
+    "Oracle Certified Professional Java": ("Oracle", ["oracle certified professional", "ocp java"]),
+    "TensorFlow Developer Certificate": ("Google", ["tensorflow developer certificate"]),
+    "Databricks Certified Data Engineer": ("Databricks", ["databricks certified"]),
+    "ITIL Foundation": ("Axelos", ["itil"]),
+    "Six Sigma": ("ASQ", ["six sigma", "lean six sigma"]),
+    "CFA": ("CFA Institute", ["cfa", "chartered financial analyst"]),
+}
@@ -0,0 +1,214 @@
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+_DONE = object()
+
+# How often a thread blocked on a pipeline queue checks whether the consumer has gone
+_POLL_SECONDS = 0.1
+
+
+class Stage:
+    """One step of a StagePipeline: a function applied by its own worker pool"""
+
+    def __init__(self, name: str, fn: Callable[[Any], Any], workers: int = 1, queue_size: Optional[int] = None):
+        """
+        Args:
+            name: Stage name used in stats and thread names
+            fn: Takes the previous stage's output (the input item for the first stage)
+            workers: Threads running this stage
+            queue_size: Items allowed to wait in front of this stage (default 2 x workers)
+        """
+        self.name = name
+        self.fn = fn
+        self.workers = max(1, workers)
+        self.queue_size = queue_size or 2 * self.workers
+
+
+class _Envelope:
+    __slots__ = ("item", "payload", "error", "enqueued_at")
+
+    def __init__(self, item: Any):
+        self.item = item
+        self.payload = item
+        self.error: Optional[BaseException] = None
+        self.enqueued_at = time.perf_counter()
+
+
+class StagePipeline:
+    """
+    Runs items through dependent stages with a worker pool per stage
+
+    Stages are connected by bounded queues, so while one item is in a later stage the
+    next items are already in earlier ones, and a slow stage applies back-pressure
+    instead of letting work pile up. With stages sized to their latency a batch takes
+    roughly as long as its slowest stage rather than the sum of all of them. An item
+    whose stage raises skips the remaining stages and is reported with the error.
+    """
+
+    def __init__(self, stages: List[Stage], max_in_flight: Optional[int] = None):
+        """
+        Args:
+            stages: Stages in execution order
+            max_in_flight: Items admitted at once across all stages (default: workers + queue slots)
+        """
+        if not stages:
+            raise ValueError("A pipeline needs at least one stage")
+        self.stages = stages
+        self.max_in_flight = max_in_flight or sum(stage.workers + stage.queue_size for stage in stages)
+        self._lock = threading.Lock()
+        self._stats = {stage.name: {"processed": 0, "failed": 0, "busy_seconds": 0.0, "wait_seconds": 0.0}
+                       for stage in stages}
+        self._running_seconds = 0.0
+
+    def run(self, items: Iterable[Any]) -> Iterator[Tuple[Any, Any, Optional[BaseException]]]:
+        """
+        Push items through every stage
+
+        Items are read from ``items`` only as capacity frees up. Closing the iterator
+        early stops admitting items and drops the work still in flight; the pipeline's
+        threads exit once their current stage call returns.
+
+        Yields:
+            (item, final stage output or None, error or None) in completion order
+        """
+        queues = [queue.Queue(maxsize=stage.queue_size) for stage in self.stages]
+        results: "queue.Queue" = queue.Queue()
+        admitted = threading.Semaphore(self.max_in_flight)
+        stop = threading.Event()
+        feed_errors: List[BaseException] = []
+        started_at = time.perf_counter()
+
+        threads = [threading.Thread(target=self._feed, args=(items, queues[0], admitted, stop, feed_errors),
+                                    name="pipeline-feed", daemon=True)]
+        for index, stage in enumerate(self.stages):
+            outbox = queues[index + 1] if index + 1 < len(queues) else results
+            downstream = self.stages[index + 1].workers if index + 1 < len(self.stages) else 1
+            remaining = [stage.workers]
+            for worker in range(stage.workers):
+                threads.append(threading.Thread(
+                    target=self._work, args=(stage, queues[index], outbox, downstream, remaining, stop),
+                    name=f"pipeline-{stage.name}-{worker}", daemon=True
+                ))
+        for thread in threads:
+            thread.start()
+
+        try:
+            while True:
+                envelope = results.get()
+                if envelope is _DONE:
+                    break
+                admitted.release()
+                yield envelope.item, None if envelope.error else envelope.payload, envelope.error
+            if feed_errors:
+                raise feed_errors[0]
+        finally:
+            stop.set()
+            # Unblock the feeder if it is waiting for an admission slot
+            admitted.release()
+            with self._lock:
+                self._running_seconds += time.perf_counter() - started_at
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Per-stage throughput, latency, queue wait and utilization
+
+        ``bottleneck`` is the stage with the highest average latency per worker, the one
+        to give more workers.
+        """
+        with self._lock:
+            running = self._running_seconds
+            stages = {}
+            for stage in self.stages:
+                counts = self._stats[stage.name]
+                done = counts["processed"] + counts["failed"]
+                stages[stage.name] = {
+                    "workers": stage.workers,
+                    "queue_size": stage.queue_size,
+                    "processed": counts["processed"],
+                    "failed": counts["failed"],
+                    "avg_seconds": counts["busy_seconds"] / done if done else 0.0,
+                    "avg_queue_wait_seconds": counts["wait_seconds"] / done if done else 0.0,
+                    "utilization": (counts["busy_seconds"] / (stage.workers * running)) if running else 0.0
+                }
+
+        busiest = max(stages, key=lambda name: stages[name]["avg_seconds"] / stages[name]["workers"])
+        return {
+            "max_in_flight": self.max_in_flight,
+            "running_seconds": running,
+            "bottleneck": busiest if stages[busiest]["avg_seconds"] else None,
+            "stages": stages
+        }
+
+    def _feed(self, items: Iterable[Any], inbox: "queue.Queue", admitted: threading.Semaphore,
+              stop: threading.Event, errors: List[BaseException]):
+        try:
+            for item in items:
+                while not admitted.acquire(timeout=_POLL_SECONDS):
+                    if stop.is_set():
+                        return
+                if stop.is_set() or not _put(inbox, _Envelope(item), stop):
+                    return
+        except Exception as e:
+            # Reading the input failed: finish what was admitted, then re-raise in run()
+            errors.append(e)
+        finally:
+            for _ in range(self.stages[0].workers):
+                _put(inbox, _DONE, stop)
+
+    def _work(self, stage: Stage, inbox: "queue.Queue", outbox: "queue.Queue", downstream: int,
+              remaining: List[int], stop: threading.Event):
+        while True:
+            envelope = _get(inbox, stop)
+            if stop.is_set():
+                # The consumer closed the run: drop the item and leave without closing downstream
+                return
+            if envelope is _DONE:
+                break
+
+            started = time.perf_counter()
+            waited = started - envelope.enqueued_at
+            if envelope.error is None:
+                try:
+                    envelope.payload = stage.fn(envelope.payload)
+                except Exception as e:
+                    envelope.error = e
+                with self._lock:
+                    counts = self._stats[stage.name]
+                    counts["failed" if envelope.error else "processed"] += 1
+                    counts["busy_seconds"] += time.perf_counter() - started
+                    counts["wait_seconds"] += waited
+
+            envelope.enqueued_at = time.perf_counter()
+            if not _put(outbox, envelope, stop):
+                return
+
+        # The last worker of a stage closes the next one
+        with self._lock:
+            remaining[0] -= 1
+            last = remaining[0] == 0
+        if last:
+            for _ in range(downstream):
+                _put(outbox, _DONE, stop)
+
+
+def _put(target: "queue.Queue", item: Any, stop: threading.Event) -> bool:
+    """Put into a bounded queue, giving up (False) once the run is stopped"""
+    while True:
+        try:
+            target.put(item, timeout=_POLL_SECONDS)
+            return True
+        except queue.Full:
+            if stop.is_set():
+                return False
+
+
+def _get(source: "queue.Queue", stop: threading.Event) -> Any:
+    """Take from a queue, giving up (None) once the run is stopped and nothing is waiting"""
+    while True:
+        try:
+            return source.get(timeout=_POLL_SECONDS)
+        except queue.Empty:
+            if stop.is_set():
+                return None
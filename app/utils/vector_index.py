@@ -0,0 +1,261 @@
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .job_ranker import tokenize
+
+logger = logging.getLogger(__name__)
+
+
+class HashingTextEmbedder:
+    """
+    Dependency-free embedder: signed feature hashing of word unigrams and bigrams
+
+    Used when the ONNX model is unavailable. Vectors are L2-normalized so a dot product
+    is the cosine similarity.
+    """
+
+    name = "hashing"
+
+    def __init__(self, dimensions: int = 512):
+        self.dimensions = dimensions
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed texts into a (len(texts), dimensions) float32 matrix"""
+        vectors = np.zeros((len(texts), self.dimensions), dtype=np.float32)
+        for row, text in enumerate(texts):
+            tokens = tokenize(text)
+            for feature in tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]:
+                digest = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+                vectors[row, digest % self.dimensions] += 1.0 if digest >> 63 else -1.0
+        # Sublinear term frequency, then unit length
+        vectors = np.sign(vectors) * np.log1p(np.abs(vectors))
+        return _normalize(vectors)
+
+
+class OnnxTextEmbedder:
+    """
+    Sentence embeddings from the all-MiniLM-L6-v2 ONNX model run with ONNX Runtime
+
+    Uses chromadb's bundled ONNX embedding function, which downloads the model on first use.
+    If that first call fails (offline, sandboxed) the embedder switches to feature hashing
+    for good, so the index never mixes vectors from the two.
+    """
+
+    dimensions = 384
+
+    def __init__(self):
+        from chromadb.utils.embedding_functions import ONNXMiniLM_L6_V2
+
+        self.name = "onnx"
+        self._model = ONNXMiniLM_L6_V2()
+        self._fallback: Optional[HashingTextEmbedder] = None
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed texts into a (len(texts), 384) float32 matrix"""
+        if not texts:
+            return np.zeros((0, self.dimensions), dtype=np.float32)
+        with self._lock:
+            if self._fallback is not None:
+                return self._fallback.embed(texts)
+            try:
+                vectors = self._model(list(texts))
+            except Exception as e:
+                if self._loaded:
+                    raise
+                logger.warning("ONNX embedding model unavailable, using hashing embeddings: %s", e)
+                self._fallback = HashingTextEmbedder(self.dimensions)
+                self.name = HashingTextEmbedder.name
+                return self._fallback.embed(texts)
+            self._loaded = True
+        return _normalize(np.asarray(vectors, dtype=np.float32))
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms > 0, norms, 1.0)
+
+
+class VectorIndex:
+    """
+    In-memory exact nearest-neighbour index over unit vectors
+
+    Vectors live in one contiguous float32 matrix that grows by doubling, so adds are
+    amortized O(1) and a search is a single matrix-vector product plus a partial sort.
+    Adding an existing key replaces its vector in place.
+    """
+
+    def __init__(self, dimensions: int, initial_capacity: int = 1024):
+        self.dimensions = dimensions
+        self._matrix = np.zeros((initial_capacity, dimensions), dtype=np.float32)
+        self._keys: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._metadata: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, key: str, vector: np.ndarray, metadata: Optional[Dict[str, Any]] = None):
+        """Insert or replace the vector stored under ``key``"""
+        vector = np.asarray(vector, dtype=np.float32).reshape(self.dimensions)
+        with self._lock:
+            row = self._rows.get(key)
+            if row is None:
+                row = len(self._keys)
+                if row == len(self._matrix):
+                    grown = np.zeros((max(1, 2 * len(self._matrix)), self.dimensions), dtype=np.float32)
+                    grown[:row] = self._matrix
+                    self._matrix = grown
+                self._keys.append(key)
+                self._rows[key] = row
+            self._matrix[row] = vector
+            self._metadata[key] = dict(metadata or {})
+
+    def remove(self, key: str) -> bool:
+        """Drop ``key``; the last row moves into its slot"""
+        with self._lock:
+            row = self._rows.pop(key, None)
+            if row is None:
+                return False
+            last = len(self._keys) - 1
+            if row != last:
+                moved = self._keys[last]
+                self._matrix[row] = self._matrix[last]
+                self._keys[row] = moved
+                self._rows[moved] = row
+            self._keys.pop()
+            self._metadata.pop(key, None)
+            return True
+
+    def search(self, vector: np.ndarray, top_n: int = 10) -> List[Tuple[str, float, Dict[str, Any]]]:
+        """
+        The ``top_n`` keys most similar to ``vector``
+
+        Returns:
+            (key, cosine similarity, metadata) tuples, best first
+        """
+        query = np.asarray(vector, dtype=np.float32).reshape(self.dimensions)
+        with self._lock:
+            size = len(self._keys)
+            if size == 0 or top_n <= 0:
+                return []
+            scores = self._matrix[:size] @ query
+            top_n = min(top_n, size)
+            best = np.argpartition(-scores, top_n - 1)[:top_n]
+            best = best[np.argsort(-scores[best])]
+            return [(self._keys[row], float(scores[row]), dict(self._metadata[self._keys[row]])) for row in best]
+
+
+class CandidateIndex:
+    """
+    Candidate search: CV embeddings per user, queried with a job description
+
+    Each user has at most one entry (their latest CV analysis). Query embeddings are kept
+    in a small LRU keyed by the normalized job description text so repeated searches for
+    the same posting skip the embedder.
+    """
+
+    def __init__(self, embedder: Any, query_cache_size: int = 256):
+        """
+        Args:
+            embedder: Object with ``name``, ``dimensions`` and ``embed(texts) -> ndarray``
+            query_cache_size: Job description embeddings kept for repeated searches
+        """
+        self.embedder = embedder
+        self.index = VectorIndex(embedder.dimensions)
+        self.query_cache_size = query_cache_size
+        self._queries: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"indexed": 0, "searches": 0, "query_cache_hits": 0, "search_ms_total": 0.0}
+
+    def add(self, user_id: str, text: str, metadata: Optional[Dict[str, Any]] = None):
+        """Embed a candidate profile and store it under ``user_id``"""
+        vector = self.embedder.embed([text])[0]
+        self.index.add(user_id, vector, metadata)
+        with self._lock:
+            self._stats["indexed"] += 1
+
+    def remove(self, user_id: str) -> bool:
+        """Drop a candidate from the index"""
+        return self.index.remove(user_id)
+
+    def search(self, job_description: str, top_n: int = 10) -> List[Dict[str, Any]]:
+        """
+        Candidates ranked by similarity to a job description
+
+        Returns:
+            Dicts with ``user_id``, ``similarity`` and the metadata stored with the CV, best first
+        """
+        started = time.perf_counter()
+        vector = self._query_vector(job_description)
+        matches = self.index.search(vector, top_n)
+        with self._lock:
+            self._stats["searches"] += 1
+            self._stats["search_ms_total"] += (time.perf_counter() - started) * 1000
+        return [{**metadata, "user_id": key, "similarity": round(score, 4)} for key, score, metadata in matches]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Index size, embedder and search latency"""
+        with self._lock:
+            stats = dict(self._stats)
+        searches = stats.pop("search_ms_total")
+        return {
+            **stats,
+            "embedder": self.embedder.name,
+            "dimensions": self.embedder.dimensions,
+            "candidates": len(self.index),
+            "avg_search_ms": round(searches / stats["searches"], 3) if stats["searches"] else 0.0
+        }
+
+    def _query_vector(self, job_description: str) -> np.ndarray:
+        key = " ".join(job_description.split()).casefold()
+        with self._lock:
+            vector = self._queries.get(key)
+            if vector is not None:
+                self._queries.move_to_end(key)
+                self._stats["query_cache_hits"] += 1
+                return vector
+
+        vector = self.embedder.embed([job_description])[0]
+        with self._lock:
+            self._queries[key] = vector
+            while len(self._queries) > self.query_cache_size:
+                self._queries.popitem(last=False)
+        return vector
+
+
+def _load_embedder(backend: str) -> Any:
+    """ONNX embedder when requested and importable, otherwise the hashing embedder"""
+    loaders: Dict[str, Callable[[], Any]] = {
+        "onnx": OnnxTextEmbedder,
+        "hashing": lambda: HashingTextEmbedder(int(os.getenv("EMBEDDINGS_HASHING_DIMENSIONS", "512")))
+    }
+    try:
+        return loaders.get(backend, loaders["onnx"])()
+    except Exception:
+        return loaders["hashing"]()
+
+
+_candidate_index: Optional[CandidateIndex] = None
+_candidate_index_lock = threading.Lock()
+
+
+def get_candidate_index() -> CandidateIndex:
+    """Get or initialize the process-wide candidate index"""
+    global _candidate_index
+
+    if _candidate_index is None:
+        with _candidate_index_lock:
+            if _candidate_index is None:
+                _candidate_index = CandidateIndex(_load_embedder(os.getenv("EMBEDDINGS_BACKEND", "onnx").lower()))
+
+    return _candidate_index
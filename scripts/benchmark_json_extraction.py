@@ -0,0 +1,78 @@
+"""
+Micro-benchmark for the shared JSON extractor
+
+Compares app.utils.json_extraction.extract_json_object with the greedy regex the
+agents used before on large, chatty and truncated model outputs.
+
+Usage:
+    python scripts/benchmark_json_extraction.py [--size-kb 256] [--repeat 20]
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.json_extraction import extract_json_object  # noqa: E402
+
+
+def greedy_regex(text):
+    """The extraction every agent used before"""
+    try:
+        match = re.search(r'\{.*\}', text, re.DOTALL)
+        return json.loads(match.group()) if match else None
+    except json.JSONDecodeError:
+        return None
+
+
+def build_payload(size_kb):
+    """A performance-analysis-shaped object of roughly ``size_kb`` kilobytes"""
+    topic = {
+        "topic": "Distributed systems {consistency}",
+        "current_level": "beginner",
+        "priority": "high",
+        "practice_recommendations": ["Read \"Designing Data-Intensive Applications\"", "Build a KV store"]
+    }
+    count = max(1, size_kb * 1024 // len(json.dumps(topic)))
+    return json.dumps({"overall_score": 64, "weak_topics": [topic] * count}, indent=2)
+
+
+def build_cases(size_kb):
+    payload = build_payload(size_kb)
+    return {
+        "bare object": payload,
+        "fenced with chatty prose": (
+            "Sure! Here is the analysis you asked for:\n```json\n" + payload + "\n```\n"
+            "Let me know if you need the {weak_topics} expanded."
+        ),
+        "truncated": payload[:len(payload) * 9 // 10]
+    }
+
+
+def bench(fn, text, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = fn(text)
+    elapsed = (time.perf_counter() - started) / repeat
+    return elapsed, result is not None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size-kb", type=int, default=256, help="Approximate payload size")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per case")
+    args = parser.parse_args()
+
+    print(f"{'case':<28}{'extractor':<12}{'ms/call':>10}{'MB/s':>10}  parsed")
+    for name, text in build_cases(args.size_kb).items():
+        megabytes = len(text) / 1_000_000
+        for label, fn in (("regex", greedy_regex), ("scanner", extract_json_object)):
+            elapsed, parsed = bench(fn, text, args.repeat)
+            print(f"{name:<28}{label:<12}{elapsed * 1000:>10.2f}{megabytes / elapsed:>10.1f}  {parsed}")
+
+
+if __name__ == "__main__":
+    main()
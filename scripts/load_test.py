@@ -0,0 +1,180 @@
+"""
+Load generator driving complete user journeys against the API
+
+Each virtual user creates a profile, uploads a CV, requests learning recommendations and
+a job fit analysis, starts an interview session and plays through interview rounds
+(start, answers, complete), polling background jobs to completion. Latency is reported
+per endpoint (p50/p95/p99) along with request and journey throughput.
+
+Run the server with the offline provider so no API keys are needed:
+    LLM_PROVIDER=fake LLM_FAKE_LATENCY_MEDIAN_MS=300 uvicorn app.api.main:app
+
+Usage:
+    python scripts/load_test.py [--base-url http://localhost:8000] [--users 20]
+        [--concurrency 10] [--rounds 1] [--answers 5]
+"""
+import argparse
+import asyncio
+import re
+import time
+from collections import defaultdict
+
+import httpx
+
+SAMPLE_CV = """Jane Doe - Software Engineer
+Experience: 4 years building Python web services, REST APIs and PostgreSQL schemas.
+Skills: Python, FastAPI, SQL, Docker, Git, unit testing.
+Education: BSc Computer Science.
+"""
+
+SAMPLE_JOB = """Senior Backend Engineer
+Requirements: 5+ years of Python, distributed systems, SQL, cloud infrastructure (AWS),
+observability and mentoring. Nice to have: Kubernetes, Kafka.
+"""
+
+# Collapse ids in paths so requests group by endpoint
+_ID = re.compile(r"/[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+
+
+class Recorder:
+    """Per-endpoint latencies and failures"""
+
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.failures = defaultdict(int)
+
+    def record(self, name: str, seconds: float, ok: bool):
+        self.latencies[name].append(seconds)
+        if not ok:
+            self.failures[name] += 1
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def call(client, recorder, method, path, expected=(200, 202), **kwargs):
+    """Make one request, recording its latency under the endpoint template"""
+    name = f"{method} {_ID.sub('/{id}', path)}"
+    started = time.perf_counter()
+    try:
+        response = await client.request(method, path, **kwargs)
+    except httpx.HTTPError:
+        recorder.record(name, time.perf_counter() - started, False)
+        raise
+    ok = response.status_code in expected
+    recorder.record(name, time.perf_counter() - started, ok)
+    if not ok:
+        raise RuntimeError(f"{name} returned {response.status_code}: {response.text[:200]}")
+    return response.json()
+
+
+async def wait_for_job(client, recorder, job, poll_interval, timeout=300):
+    """Poll a background job until it finishes; records total job latency as ``job <kind>``"""
+    started = time.perf_counter()
+    while True:
+        data = await call(client, recorder, "GET", job["status_url"])
+        if data["status"] in ("done", "failed"):
+            recorder.record(f"job {data['kind']}", time.perf_counter() - started, data["status"] == "done")
+            if data["status"] == "failed":
+                raise RuntimeError(f"Job {data['kind']} failed: {data.get('error')}")
+            return data["result"]
+        if time.perf_counter() - started > timeout:
+            raise RuntimeError(f"Job {data['kind']} did not finish in {timeout}s")
+        await asyncio.sleep(poll_interval)
+
+
+async def journey(client, recorder, index, args):
+    """One complete user journey"""
+    user = await call(client, recorder, "POST", "/api/users", data={
+        "name": f"Load User {index}",
+        "email": f"load{index}@example.com",
+        "profession": "Software Engineer",
+        "experience_level": "mid"
+    })
+    user_id = user["user_id"]
+
+    job = await call(client, recorder, "POST", f"/api/users/{user_id}/cv/upload",
+                     files={"file": ("cv.txt", SAMPLE_CV.encode(), "text/plain")})
+    analysis = await wait_for_job(client, recorder, job, args.poll_interval)
+
+    job = await call(client, recorder, "POST", f"/api/cv-analysis/{analysis['analysis_id']}/recommendations",
+                     data={"available_time": "10 hours/week"})
+    await wait_for_job(client, recorder, job, args.poll_interval)
+
+    job = await call(client, recorder, "POST", f"/api/users/{user_id}/job-fit/analyze",
+                     data={"job_description": SAMPLE_JOB})
+    await wait_for_job(client, recorder, job, args.poll_interval)
+
+    session = await call(client, recorder, "POST", f"/api/users/{user_id}/interview-session/start",
+                         data={"evaluation_mode": args.evaluation_mode})
+    session_id = session["session_id"]
+
+    for _ in range(args.rounds):
+        round_data = await call(client, recorder, "POST", f"/api/interview-session/{session_id}/round/start")
+        round_id = round_data["round_id"]
+        for question in round_data["questions"][:args.answers]:
+            await call(client, recorder, "POST", f"/api/interview-session/{session_id}/round/{round_id}/answer",
+                       data={"question_id": str(question["id"]),
+                             "answer": "I would start from the requirements, weigh the trade-offs and "
+                                       "validate the design with tests and metrics."})
+
+        completion = await call(client, recorder, "POST",
+                                f"/api/interview-session/{session_id}/round/{round_id}/complete")
+        if "job_id" in completion:
+            await wait_for_job(client, recorder, completion, args.poll_interval)
+        elif completion.get("feedback_job"):
+            await wait_for_job(client, recorder, completion["feedback_job"], args.poll_interval)
+
+
+async def run(args):
+    recorder = Recorder()
+    semaphore = asyncio.Semaphore(args.concurrency)
+    completed = failed = 0
+
+    async def bounded(index):
+        nonlocal completed, failed
+        async with semaphore:
+            try:
+                await journey(client, recorder, index, args)
+                completed += 1
+            except Exception as e:
+                failed += 1
+                print(f"journey {index} failed: {e}")
+
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.request_timeout) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(bounded(index) for index in range(args.users)))
+        elapsed = time.perf_counter() - started
+
+    report(recorder, elapsed, completed, failed)
+
+
+def report(recorder, elapsed, completed, failed):
+    requests = sum(len(values) for name, values in recorder.latencies.items() if not name.startswith("job "))
+    print(f"\n{completed} journeys completed, {failed} failed in {elapsed:.1f}s "
+          f"({completed / elapsed:.2f} journeys/s, {requests / elapsed:.1f} requests/s)\n")
+    print(f"{'endpoint':<72}{'count':>7}{'fail':>6}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+    for name in sorted(recorder.latencies):
+        values = recorder.latencies[name]
+        print(f"{name:<72}{len(values):>7}{recorder.failures[name]:>6}"
+              f"{percentile(values, 0.5) * 1000:>9.0f}{percentile(values, 0.95) * 1000:>9.0f}"
+              f"{percentile(values, 0.99) * 1000:>9.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--users", type=int, default=20, help="Journeys to run")
+    parser.add_argument("--concurrency", type=int, default=10, help="Journeys in flight at once")
+    parser.add_argument("--rounds", type=int, default=1, help="Interview rounds per journey")
+    parser.add_argument("--answers", type=int, default=5, help="Answers submitted per round")
+    parser.add_argument("--evaluation-mode", choices=("immediate", "deferred"), default="immediate")
+    parser.add_argument("--poll-interval", type=float, default=0.5, help="Seconds between job polls")
+    parser.add_argument("--request-timeout", type=float, default=120.0)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()